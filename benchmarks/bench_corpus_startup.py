@@ -0,0 +1,86 @@
+#benchmarks/bench_corpus_startup.py
+"""
+Cold-start time and memory of the aya text backends: SQLite, in-memory
+QuranCorpus, the mmap'ed binary corpus and parsing config/ayahs.json.
+
+Each backend runs in a fresh interpreter, opens its source and reads the
+first and last page, which is what a viewer start-up needs.
+
+    python benchmarks/bench_corpus_startup.py [--runs N]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from bench_utils import REPO_ROOT, print_table, temp_config
+
+BACKENDS = ("sqlite", "memory", "mmap", "json")
+
+CHILD = r"""
+import json, os, sys, time
+sys.path.insert(0, {repo_root!r})
+
+def rss_kib():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+
+import contextlib, io
+from data.datasources.quran_local_datasource import QuranLocalDataSource
+base_rss = rss_kib()
+start = time.perf_counter()
+backend = {backend!r}
+with contextlib.redirect_stdout(io.StringIO()):
+    if backend == "json":
+        with open(os.path.join({repo_root!r}, "config", "ayahs.json"), encoding="utf-8") as f:
+            ayahs = json.load(f)
+        first = [a["text"] for a in ayahs[:7]]
+    else:
+        local = QuranLocalDataSource({config_path!r})
+        source = local.get_text_source()
+        first = source.fetch_page_text(local.get_page_info(1))
+        last = source.fetch_page_text(local.get_page_info(604))
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "rss_kib": rss_kib() - base_rss}}))
+"""
+
+
+def run_child(backend, config_path):
+    code = CHILD.format(repo_root=REPO_ROOT, backend=backend, config_path=config_path)
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = []
+    with temp_config() as base_config:
+        workdir = os.path.dirname(base_config)
+        with open(base_config, encoding="utf-8") as f:
+            config = json.load(f)
+        config["binary_corpus_path"] = os.path.join(workdir, "quran_corpus.bin")
+
+        for backend in BACKENDS:
+            config["text_backend"] = "sqlite" if backend == "json" else backend
+            config_path = os.path.join(workdir, f"config_{backend}.json")
+            with open(config_path, "w", encoding="utf-8") as f:
+                json.dump(config, f)
+            run_child(backend, config_path)  # applies migrations / builds the corpus file once
+            results = [run_child(backend, config_path) for _ in range(args.runs)]
+            best = min(results, key=lambda r: r["ms"])
+            rows.append((backend, f"{best['ms']:.1f}", f"{min(r['rss_kib'] for r in results) / 1024:.2f}"))
+
+        corpus_size = os.path.getsize(config["binary_corpus_path"])
+
+    print_table(f"cold start + first/last page (best of {args.runs} fresh processes)",
+                rows, ("backend", "ms", "RSS growth MiB"))
+    json_size = os.path.getsize(os.path.join(REPO_ROOT, "config", "ayahs.json"))
+    print(f"binary corpus: {corpus_size / 1024:.0f} KiB, ayahs.json: {json_size / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
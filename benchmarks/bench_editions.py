@@ -0,0 +1,63 @@
+#benchmarks/bench_editions.py
+"""
+Compare loading all 604 pages with three extra editions: one batched
+EditionAyas query per page against a query per edition per aya.
+
+    python benchmarks/bench_editions.py [--rounds N]
+"""
+import argparse
+
+from bench_utils import best_of, print_table, temp_config
+
+from data.datasources.quran_local_datasource import QuranLocalDataSource
+
+EDITIONS = ["bench.a", "bench.b", "bench.c"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with temp_config() as config_path:
+        local = QuranLocalDataSource(config_path)
+        ayas = local.db.fetchall("SELECT id, text FROM Ayas ORDER BY id")
+        for edition in EDITIONS:
+            local.store_edition_text(edition, [(number, f"{edition} {text}") for number, text in ayas])
+        pages = local.get_page_list()
+        to_global = local.get_aya_numbering().to_global
+
+        def single():
+            return [local.fetch_page_text(page) for page in pages]
+
+        def batched():
+            return [local.fetch_page_editions(page, EDITIONS) for page in pages]
+
+        def per_aya():
+            result = []
+            for page in pages:
+                rows = []
+                for sura_id, aya_id, text in local.fetch_page_text(page):
+                    number = to_global(sura_id, aya_id)
+                    rows.append((sura_id, aya_id, text, tuple(
+                        local.db.fetchone("SELECT text FROM EditionAyas WHERE edition = ? AND aya_number = ?",
+                                          (edition, number))[0]
+                        for edition in EDITIONS)))
+                result.append(rows)
+            return result
+
+        assert batched() == per_aya(), "strategies disagree"
+        timings = [(name, best_of(fn, args.rounds))
+                   for name, fn in (("source only", single), ("batched", batched), ("per aya", per_aya))]
+        local.close()
+
+    print_table(
+        f"{len(pages)} pages with {len(EDITIONS)} editions (best of {args.rounds})",
+        [(name, f"{seconds * 1000:.1f}", f"{seconds / len(pages) * 1e6:.1f}") for name, seconds in timings],
+        ("strategy", "total ms", "per page us"),
+    )
+    print(f"batched vs per aya: {timings[2][1] / timings[1][1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#benchmarks/bench_page_text.py
+"""
+Compare page text retrieval from SQLite and from the in-memory QuranCorpus
+across all 604 pages.
+
+    python benchmarks/bench_page_text.py [--rounds N]
+"""
+import argparse
+import time
+
+from bench_utils import best_of, print_table, temp_config
+
+from data.datasources.quran_corpus import QuranCorpus
+from data.datasources.quran_local_datasource import QuranLocalDataSource
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with temp_config() as config_path:
+        local = QuranLocalDataSource(config_path)
+        pages = local.get_page_list()
+
+        start = time.perf_counter()
+        corpus = QuranCorpus.from_connection_manager(local.db)
+        load_time = time.perf_counter() - start
+
+        def read_all(source):
+            return [source.fetch_page_text(page) for page in pages]
+
+        assert read_all(local) == read_all(corpus), "backends disagree"
+
+        sqlite_time = best_of(lambda: read_all(local), args.rounds)
+        memory_time = best_of(lambda: read_all(corpus), args.rounds)
+        local.close()
+
+    print_table(
+        f"fetch_page_text over {len(pages)} pages (best of {args.rounds})",
+        [
+            ("sqlite", f"{sqlite_time * 1000:.1f}", f"{sqlite_time / len(pages) * 1e6:.1f}", "-"),
+            ("memory", f"{memory_time * 1000:.1f}", f"{memory_time / len(pages) * 1e6:.1f}",
+             f"{load_time * 1000:.1f}"),
+        ],
+        ("backend", "total ms", "per page us", "load ms"),
+    )
+    print(f"speed-up: {sqlite_time / memory_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
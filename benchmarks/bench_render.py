@@ -0,0 +1,54 @@
+#benchmarks/bench_render.py
+"""
+Time DisplayRenderer.generate_html (a full document per page) and
+generate_page_fragment (what a page turn sends to the loaded shell) and
+measure the HTML they produce for all 604 pages (page text, sura info and
+word offsets are read beforehand).
+
+    python benchmarks/bench_render.py [--rounds N]
+"""
+import argparse
+import contextlib
+import io
+
+from bench_utils import best_of, print_table, temp_config
+
+from data.datasources.quran_local_datasource import QuranLocalDataSource
+from data.repositories.display_renderer import DisplayRenderer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    with temp_config() as config_path:
+        local = QuranLocalDataSource(config_path)
+        with contextlib.redirect_stdout(io.StringIO()):
+            pages = [
+                (page.id, [local.get_sura_info(sura_id) for sura_id in page.sura_id_list],
+                 local.fetch_page_text(page), local.fetch_page_words(page))
+                for page in local.get_page_list()
+            ]
+        local.close()
+
+    renderer = DisplayRenderer()
+
+    densest = max(range(len(pages)), key=lambda i: len(pages[i][2]))
+    rows = []
+    for name, render in (("document", renderer.generate_html), ("fragment", renderer.generate_page_fragment)):
+        sizes = [len(render(*page).encode("utf-8")) for page in pages]
+        total = best_of(lambda: [render(*page) for page in pages], args.rounds)
+        dense = best_of(lambda: render(*pages[densest]), args.rounds * 20)
+        rows.append((f"{name}: all pages", f"{total * 1000:.1f}", f"{total / len(pages) * 1000:.2f}",
+                     f"{sum(sizes) / len(sizes) / 1024:.1f}"))
+        rows.append((f"{name}: page {pages[densest][0]} ({len(pages[densest][2])} ayas)", "-",
+                     f"{dense * 1000:.2f}", f"{sizes[densest] / 1024:.1f}"))
+
+    print_table(f"page HTML over {len(pages)} pages (best of {args.rounds})", rows,
+                ("pages", "total ms", "per page ms", "KiB per page"))
+    print(f"shell document (loaded once per style): {len(renderer.generate_shell().encode('utf-8')) / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#benchmarks/bench_search.py
+"""
+Latency of common Arabic searches over the whole corpus, through
+QuranLocalDataSource.search (index lookup, ranking and snippets), for the
+FTS5 index and the pure-Python trigram index, plus each index's build
+time and size.
+
+    python benchmarks/bench_search.py [--rounds N] [--limit N] [--budget-ms MS]
+
+Exits non-zero when any FTS5 query's best time exceeds the budget.
+"""
+import argparse
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+import time
+
+from bench_utils import best_of, print_table, temp_config
+
+from data.datasources.quran_local_datasource import QuranLocalDataSource
+from data.search.fts_search import FTS_TABLE, build_fts_index
+from data.search.trigram_index import TrigramIndex
+
+QUERIES = [
+    "الله",                 # ~1600 ayas to rank; ranking dominates for frequent words
+    "من",
+    "الرحمن الرحيم",
+    "العالمين",
+    '"رب العالمين"',
+    "يؤمنون",
+    "كتب*",
+    "الصلاه الزكاه",
+    "ٱلْحَمْدُ لِلَّهِ",       # fully vocalized input
+    "الله -الرحيم",
+]
+
+
+def fts_index_bytes(db_file):
+    """Size of the FTS5 shadow tables (dbstat permitting), else the growth of the database file."""
+    conn = sqlite3.connect(db_file)
+    try:
+        return conn.execute("SELECT SUM(pgsize) FROM dbstat WHERE name LIKE ?", (f"{FTS_TABLE}%",)).fetchone()[0]
+    except sqlite3.OperationalError:
+        return None
+    finally:
+        conn.close()
+
+
+def time_queries(local, rounds, limit):
+    local.search(QUERIES[0], limit)  # open the connection, load the index, build the navigation index
+    return [(len(local.search(query, limit)), best_of(lambda: local.search(query, limit), rounds))
+            for query in QUERIES]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--budget-ms", type=float, default=10.0)
+    args = parser.parse_args()
+
+    with temp_config() as config_path, contextlib.redirect_stdout(io.StringIO()):
+        local = QuranLocalDataSource(config_path)
+        # The migration already built the FTS5 index; rebuild it once to time that
+        conn = sqlite3.connect(local.db_file)
+        start = time.perf_counter()
+        with conn:
+            build_fts_index(conn)
+        fts_build = time.perf_counter() - start
+        conn.close()
+        fts_bytes = fts_index_bytes(local.db_file)
+        fts = time_queries(local, args.rounds, args.limit)
+        local.close()
+
+    with temp_config(search_backend="trigram") as config_path, contextlib.redirect_stdout(io.StringIO()):
+        local = QuranLocalDataSource(config_path)
+        index_path = os.path.join(os.path.dirname(config_path), "quran_search.tri")
+        rows = local.db.fetchall("SELECT id, text FROM Ayas ORDER BY id")
+        start = time.perf_counter()
+        index = TrigramIndex.build(rows)
+        trigram_build = time.perf_counter() - start
+        trigram_bytes = index.save(index_path)
+        trigram_load = best_of(lambda: TrigramIndex.load(index_path), 3)
+        stats = index.get_stats()
+        local.config["search_index_path"] = index_path
+        trigram = time_queries(local, args.rounds, args.limit)
+        local.close()
+
+    print_table(
+        "search indexes",
+        [("fts5", f"{fts_build * 1000:.0f}", "-", f"{fts_bytes / 1024:.0f}" if fts_bytes else "n/a", "-"),
+         ("trigram", f"{trigram_build * 1000:.0f}", f"{trigram_load * 1000:.0f}", f"{trigram_bytes / 1024:.0f}",
+          f"{stats['trigrams']} trigrams, {stats['postings_bytes'] / 1024:.0f} KiB postings")],
+        ("backend", "build ms", "load ms", "KiB", "notes"),
+    )
+    print_table(
+        f"search(limit={args.limit}), best of {args.rounds}",
+        [(query, f_hits, f"{f_time * 1000:.2f}", t_hits, f"{t_time * 1000:.2f}")
+         for query, (f_hits, f_time), (t_hits, t_time) in zip(QUERIES, fts, trigram)],
+        ("query", "fts5 hits", "fts5 ms", "trigram hits", "trigram ms"),
+    )
+    slowest = max(seconds for _, seconds in fts)
+    print(f"slowest fts5 query: {slowest * 1000:.2f} ms (budget {args.budget_ms:.1f} ms)")
+    if slowest * 1000 > args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
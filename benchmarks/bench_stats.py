@@ -0,0 +1,74 @@
+#benchmarks/bench_stats.py
+"""
+Time the full-corpus statistics tables (NumPy) against the same tables
+counted with Python loops over get_quran_text.
+
+    python benchmarks/bench_stats.py [--rounds N]
+"""
+import argparse
+from collections import Counter
+
+from bench_utils import best_of, print_table, temp_config
+
+from data.datasources.quran_local_datasource import QuranLocalDataSource
+from data.search.arabic_normalizer import normalize_words
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with temp_config() as config_path:
+        local = QuranLocalDataSource(config_path)
+        try:
+            load = best_of(local.get_corpus_stats, args.rounds)
+        except ImportError as e:
+            print(f"[ERROR] {e}")
+            local.close()
+            return
+        corpus = local.get_corpus_stats()
+        index = local.get_navigation_index()
+        suras = local.get_sura_list()
+        juz_starts = local.get_division_index().starts("juz")
+
+        def python_words():
+            return Counter(word for sura in suras for _, text in local.get_quran_text(sura.id)
+                           for word in normalize_words(text) if word)
+
+        def python_letters():
+            return Counter(letter for sura in suras for _, text in local.get_quran_text(sura.id)
+                           for word in normalize_words(text) for letter in word)
+
+        def python_juz_counts():
+            from bisect import bisect_right
+            counts = Counter()
+            for sura in suras:
+                for aya_id, text in local.get_quran_text(sura.id):
+                    juz = bisect_right(juz_starts, index.to_global(sura.id, aya_id))
+                    counts[juz] += sum(1 for word in normalize_words(text) if word)
+            return counts
+
+        assert dict(corpus.word_frequencies()) == python_words(), "word tables disagree"
+        assert {n: words for n, words, _, _ in corpus.segment_counts("juz")} == python_juz_counts()
+        rows = [("load Words into arrays", load, None)]
+        for name, vectorized, loop in (
+                ("word frequencies", corpus.word_frequencies, python_words),
+                ("letter frequencies", corpus.letter_frequencies, python_letters),
+                ("counts per juz", lambda: corpus.segment_counts("juz"), python_juz_counts),
+                ("counts per page", lambda: corpus.segment_counts("page"), None),
+                ("word by sura", lambda: corpus.word_by_segment("الله", "sura"), None),
+                ("concordance", lambda: corpus.concordance("الكتب"), None)):
+            rows.append((name, best_of(vectorized, args.rounds), loop and best_of(loop, args.rounds)))
+        local.close()
+
+    print_table(
+        f"{corpus.total_words} words, {len(corpus.vocabulary)} distinct (best of {args.rounds})",
+        [(name, f"{seconds * 1000:.2f}", f"{loop * 1000:.1f}" if loop else "-",
+          f"{loop / seconds:.0f}x" if loop else "-") for name, seconds, loop in rows],
+        ("table", "numpy ms", "python loop ms", "speedup"),
+    )
+
+
+if __name__ == "__main__":
+    main()
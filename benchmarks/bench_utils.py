@@ -0,0 +1,47 @@
+#benchmarks/bench_utils.py
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+SOURCE_DB = os.path.join(REPO_ROOT, "data", "quran.db")
+
+
+@contextmanager
+def temp_config(**overrides):
+    """Yield a config path backed by a scratch copy of quran.db (the shipped file stays untouched)."""
+    with tempfile.TemporaryDirectory() as workdir:
+        db_file = os.path.join(workdir, "quran.db")
+        shutil.copyfile(SOURCE_DB, db_file)
+        config = {"database_name": db_file}
+        config.update(overrides)
+        config_path = os.path.join(workdir, "config.json")
+        with open(config_path, "w", encoding="utf-8") as f:
+            json.dump(config, f)
+        yield config_path
+
+
+def best_of(fn, rounds=5):
+    """Run fn `rounds` times and return the fastest wall time in seconds."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def print_table(title, rows, headers):
+    print(f"\n{title}")
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(str(c).ljust(w) for c, w in zip(row, widths)))
@@ -1,18 +1,167 @@
 import argparse
-from dependency_injection.container import ServiceContainer
+import time
+from data.datasources.quran_local_datasource import QuranLocalDataSource
+from data.datasources.binary_corpus import build_binary_corpus
+from data.datasources.quran_remote_datasource import QuranRemoteDataSource
+from data.sync.mirror_sync import MirrorSync
+from data.analytics.corpus_stats import SEGMENTS
+from data.search.arabic_normalizer import normalize_arabic
 
-def main():
-    container = ServiceContainer()
-    text_loader = container.load_text_uc
+CONFIG_PATH = "config/config.json"
 
-    parser = argparse.ArgumentParser(description="Quran Viewer CLI")
-    parser.add_argument("sura", type=int, help="Sura ID")
-    parser.add_argument("aya", type=int, nargs="?", default=0, help="Optional Aya ID")
-    args = parser.parse_args()
 
-    result = text_loader.execute(args.sura, args.aya)
-    for aya_id, text in result:
+def print_text(datasource, args):
+    for aya_id, text in datasource.get_text_source().get_quran_text(args.sura, args.aya):
         print(f"[{aya_id}] {text}")
 
+
+def build_corpus(datasource, args):
+    output = args.output or datasource.config.get('binary_corpus_path', 'data/quran_corpus.bin')
+    size = build_binary_corpus(datasource.db, output)
+    print(f"Wrote {output} ({size / 1024:.0f} KiB)")
+
+
+def sync(datasource, args):
+    remote = QuranRemoteDataSource.from_config(datasource.config)
+    checkpoint_dir = datasource.config.get('remote', {}).get('sync_checkpoint_dir', 'data/cache/sync')
+    try:
+        mirror = MirrorSync(datasource.db_file, remote, checkpoint_dir, workers=args.workers)
+        result = mirror.sync(args.edition, "audio" if args.audio else "text")
+    finally:
+        remote.close()
+    status = "done" if result.complete else f"incomplete, failed suras {result.failed_suras} (run again to resume)"
+    print(f"{args.edition}: {result.fetched_suras} suras fetched, {result.resumed_suras} resumed, "
+          f"{result.rows_written} rows in {result.seconds:.1f}s - {status}")
+
+
+def import_morphology(datasource, args):
+    result = datasource.import_morphology(args.path)
+    if result is None:
+        return
+    print(f"{result.words} words under {result.roots} roots ({result.forms} forms) imported "
+          f"in {result.seconds:.1f}s, {result.skipped} skipped")
+
+
+def root(datasource, args):
+    for result in datasource.search_root(args.root, args.limit):
+        print(f"[{result.sura_id}:{result.aya_id}] {result.snippet}")
+
+
+def similar(datasource, args):
+    for aya in datasource.get_similar_ayas(args.sura, args.aya, args.limit):
+        print(f"{aya.similarity:>3}% [{aya.sura_id}:{aya.aya_id}] {aya.text}")
+
+
+def locate(datasource, args):
+    numbering = datasource.get_aya_numbering()
+    if not numbering.is_valid(args.sura, args.aya):
+        print(f"[ERROR] Unknown aya {args.sura}:{args.aya}")
+        return
+    aya_number = numbering.to_global(args.sura, args.aya)
+    divisions = datasource.get_division_index()
+    page = datasource.get_navigation_index().page_for_global_aya(aya_number)
+    print(f"aya {aya_number}, page {page.id if page else '?'}")
+    for kind in divisions.kinds:
+        number = divisions.division_of(kind, aya_number)
+        start = numbering.from_global(divisions.start_of(kind, number)) if number else None
+        print(f"{kind} {number} (starts at {start[0]}:{start[1]})" if start else f"{kind} -")
+    sajda = divisions.sajda_type(aya_number)
+    if sajda:
+        print(f"sajda ({sajda})")
+
+
+def stats(datasource, args):
+    start = time.perf_counter()
+    try:
+        corpus = datasource.get_corpus_stats()
+    except ImportError as e:
+        print(f"[ERROR] {e}")
+        return
+    print(f"Loaded {corpus.total_words} words, {len(corpus.vocabulary)} distinct, "
+          f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    start = time.perf_counter()
+    segment = args.by if args.by != "corpus" and args.id is not None else None
+    if args.concordance:
+        for aya_number, word_index, left, word, right in corpus.concordance(normalize_arabic(args.concordance),
+                                                                            limit=args.top):
+            print(f"{aya_number:>5}:{word_index:<3} {left:>40}  [{word}]  {right}")
+    elif args.word:
+        by = args.by if args.by != "corpus" else "sura"
+        counts = corpus.word_by_segment(normalize_arabic(args.word), by)
+        for n, count in enumerate(counts, 1):
+            if count:
+                print(f"{by} {n}: {count}")
+    elif args.letters:
+        for letter, count in corpus.letter_frequencies(segment, args.id):
+            print(f"{letter}\t{count}")
+    elif args.id is None and args.by != "corpus":
+        print(f"{args.by}\twords\tdistinct\tletters")
+        for row in corpus.segment_counts(args.by):
+            print("\t".join(str(value) for value in row))
+    else:
+        for form, count in corpus.word_frequencies(args.top, segment, args.id):
+            print(f"{form}\t{count}")
+    print(f"Computed in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quran Viewer CLI")
+    parser.add_argument("--config", default=CONFIG_PATH, help="Path to config.json")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    text = commands.add_parser("text", help="Print the text of a sura or aya")
+    text.add_argument("sura", type=int, help="Sura ID")
+    text.add_argument("aya", type=int, nargs="?", default=0, help="Optional Aya ID")
+    text.set_defaults(handler=print_text)
+
+    corpus = commands.add_parser("build-corpus", help="Write the mmap-able binary corpus file")
+    corpus.add_argument("--output", help="Target file (default: config binary_corpus_path)")
+    corpus.set_defaults(handler=build_corpus)
+
+    mirror = commands.add_parser("sync", help="Mirror a remote text or audio edition into the database")
+    mirror.add_argument("edition", help="Edition identifier, e.g. en.sahih or ar.alafasy")
+    mirror.add_argument("--audio", action="store_true", help="Import audio URLs as a reciter instead of text")
+    mirror.add_argument("--workers", type=int, default=8, help="Concurrent downloads")
+    mirror.set_defaults(handler=sync)
+
+    morphology = commands.add_parser("import-morphology",
+                                     help="Build the root index from a Quranic Arabic Corpus morphology file")
+    morphology.add_argument("path", help="e.g. quranic-corpus-morphology-0.4.txt")
+    morphology.set_defaults(handler=import_morphology)
+
+    by_root = commands.add_parser("root", help="List the ayas with a word derived from a root")
+    by_root.add_argument("root", help='Root letters, e.g. "ك ت ب", كتب or ktb')
+    by_root.add_argument("--limit", type=int, default=50)
+    by_root.set_defaults(handler=root)
+
+    mutashabihat = commands.add_parser("similar", help="List the ayas nearly identical to an aya")
+    mutashabihat.add_argument("sura", type=int, help="Sura ID")
+    mutashabihat.add_argument("aya", type=int, help="Aya ID")
+    mutashabihat.add_argument("--limit", type=int, default=10)
+    mutashabihat.set_defaults(handler=similar)
+
+    where = commands.add_parser("locate", help="Juz, hizb, quarter, manzil, ruku and page of an aya")
+    where.add_argument("sura", type=int, help="Sura ID")
+    where.add_argument("aya", type=int, help="Aya ID")
+    where.set_defaults(handler=locate)
+
+    statistics = commands.add_parser("stats", help="Word and letter statistics (needs numpy)")
+    statistics.add_argument("--by", choices=("corpus",) + SEGMENTS, default="corpus",
+                            help="Segment kind: per-segment counts, or with --id the tables of one segment")
+    statistics.add_argument("--id", type=int, help="Segment number, e.g. --by juz --id 30")
+    statistics.add_argument("--top", type=int, default=20, help="Rows of the word frequency table / concordance")
+    statistics.add_argument("--letters", action="store_true", help="Letter frequencies instead of words")
+    statistics.add_argument("--word", help="Occurrences of a word per segment of --by")
+    statistics.add_argument("--concordance", metavar="WORD", help="Occurrences of a word in context")
+    statistics.set_defaults(handler=stats)
+
+    args = parser.parse_args()
+    datasource = QuranLocalDataSource(args.config)
+    try:
+        args.handler(datasource, args)
+    finally:
+        datasource.close()
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,142 @@
+#data/analytics/corpus_stats.py
+"""
+Word and letter statistics over the whole corpus with NumPy.
+
+The Words table is loaded once into parallel arrays, one entry per word:
+
+    token_ids   index into `vocabulary` (the sorted normalized forms)
+    aya_ids     global aya number
+    word_ids    1-based word_index within the aya
+    segments    {"sura" | "page" | "juz" | "hizb": segment id of the word}
+
+Segment ids come from one searchsorted over the segments' first global aya
+numbers, and every table is a bincount over those arrays (no Python loop
+per word). Letters are the code points of the concatenated forms, with their
+word's segments repeated by word length.
+
+NumPy is optional for the rest of the application; without it, creating
+CorpusStats raises ImportError.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # only the statistics need NumPy
+    np = None
+
+SEGMENTS = ("sura", "page", "juz", "hizb")
+
+
+class CorpusStats:
+    def __init__(self, words: Sequence[Tuple[int, int, str]], segment_starts: Dict[str, Sequence[int]]):
+        """
+        `words` are (aya_number, word_index, form) rows in mushaf order;
+        `segment_starts[segment]` are the first global aya numbers of segments
+        1, 2, ... of that kind (e.g. the 30 juz starts).
+        """
+        if np is None:
+            raise ImportError("Corpus statistics need numpy (pip install numpy)")
+        aya_ids, word_ids, forms = zip(*words) if words else ((), (), ())
+        self.aya_ids = np.asarray(aya_ids, dtype=np.int32)
+        self.word_ids = np.asarray(word_ids, dtype=np.int16)
+        vocabulary, token_ids = np.unique(np.asarray(forms, dtype=str), return_inverse=True)
+        self.vocabulary: List[str] = vocabulary.tolist()
+        self.token_ids = token_ids.astype(np.int32)
+        self._token_lookup = {form: i for i, form in enumerate(self.vocabulary)}
+
+        self.segment_sizes: Dict[str, int] = {}
+        self.segments: Dict[str, "np.ndarray"] = {}
+        for segment, starts in segment_starts.items():
+            starts = np.asarray(starts, dtype=np.int32)
+            self.segment_sizes[segment] = len(starts)
+            # Segment n (1-based) holds the ayas from starts[n - 1] up to the next start
+            self.segments[segment] = np.searchsorted(starts, self.aya_ids, side="right").astype(np.int32)
+
+        # Letters: code points of all forms joined, each tagged with its word's position
+        joined = "".join(forms)
+        self.letters = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32)
+        lengths = np.fromiter((len(form) for form in forms), dtype=np.int32, count=len(forms))
+        self.letter_words = np.repeat(np.arange(len(forms), dtype=np.int32), lengths)
+
+    @property
+    def total_words(self) -> int:
+        return int(self.token_ids.size)
+
+    def _segment_ids(self, segment: str) -> "np.ndarray":
+        if segment not in self.segments:
+            raise ValueError(f"Unknown segment '{segment}', expected one of {tuple(self.segments)}")
+        return self.segments[segment]
+
+    def _word_mask(self, segment: Optional[str], segment_id: Optional[int]) -> Optional["np.ndarray"]:
+        if segment is None:
+            return None
+        return self._segment_ids(segment) == segment_id
+
+    def token_id(self, form: str) -> Optional[int]:
+        """Vocabulary index of a normalized word form."""
+        return self._token_lookup.get(form)
+
+    # --- frequency tables ---
+    def word_frequencies(self, top: Optional[int] = None, segment: Optional[str] = None,
+                         segment_id: Optional[int] = None) -> List[Tuple[str, int]]:
+        """(form, count), most frequent first, over the corpus or one segment (e.g. "juz", 30)."""
+        mask = self._word_mask(segment, segment_id)
+        tokens = self.token_ids if mask is None else self.token_ids[mask]
+        counts = np.bincount(tokens, minlength=len(self.vocabulary))
+        order = np.argsort(-counts, kind="stable")
+        order = order[counts[order] > 0][:top]
+        return [(self.vocabulary[i], int(counts[i])) for i in order]
+
+    def letter_frequencies(self, segment: Optional[str] = None,
+                           segment_id: Optional[int] = None) -> List[Tuple[str, int]]:
+        """(letter, count), most frequent first, of the normalized text."""
+        letters = self.letters
+        if segment is not None:
+            letters = letters[self._segment_ids(segment)[self.letter_words] == segment_id]
+        values, counts = np.unique(letters, return_counts=True)
+        order = np.argsort(-counts, kind="stable")
+        return [(chr(values[i]), int(counts[i])) for i in order]
+
+    def segment_counts(self, segment: str) -> List[Tuple[int, int, int, int]]:
+        """(segment_id, words, distinct words, letters) for every segment of the kind."""
+        ids = self._segment_ids(segment)
+        size = self.segment_sizes[segment] + 1
+        words = np.bincount(ids, minlength=size)
+        letters = np.bincount(ids[self.letter_words], minlength=size)
+        # Distinct words: unique (segment, token) pairs, counted per segment
+        pairs = np.unique(ids.astype(np.int64) * len(self.vocabulary) + self.token_ids)
+        distinct = np.bincount(pairs // len(self.vocabulary), minlength=size) if len(self.vocabulary) else words
+        return [(n, int(words[n]), int(distinct[n]), int(letters[n])) for n in range(1, size)]
+
+    def word_by_segment(self, form: str, segment: str) -> List[int]:
+        """Occurrences of `form` in each segment, index 0 being segment 1."""
+        ids = self._segment_ids(segment)
+        token = self.token_id(form)
+        if token is None:
+            return [0] * self.segment_sizes[segment]
+        counts = np.bincount(ids[self.token_ids == token], minlength=self.segment_sizes[segment] + 1)
+        return counts[1:].tolist()
+
+    def concordance(self, form: str, width: int = 4,
+                    limit: Optional[int] = None) -> List[Tuple[int, int, str, str, str]]:
+        """
+        Keyword in context: (aya_number, word_index, left, word, right) for every
+        occurrence of `form`, with up to `width` words of the same aya on each side.
+        """
+        token = self.token_id(form)
+        if token is None:
+            return []
+        hits = np.flatnonzero(self.token_ids == token)[:limit]
+        result = []
+        for i in hits.tolist():
+            aya_number = self.aya_ids[i]
+            # Words of the same aya are contiguous, so the context is a slice bounded by the aya
+            left = max(i - width, i - int(self.word_ids[i]) + 1)
+            right = i + 1
+            while right < min(i + width + 1, self.total_words) and self.aya_ids[right] == aya_number:
+                right += 1
+            result.append((int(aya_number), int(self.word_ids[i]),
+                           " ".join(self.vocabulary[t] for t in self.token_ids[left:i]),
+                           form,
+                           " ".join(self.vocabulary[t] for t in self.token_ids[i + 1:right])))
+        return result
@@ -0,0 +1,67 @@
+#data/datasources/audio_catalog.py
+import os
+from typing import Dict, Iterable, List, Tuple
+
+
+class AudioCatalog:
+    """
+    Per-reciter audio location templates loaded from ReciterAudio/AudioOverrides.
+
+    A template is a str.format pattern over `sura`, `aya`, `aya_number`
+    (global 1..6236) and `reciter`, e.g. "muhammad_husary/{sura:03d}{aya:03d}.mp3".
+    Playlists are computed from it directly; only ayas listed in
+    AudioOverrides deviate. Relative locations are resolved against `base_dir`.
+    A reciter without a template (e.g. audio written back from the remote API
+    sura by sura) is served from its overrides alone where they are complete.
+    """
+
+    def __init__(self, templates: Dict[str, str],
+                 overrides: Dict[str, Dict[Tuple[int, int], str]],
+                 base_dir: str = ""):
+        self._templates = dict(templates)
+        self._overrides = {key: dict(value) for key, value in overrides.items()}
+        self.base_dir = os.path.join(os.path.abspath(base_dir), "") if base_dir else ""
+
+    @classmethod
+    def from_connection_manager(cls, db, base_dir: str = "") -> "AudioCatalog":
+        templates = dict(db.fetchall("SELECT reciter_key, url_template FROM ReciterAudio"))
+        overrides: Dict[str, Dict[Tuple[int, int], str]] = {}
+        for key, sura_id, aya_id, url in db.fetchall(
+                "SELECT reciter_key, sura_id, aya_id, audio_url FROM AudioOverrides"):
+            overrides.setdefault(key, {})[(sura_id, aya_id)] = url
+        return cls(templates, overrides, base_dir)
+
+    def has_reciter(self, reciter: str) -> bool:
+        return reciter in self._templates or reciter in self._overrides
+
+    def add_overrides(self, reciter: str, locations: Dict[Tuple[int, int], str]) -> None:
+        """Register locations stored in AudioOverrides after the catalog was loaded."""
+        self._overrides.setdefault(reciter, {}).update(locations)
+
+    def reciters(self) -> List[str]:
+        return sorted(self._templates)
+
+    def resolve(self, location: str) -> str:
+        """Turn a stored URL/relative path into something QMediaContent can open."""
+        if location.startswith(('http://', 'https://')) or os.path.isabs(location):
+            return location
+        return self.base_dir + location
+
+    def playlist(self, reciter: str, ayas: Iterable[Tuple[int, int, int]]) -> List[Tuple[int, int, str]]:
+        """Build (sura_id, aya_id, location) for (sura_id, aya_id, aya_number) triples."""
+        template = self._templates.get(reciter)
+        overrides = self._overrides.get(reciter, {})
+        if template is None:
+            if not overrides:
+                print(f"[ERROR] Unknown reciter: {reciter}")
+                return []
+            ayas = list(ayas)
+            if not all((sura_id, aya_id) in overrides for sura_id, aya_id, _ in ayas):
+                return []
+            return [(sura_id, aya_id, self.resolve(overrides[(sura_id, aya_id)])) for sura_id, aya_id, _ in ayas]
+        resolve = self.resolve
+        return [
+            (sura_id, aya_id, resolve(overrides.get((sura_id, aya_id)) or
+                                      template.format(sura=sura_id, aya=aya_id, aya_number=aya_number, reciter=reciter)))
+            for sura_id, aya_id, aya_number in ayas
+        ]
@@ -0,0 +1,146 @@
+#data/datasources/binary_corpus.py
+"""
+Compact binary corpus file, read through mmap.
+
+Layout (all integers little-endian):
+
+    header        magic b"QRNC", uint16 version, uint16 reserved,
+                  uint32 aya_count, uint32 sura_count
+    sura table    sura_count x (uint32 start, uint32 ayas)
+    offsets       (aya_count + 1) x uint32, byte offsets into the blob
+    blob          UTF-8 aya texts back to back, in global aya order
+
+Opening the file decodes nothing; an aya's text is decoded from its
+memoryview slice the first time it is requested.
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import List, Tuple
+
+from data.datasources.quran_corpus import QuranCorpus
+
+MAGIC = b"QRNC"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sHHII")
+_SURA_ENTRY = struct.Struct("<II")
+
+
+def write_binary_corpus(path: str, texts: List[str], sura_layout: List[Tuple[int, int]]) -> int:
+    """Write texts (global aya order) and (start, ayas) per sura; returns the file size."""
+    blobs = [text.encode("utf-8") for text in texts]
+    offsets = array("I", [0])
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(blobs), len(sura_layout)))
+        for start, ayas in sura_layout:
+            f.write(_SURA_ENTRY.pack(start, ayas))
+        f.write(offsets.tobytes())
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+def build_binary_corpus(db, path: str) -> int:
+    """Build step: dump the Ayas/Suras tables reachable through `db` into `path`."""
+    corpus = QuranCorpus.from_connection_manager(db)
+    return write_binary_corpus(path, list(corpus.texts()), corpus.sura_layout())
+
+
+class MmapTextTable(Sequence):
+    """Read-only sequence of aya texts decoded lazily from a memory-mapped corpus file."""
+
+    def __init__(self, path: str):
+        self._map = None
+        self._view = None
+        self._offsets = None
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._map)
+            self._read_layout(path)
+        except ValueError:
+            self.close()
+            raise
+
+    def _read_layout(self, path: str) -> None:
+        """Parse and check the header, sura table and offsets against the file size."""
+        if len(self._map) < _HEADER.size:
+            raise ValueError(f"{path} is truncated: {len(self._map)} bytes")
+        magic, version, _, aya_count, sura_count = _HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} Quran corpus file")
+
+        position = _HEADER.size
+        offsets_size = (aya_count + 1) * 4
+        blob_start = position + sura_count * _SURA_ENTRY.size + offsets_size
+        if len(self._map) < blob_start:
+            raise ValueError(f"{path} is truncated: {len(self._map)} bytes, the tables need {blob_start}")
+
+        self.sura_layout = [_SURA_ENTRY.unpack_from(self._view, position + i * _SURA_ENTRY.size)
+                            for i in range(sura_count)]
+        total = 0
+        for start, ayas in self.sura_layout:
+            if start != total:
+                raise ValueError(f"{path} has a broken sura table")
+            total += ayas
+        if total != aya_count:
+            raise ValueError(f"{path} has a broken sura table")
+
+        position += sura_count * _SURA_ENTRY.size
+        offsets_view = self._view[position:position + offsets_size]
+        if sys.byteorder == "little":
+            self._offsets = offsets_view.cast("I")
+        else:
+            self._offsets = array("I", offsets_view.tobytes())
+            self._offsets.byteswap()
+        offsets_view.release()
+        if self._offsets[0] != 0 or blob_start + self._offsets[aya_count] != len(self._map):
+            raise ValueError(f"{path} is truncated: the offsets do not match the file size")
+        self._blob_start = blob_start
+        self._count = aya_count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _decode(self, index: int) -> str:
+        start = self._blob_start + self._offsets[index]
+        end = self._blob_start + self._offsets[index + 1]
+        return str(self._view[start:end], "utf-8")
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self._decode(i) for i in range(*index.indices(self._count)))
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("aya index out of range")
+        return self._decode(index)
+
+    def close(self) -> None:
+        # Also called on a half-opened table, so every step checks what exists
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._offsets = None
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+def open_binary_corpus(path: str) -> QuranCorpus:
+    """Memory-map a corpus file and expose it through the QuranCorpus text API."""
+    texts = MmapTextTable(path)
+    return QuranCorpus.from_sura_layout(texts, texts.sura_layout)
@@ -0,0 +1,217 @@
+#data/datasources/disk_cache.py
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, Optional
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    digest: str
+    size: int
+    stored_at: float
+    last_access: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class DiskCache:
+    """
+    Content-addressed HTTP response cache.
+
+    Bodies live in `blobs/<sha256 of body>`, so identical responses are stored
+    once; `entries/<sha256 of url>.json` maps a URL to its body digest and its
+    ETag/Last-Modified validators. Entries younger than `ttl` seconds are served
+    without touching the network; older ones are revalidated. Total body size
+    is kept under `max_bytes` by evicting the least recently used entries.
+    Every file is written to a temp file and renamed into place, so a crash
+    never leaves a partial entry behind.
+    """
+
+    def __init__(self, directory: str, ttl: float = 30 * 24 * 3600, max_bytes: int = 256 * 1024 * 1024):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries_dir = os.path.join(directory, "entries")
+        self._blobs_dir = os.path.join(directory, "blobs")
+        os.makedirs(self._entries_dir, exist_ok=True)
+        os.makedirs(self._blobs_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._index: Dict[str, CacheEntry] = {}
+        self._blob_refs: Dict[str, int] = {}
+        self._blob_sizes: Dict[str, int] = {}
+        self.hits = self.misses = self.revalidated = self.stale_served = 0
+        self.stores = self.evictions = 0
+        self._load_index()
+
+    @staticmethod
+    def _digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def _entry_path(self, url: str) -> str:
+        return os.path.join(self._entries_dir, self._digest(url.encode("utf-8")) + ".json")
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self._blobs_dir, digest)
+
+    def _write_atomic(self, path: str, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _load_index(self) -> None:
+        for name in os.listdir(self._entries_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self._entries_dir, name)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    entry = CacheEntry(**json.load(f))
+            except (OSError, ValueError, TypeError) as e:
+                print(f"[WARN] Dropping unreadable cache entry {name}: {e}")
+                os.unlink(path)
+                continue
+            if not os.path.exists(self._blob_path(entry.digest)):
+                os.unlink(path)
+                continue
+            self._add(entry)
+
+    def _add(self, entry: CacheEntry) -> None:
+        self._index[entry.url] = entry
+        self._blob_refs[entry.digest] = self._blob_refs.get(entry.digest, 0) + 1
+        self._blob_sizes[entry.digest] = entry.size
+
+    def _remove(self, url: str) -> None:
+        entry = self._index.pop(url)
+        try:
+            os.unlink(self._entry_path(url))
+        except FileNotFoundError:
+            pass
+        self._blob_refs[entry.digest] -= 1
+        if not self._blob_refs[entry.digest]:
+            del self._blob_refs[entry.digest]
+            del self._blob_sizes[entry.digest]
+            try:
+                os.unlink(self._blob_path(entry.digest))
+            except FileNotFoundError:
+                pass
+
+    def _save_entry(self, entry: CacheEntry) -> None:
+        self._write_atomic(self._entry_path(entry.url), json.dumps(asdict(entry)).encode("utf-8"))
+
+    # --- lookups ---
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """The entry for `url` regardless of age, or None."""
+        with self._lock:
+            return self._index.get(url)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.stored_at < self.ttl
+
+    def read(self, entry: CacheEntry, outcome: str = "hit") -> Optional[bytes]:
+        """
+        Body of `entry`, recording `outcome` ("hit", "revalidated" or "stale").
+        Returns None (and forgets the entry) if the blob has disappeared.
+        """
+        try:
+            with open(self._blob_path(entry.digest), "rb") as f:
+                body = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                if self._index.get(entry.url) is entry:
+                    self._remove(entry.url)
+            return None
+        with self._lock:
+            entry.last_access = time.time()
+            if outcome == "revalidated":
+                self.revalidated += 1
+            elif outcome == "stale":
+                self.stale_served += 1
+            else:
+                self.hits += 1
+        return body
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    # --- updates ---
+    def store(self, url: str, body: bytes, etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> CacheEntry:
+        digest = self._digest(body)
+        now = time.time()
+        entry = CacheEntry(url, digest, len(body), now, now, etag, last_modified)
+        blob_path = self._blob_path(digest)
+        with self._lock:
+            # Drop the old entry first: storing the same body again must not
+            # unlink the blob the new entry is about to share
+            if url in self._index:
+                self._remove(url)
+            if not os.path.exists(blob_path):
+                self._write_atomic(blob_path, body)
+            self._save_entry(entry)
+            self._add(entry)
+            self.stores += 1
+            self._evict()
+        return entry
+
+    def refresh(self, entry: CacheEntry) -> None:
+        """Mark `entry` fresh again after the server answered 304 Not Modified."""
+        with self._lock:
+            entry.stored_at = time.time()
+            if self._index.get(entry.url) is entry:
+                self._save_entry(entry)
+
+    def _evict(self) -> None:
+        total = sum(self._blob_sizes.values())
+        if total <= self.max_bytes:
+            return
+        for entry in sorted(self._index.values(), key=lambda e: e.last_access):
+            if total <= self.max_bytes:
+                break
+            shared = self._blob_refs[entry.digest] > 1
+            self._remove(entry.url)
+            self.evictions += 1
+            if not shared:
+                total -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            for url in list(self._index):
+                self._remove(url)
+
+    def get_stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.revalidated + self.misses
+            return {
+                "entries": len(self._index),
+                "bytes": sum(self._blob_sizes.values()),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+                "stale_served": self.stale_served,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "hit_ratio": (self.hits + self.revalidated) / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,233 @@
+#data/datasources/http_client.py
+import asyncio
+import http.client
+import json
+import random
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class HttpError(Exception):
+    """Non-success HTTP status."""
+
+    def __init__(self, status: int, url: str):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        self.url = url
+
+    @property
+    def retryable(self) -> bool:
+        return self.status == 429 or self.status >= 500
+
+
+@dataclass
+class HttpResponse:
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    url: str = ""
+    from_cache: bool = field(default=False, compare=False)
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode("utf-8"))
+
+
+class _LoopState:
+    """asyncio primitives are bound to one event loop, so they are kept per loop."""
+
+    def __init__(self):
+        self.semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.inflight: Dict[Tuple[str, Tuple], asyncio.Future] = {}
+
+
+class AsyncHttpClient:
+    """
+    Shared asyncio HTTP client for the remote datasource.
+
+    - keep-alive connections are pooled per (scheme, host, port) and reused
+    - at most `max_per_host` requests run concurrently against one host
+    - every request has a timeout, and connection errors, 429 and 5xx are
+      retried with jittered exponential backoff
+    - concurrent GETs of the same URL are coalesced into one request
+
+    Blocking socket I/O runs on a private thread pool via run_in_executor.
+    """
+
+    RETRY_EXCEPTIONS = (OSError, http.client.HTTPException)
+
+    def __init__(self, max_per_host: int = 6, timeout: float = 10.0, retries: int = 3,
+                 backoff: float = 0.25, user_agent: str = "quran_viewer/0.1"):
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.user_agent = user_agent
+
+        self._executor = ThreadPoolExecutor(max_workers=max_per_host * 4, thread_name_prefix="http")
+        self._pool: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self._pool_lock = threading.Lock()
+        self._loop_states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = \
+            weakref.WeakKeyDictionary()
+        self._closed = False
+
+        self.requests_sent = 0
+        self.connections_opened = 0
+        self.retries_done = 0
+        self.coalesced = 0
+
+    # --- connection pool (runs on executor threads) ---
+    def _pool_key(self, url: str) -> Tuple[str, str, int]:
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        return parts.scheme, parts.hostname, port
+
+    def _acquire(self, key: Tuple[str, str, int]) -> http.client.HTTPConnection:
+        with self._pool_lock:
+            idle = self._pool.get(key)
+            if idle:
+                return idle.pop()
+            self.connections_opened += 1
+        scheme, host, port = key
+        conn_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return conn_class(host, port, timeout=self.timeout)
+
+    def _release(self, key: Tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self._pool_lock:
+            if self._closed or len(self._pool.setdefault(key, [])) >= self.max_per_host:
+                conn.close()
+            else:
+                self._pool[key].append(conn)
+
+    def _request(self, url: str, headers: Mapping[str, str]) -> HttpResponse:
+        key = self._pool_key(url)
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        request_headers = {"Accept": "application/json", "User-Agent": self.user_agent,
+                           "Connection": "keep-alive"}
+        request_headers.update(headers)
+
+        conn = self._acquire(key)
+        try:
+            conn.request("GET", path, headers=request_headers)
+            response = conn.getresponse()
+            body = response.read()
+        except Exception:
+            conn.close()
+            raise
+        with self._pool_lock:
+            self.requests_sent += 1
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+        return HttpResponse(response.status, {k.lower(): v for k, v in response.getheaders()}, body, url)
+
+    # --- asyncio API ---
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._loop_states.get(loop)
+        if state is None:
+            state = self._loop_states[loop] = _LoopState()
+        return state
+
+    async def _send(self, url: str, headers: Mapping[str, str], ok_statuses: Tuple[int, ...]) -> HttpResponse:
+        state = self._state()
+        host = urlsplit(url).netloc
+        semaphore = state.semaphores.setdefault(host, asyncio.Semaphore(self.max_per_host))
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(self.retries + 1):
+            try:
+                async with semaphore:
+                    response = await loop.run_in_executor(self._executor, self._request, url, headers)
+                if response.status in ok_statuses or 200 <= response.status < 300:
+                    return response
+                raise HttpError(response.status, url)
+            except HttpError as e:
+                if not e.retryable or attempt == self.retries:
+                    raise
+            except self.RETRY_EXCEPTIONS:
+                if attempt == self.retries:
+                    raise
+            self.retries_done += 1
+            # Full jitter keeps simultaneous retries from hitting the host in lockstep.
+            await asyncio.sleep(random.uniform(0, self.backoff * (2 ** attempt)))
+        raise AssertionError("unreachable")
+
+    async def get(self, url: str, headers: Optional[Mapping[str, str]] = None,
+                  ok_statuses: Tuple[int, ...] = ()) -> HttpResponse:
+        """GET with retries; concurrent identical requests share one round trip."""
+        if self._closed:
+            raise RuntimeError("AsyncHttpClient is closed")
+        headers = dict(headers or {})
+        key = (url, tuple(sorted(headers.items())))
+        state = self._state()
+        pending = state.inflight.get(key)
+        if pending is not None:
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+
+        future = asyncio.ensure_future(self._send(url, headers, ok_statuses))
+        state.inflight[key] = future
+        future.add_done_callback(lambda _: state.inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def get_json(self, url: str) -> Any:
+        return (await self.get(url)).json()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._pool_lock:
+            idle = sum(len(conns) for conns in self._pool.values())
+        return {
+            "requests_sent": self.requests_sent,
+            "connections_opened": self.connections_opened,
+            "idle_connections": idle,
+            "retries": self.retries_done,
+            "coalesced": self.coalesced,
+        }
+
+    def close(self) -> None:
+        with self._pool_lock:
+            self._closed = True
+            pools, self._pool = self._pool, {}
+        for conns in pools.values():
+            for conn in conns:
+                conn.close()
+        self._executor.shutdown(wait=False)
+
+
+class EventLoopThread:
+    """A private event loop on a daemon thread, so blocking callers can run coroutines."""
+
+    def __init__(self, name: str = "asyncio-loop"):
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name=self._name, daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """Run `coro` on the loop thread and block until it finishes."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_started()).result(timeout)
+
+    def stop(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
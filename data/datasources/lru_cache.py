@@ -0,0 +1,86 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Thread-safe bounded mapping that evicts the least recently used entry.
+
+    Bounded by entry count and, with `max_bytes`, by the summed `sizeof(value)`
+    (sys.getsizeof by default); a value larger than the whole budget is not kept.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, max_entries: int = 128, max_bytes: Optional[int] = None,
+                 sizeof: Callable[[Any], int] = sys.getsizeof):
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._data.get(key, self._MISSING)
+            if value is self._MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+        with self._lock:
+            self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._data[key] = value
+            self._sizes[key] = size
+            self.bytes += size
+            while len(self._data) > self.max_entries or (self.max_bytes is not None and self.bytes > self.max_bytes):
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        if key in self._data:
+            del self._data[key]
+            self.bytes -= self._sizes.pop(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.bytes = 0
+
+    def get_stats(self) -> Dict[str, Optional[float]]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "max_entries": self.max_entries,
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": (self.hits / lookups) if lookups else None,
+            }
@@ -0,0 +1,118 @@
+#data/datasources/quran_corpus.py
+from array import array
+from typing import List, Optional, Sequence, Tuple
+
+from domain.entities.page_entity import PageEntity
+
+
+class QuranCorpus:
+    """
+    Immutable in-memory copy of the Ayas table.
+
+    Texts are stored in one sequence indexed by global aya index (0-based,
+    i.e. Ayas.id - 1), and `Suras.start` gives the offset of each sura, so
+    `(sura, aya) -> index` is plain arithmetic and every text query is a slice.
+    It serves the same text methods as QuranLocalDataSource with the same
+    return shapes, so either can back QuranRepositoryImpl.
+
+    `texts` may be a list (copied into a tuple) or any immutable sequence
+    supporting slices, such as the lazily decoded MmapTextTable.
+    """
+
+    __slots__ = ("_texts", "_sura_ids", "_aya_ids", "_sura_starts", "_sura_lengths")
+
+    def __init__(self, texts, sura_ids, aya_ids, sura_starts, sura_lengths):
+        self._texts: Sequence[str] = tuple(texts) if isinstance(texts, list) else texts
+        self._sura_ids = array("H", sura_ids)
+        self._aya_ids = array("H", aya_ids)
+        # Index 0 is unused so sura ids can index directly.
+        self._sura_starts = array("I", [0] + list(sura_starts))
+        self._sura_lengths = array("H", [0] + list(sura_lengths))
+
+    @classmethod
+    def from_connection_manager(cls, db) -> "QuranCorpus":
+        """Load the whole corpus with two sequential reads."""
+        suras = db.fetchall("SELECT id, start, ayas FROM Suras ORDER BY id")
+        rows = db.fetchall("SELECT sura_id, aya_id, text FROM Ayas ORDER BY id")
+        return cls(
+            texts=[row[2] for row in rows],
+            sura_ids=[row[0] for row in rows],
+            aya_ids=[row[1] for row in rows],
+            sura_starts=[row[1] for row in suras],
+            sura_lengths=[row[2] for row in suras],
+        )
+
+    @classmethod
+    def from_sura_layout(cls, texts, sura_layout) -> "QuranCorpus":
+        """Build a corpus from texts in global order and (start, ayas) per sura."""
+        sura_ids, aya_ids = array("H"), array("H")
+        for sura_id, (_, ayas) in enumerate(sura_layout, start=1):
+            sura_ids.extend([sura_id] * ayas)
+            aya_ids.extend(range(1, ayas + 1))
+        return cls(
+            texts=texts,
+            sura_ids=sura_ids,
+            aya_ids=aya_ids,
+            sura_starts=[start for start, _ in sura_layout],
+            sura_lengths=[ayas for _, ayas in sura_layout],
+        )
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def close(self) -> None:
+        """Release the backing storage (e.g. a memory map); a no-op for in-memory texts."""
+        close = getattr(self._texts, "close", None)
+        if close:
+            close()
+
+    def sura_layout(self) -> List[Tuple[int, int]]:
+        """(start, ayas) per sura in id order, as stored in the Suras table."""
+        return list(zip(self._sura_starts[1:], self._sura_lengths[1:]))
+
+    def texts(self) -> Sequence[str]:
+        return self._texts
+
+    def _has_sura(self, sura_id: int) -> bool:
+        return 1 <= sura_id < len(self._sura_starts)
+
+    def index_of(self, sura_id: int, aya_id: int) -> Optional[int]:
+        """0-based global index of (sura_id, aya_id), or None if it does not exist."""
+        if not self._has_sura(sura_id) or not 1 <= aya_id <= self._sura_lengths[sura_id]:
+            return None
+        return self._sura_starts[sura_id] + aya_id - 1
+
+    def get_aya_list(self, sura_id: int) -> List[int]:
+        if not self._has_sura(sura_id):
+            return []
+        return list(range(1, self._sura_lengths[sura_id] + 1))
+
+    def get_quran_text(self, sura_id: int, aya_id: Optional[int] = None) -> List[Tuple[int, str]]:
+        if aya_id and aya_id != 0:
+            index = self.index_of(sura_id, aya_id)
+            return [] if index is None else [(aya_id, self._texts[index])]
+        return self.get_quran_text_range(sura_id, 1, self._sura_lengths[sura_id] if self._has_sura(sura_id) else 0)
+
+    def get_quran_text_range(self, sura_id: int, start_aya: int, count: int) -> List[Tuple[int, str]]:
+        if not self._has_sura(sura_id) or count <= 0:
+            return []
+        first = max(start_aya, 1)
+        last = min(first + count - 1, self._sura_lengths[sura_id])
+        if last < first:
+            return []
+        start = self._sura_starts[sura_id]
+        texts = self._texts[start + first - 1:start + last]
+        return list(zip(range(first, last + 1), texts))
+
+    def fetch_page_text(self, page: PageEntity) -> List[Tuple[int, int, str]]:
+        """Return the page's ayas as (sura_id, aya_id, text) tuples, crossing sura boundaries."""
+        if page.start_aya is not None:
+            index = page.start_aya - 1
+        else:
+            start_sura_id = page.first_sura_id()
+            index = self.index_of(start_sura_id, page.start_id) if start_sura_id else None
+        if index is None or not 0 <= index < len(self._texts):
+            print(f"Error while fetching page text: no start aya for page {page.id}")
+            return []
+        end = index + page.ayas_count
+        return list(zip(self._sura_ids[index:end], self._aya_ids[index:end], self._texts[index:end]))
@@ -1,17 +1,64 @@
 import os
 import json
 import sqlite3
+import threading
 from domain.entities.sura_entity import SuraEntity
 from domain.entities.page_entity import PageEntity
 from domain.entities.reciter_entity import ReciterEntity
-from typing import List, Tuple
+from domain.entities.edition_entity import EditionEntity
+from domain.entities.search_result_entity import SearchResultEntity
+from domain.entities.similar_aya_entity import SimilarAyaEntity
+from domain.entities.navigation_index import NavigationIndex
+from domain.entities.aya_numbering import AyaNumbering
+from domain.entities.division_index import DivisionIndex
+from data.datasources.sqlite_connection_manager import SQLiteConnectionManager
+from data.datasources.lru_cache import LRUCache
+from data.datasources.audio_catalog import AudioCatalog
+from data.datasources.quran_corpus import QuranCorpus
+from data.datasources.binary_corpus import build_binary_corpus, open_binary_corpus
+from data.datasources.quran_metadata import read_metadata_json, read_metadata_xml
+from data.migrations.migration_runner import MigrationRunner
+from data.search.fts_search import FtsSearchBackend, build_fts_index
+from data.search.trigram_search import TrigramSearchBackend
+from data.search.search_query import SearchQuery
+from data.search.snippet import make_snippet
+from data.search.root_index import RootIndex
+from data.search.similarity_index import SimilarityIndex
+from data.search.morphology_importer import ImportResult, import_morphology
+from data.analytics.corpus_stats import CorpusStats
+from typing import Dict, List, Sequence, Tuple
 from typing import Optional
 
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "config")
+METADATA_FILE = os.path.join(os.path.dirname(CONFIG_DIR), "meta_data.xml")
+
+
 class QuranLocalDataSource:
+    TEXT_BACKENDS = ("sqlite", "memory", "mmap")
+    SEARCH_BACKENDS = ("auto", "fts5", "trigram")
+
     def __init__(self, config_path='../config/config.json'):
         self.config_path = config_path
         self.config = self._load_config()
         self.db_file = self.config.get('database_name', 'quran.db')
+        self._navigation_index: Optional[NavigationIndex] = None
+        self._division_index: Optional[DivisionIndex] = None
+        self._audio_catalog: Optional[AudioCatalog] = None
+        self._text_source = None
+        self._search_backend = None
+        self._root_index: Optional[RootIndex] = None
+        self._similarity_index: Optional[SimilarityIndex] = None
+        self._similarity_lock = threading.Lock()  # built once, possibly on a background thread
+        self.playlist_cache = LRUCache(self.config.get('playlist_cache_size', 32))
+        if self.config.get('auto_migrate', True):
+            self._migrate()
+        sqlite_options = self.config.get('sqlite', {})
+        self.db = SQLiteConnectionManager(
+            self.db_file,
+            mmap_size=sqlite_options.get('mmap_size', SQLiteConnectionManager.DEFAULT_MMAP_SIZE),
+            cache_size_kib=sqlite_options.get('cache_size_kib', SQLiteConnectionManager.DEFAULT_CACHE_SIZE_KIB),
+            cached_statements=sqlite_options.get('cached_statements', SQLiteConnectionManager.DEFAULT_CACHED_STATEMENTS),
+        )
 
     def _load_config(self):
         if os.path.exists(self.config_path):
@@ -22,152 +69,495 @@ class QuranLocalDataSource:
                 return {"database_name": "quran.db"}
         return {"database_name": "quran.db"}
 
+    def _migrate(self):
+        """Bring the database schema up to date before the read-only pool opens."""
+        if not os.path.exists(self.db_file):
+            print(f"[WARN] Database not found, skipping migrations: {self.db_file}")
+            return
+        try:
+            MigrationRunner(self.db_file).migrate()
+        except sqlite3.Error as e:
+            print(f"[WARN] Could not apply schema migrations to {self.db_file}: {e}")
+
+    def close(self):
+        """Release the pooled database connections and any mapped corpus file."""
+        if self._text_source is not None and self._text_source is not self:
+            self._text_source.close()
+        self._text_source = None
+        self.db.close()
+
+    def get_text_source(self):
+        """
+        Object serving aya text (get_quran_text, get_quran_text_range,
+        fetch_page_text, get_aya_list), chosen by config "text_backend":
+        "sqlite" queries this datasource, "memory" loads a QuranCorpus and
+        "mmap" maps the binary corpus file (built from the database if missing).
+        """
+        if self._text_source is None:
+            backend = self.config.get('text_backend', 'sqlite')
+            if backend == 'memory':
+                self._text_source = QuranCorpus.from_connection_manager(self.db)
+            elif backend == 'mmap':
+                self._text_source = self._open_binary_corpus()
+            else:
+                if backend != 'sqlite':
+                    print(f"[WARN] Unknown text_backend '{backend}', expected one of {self.TEXT_BACKENDS}; using sqlite")
+                self._text_source = self
+        return self._text_source
+
+    def _open_binary_corpus(self):
+        path = self.config.get('binary_corpus_path', 'data/quran_corpus.bin')
+        aya_count = self.get_aya_numbering().total_ayas
+        if os.path.exists(path):
+            try:
+                corpus = open_binary_corpus(path)
+                if len(corpus) == aya_count:
+                    return corpus
+                print(f"[WARN] Rebuilding binary corpus {path}: built for {len(corpus)} ayas, not {aya_count}")
+                corpus.close()
+            except (OSError, ValueError) as e:
+                print(f"[WARN] Rebuilding binary corpus {path}: {e}")
+        else:
+            print(f"[INFO] Building binary corpus: {path}")
+        try:
+            build_binary_corpus(self.db, path)
+            return open_binary_corpus(path)
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Could not open binary corpus {path}, falling back to memory: {e}")
+            return QuranCorpus.from_connection_manager(self.db)
+
+    def get_db_stats(self):
+        """Connection/query counters of the underlying connection manager."""
+        return self.db.get_stats()
 
 
     def get_aya_list(self, sura_id):
-        conn = sqlite3.connect(self.db_file)
-        cur = conn.cursor()
-        cur.execute("SELECT aya_id FROM Ayas WHERE sura_id=? ORDER BY aya_id", (sura_id,))
-        ayas = cur.fetchall()
-        conn.close()
+        aya_range = self.get_aya_numbering().sura_range(sura_id)
+        if not aya_range:
+            return []
+        ayas = self.db.fetchall("SELECT aya_id FROM Ayas WHERE id BETWEEN ? AND ? ORDER BY id", aya_range)
         return [aid[0] for aid in ayas]
 
     def get_quran_text(self, sura_id, aya_id=None):
-        conn = sqlite3.connect(self.db_file)
-        cur = conn.cursor()
+        numbering = self.get_aya_numbering()
         if aya_id and aya_id != 0:
-            cur.execute("SELECT aya_id, Text FROM Ayas WHERE sura_id=? AND aya_id=?", (sura_id, aya_id))
-        else:
-            cur.execute("SELECT aya_id, Text FROM Ayas WHERE sura_id=? ORDER BY aya_id", (sura_id,))
-        data = cur.fetchall()
-        conn.close()
-        return data
+            if not numbering.is_valid(sura_id, aya_id):
+                return []
+            return self.db.fetchall("SELECT aya_id, Text FROM Ayas WHERE id = ?",
+                                    (numbering.to_global(sura_id, aya_id),))
+        aya_range = numbering.sura_range(sura_id)
+        if not aya_range:
+            return []
+        return self.db.fetchall("SELECT aya_id, Text FROM Ayas WHERE id BETWEEN ? AND ? ORDER BY id", aya_range)
 
-    def _connect_db(self):
-        return sqlite3.connect(self.db_file)
 
+    def get_aya_numbering(self) -> AyaNumbering:
+        """(sura, aya) <-> global aya number conversion, derived from Suras.start."""
+        return self.get_navigation_index().numbering
 
-    def get_page_info(self, page_num: int) -> Optional[PageEntity]:
-        conn = self._connect_db()
-        cur = conn.cursor()
-
-        # Correct column names based on your JSON
-        cur.execute("SELECT page, sura_ids, start_id, ayas_count FROM pages WHERE page = ?", (page_num,))
-        row = cur.fetchone()
-        conn.close()
-
-        if row:
-            page_id = row[0]
-            sura_ids_str = row[1]  # e.g., "112,113,114"
-            start_id = row[2]
-            ayas_count = row[3]
-
-            # Convert to list of integers
-            sura_id_list = [int(s.strip()) for s in sura_ids_str.split(",") if s.strip().isdigit()]
-
-            return PageEntity(
-                id=page_id,
-                sura_id_list= sura_id_list,
-                start_id= start_id,
-                ayas_count= ayas_count
-            )
+    def get_navigation_index(self) -> NavigationIndex:
+        """Page/sura/aya lookup tables, built once from the Pages and Suras tables."""
+        if self._navigation_index is None:
+            self._navigation_index = NavigationIndex(self.get_page_list(), self.get_sura_list())
+        return self._navigation_index
 
-        return None
+    def get_page_info(self, page_num: int) -> Optional[PageEntity]:
+        return self.get_navigation_index().page(page_num)
 
 
     def get_quran_text_range(self, sura_id, start_aya, count):
-        conn = self._connect_db()
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT aya_id, text FROM Ayas WHERE sura_id=? AND aya_id>=? ORDER BY aya_id LIMIT ?",
-            (sura_id, start_aya, count)
-        )
-        rows = cur.fetchall()
-        conn.close()
-        return rows
+        sura_range = self.get_aya_numbering().sura_range(sura_id)
+        if not sura_range or count <= 0:
+            return []
+        first = sura_range[0] + max(start_aya, 1) - 1
+        last = min(first + count - 1, sura_range[1])
+        return self.db.fetchall("SELECT aya_id, text FROM Ayas WHERE id BETWEEN ? AND ? ORDER BY id", (first, last))
     
 
     def get_first_page_for_sura(self, sura_id: int) -> Optional[PageEntity]:
+        """Returns the first PageEntity on which the given sura appears."""
+        return self.get_navigation_index().first_page_for_sura(sura_id)
+
+
+    def fetch_page_text(self, page: PageEntity) -> List[Tuple[int, int, str]]:
         """
-        Returns the first PageEntity where the given sura_id is included in the sura_ids field.
-        Assumes 'sura_ids' is a comma-separated string like '2,3,4'.
-        """
-        query = """
-            SELECT page, sura_ids, start_id, ayas_count
-            FROM pages
-            ORDER BY page ASC
+        Fetch the page's ayas by their global aya numbers (a primary-key range).
+        Returns ayas as a list of (sura_id, aya_id, text) tuples.
         """
+        try:
+            if page.start_aya is None:
+                raise ValueError("PageEntity.start_aya is missing.")
 
-        with sqlite3.connect(self.db_file) as conn:
-            conn.row_factory = sqlite3.Row
-            cur = conn.cursor()
-            cur.execute(query)
-            rows = cur.fetchall()
+            return self.db.fetchall(
+                "SELECT sura_id, aya_id, text FROM Ayas WHERE id BETWEEN ? AND ? ORDER BY id",
+                (page.start_aya, page.end_aya)
+            )
 
-            for row in rows:
-                sura_ids_str = row["sura_ids"]
-                sura_id_list = [int(s.strip()) for s in sura_ids_str.split(",") if s.strip().isdigit()]
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Error while fetching page text: {e}")
+            return []
 
-                if sura_id in sura_id_list:
-                    return PageEntity(
-                        id=row["page"],
-                        sura_id_list=sura_id_list,
-                        start_id=row["start_id"],
-                        ayas_count=row["ayas_count"]
-                    )
 
-        return None
+    def get_aya_words(self, first_id: int, last_id: int) -> Dict[int, List[Tuple[int, int, int, int, str]]]:
+        """
+        {aya_number: [(word_index, position, char_start, char_end, form), ...]}
+        from the Words table for the global aya range [first_id, last_id].
+        """
+        words: Dict[int, List[Tuple[int, int, int, int, str]]] = {}
+        try:
+            rows = self.db.fetchall(
+                "SELECT aya_number, word_index, position, char_start, char_end, form FROM Words "
+                "WHERE aya_number BETWEEN ? AND ? ORDER BY aya_number, word_index", (first_id, last_id))
+        except sqlite3.Error as e:
+            print(f"[ERROR] Reading words of ayas {first_id}-{last_id} failed: {e}")
+            return words
+        for aya_number, *word in rows:
+            words.setdefault(aya_number, []).append(tuple(word))
+        return words
+
+    def fetch_page_words(self, page: PageEntity) -> Dict[Tuple[int, int], List[Tuple[int, int, int]]]:
+        """{(sura_id, aya_id): [(word_index, char_start, char_end), ...]} of the page's ayas, for the renderer."""
+        index = self.get_navigation_index()
+        aya_range = index.page_aya_range(page.id)
+        if not aya_range:
+            return {}
+        words = self.get_aya_words(*aya_range)
+        return {
+            (sura_id, aya_id): [(word_index, start, end) for word_index, _, start, end, _ in words[aya_number]]
+            for sura_id, aya_id, aya_number in index.numbering.iter_ayas(*aya_range)
+            if aya_number in words
+        }
+
+    def get_edition_text(self, edition: str, first_id: int, last_id: int) -> List[Tuple[int, str]]:
+        """(aya_number, text) of a mirrored edition for the global aya range [first_id, last_id]."""
+        try:
+            return self.db.fetchall(
+                "SELECT aya_number, text FROM EditionAyas WHERE edition = ? AND aya_number BETWEEN ? AND ? "
+                "ORDER BY aya_number", (edition, first_id, last_id))
+        except sqlite3.Error as e:
+            print(f"[ERROR] Reading edition {edition} failed: {e}")
+            return []
 
+    def get_editions_text(self, editions: Sequence[str], first_id: int, last_id: int) -> Dict[str, Dict[int, str]]:
+        """{edition: {aya_number: text}} for several editions over a global aya range, in one query."""
+        result: Dict[str, Dict[int, str]] = {edition: {} for edition in editions}
+        if not editions:
+            return result
+        placeholders = ", ".join("?" * len(editions))
+        try:
+            rows = self.db.fetchall(
+                f"SELECT edition, aya_number, text FROM EditionAyas "
+                f"WHERE edition IN ({placeholders}) AND aya_number BETWEEN ? AND ?",
+                (*editions, first_id, last_id))
+        except sqlite3.Error as e:
+            print(f"[ERROR] Reading editions {list(editions)} failed: {e}")
+            return result
+        for edition, aya_number, text in rows:
+            result[edition][aya_number] = text
+        return result
 
+    def fetch_page_editions(self, page: PageEntity, editions: Sequence[str]) -> List[Tuple[int, int, str, Tuple[Optional[str], ...]]]:
+        """
+        The page's ayas as (sura_id, aya_id, text, edition_texts): the Arabic text
+        from the text source plus one entry per requested edition (None where
+        that edition lacks the aya), fetched for all editions in one query.
+        """
+        ayas = self.get_text_source().fetch_page_text(page)
+        aya_range = self.get_navigation_index().page_aya_range(page.id)
+        if not ayas or not aya_range:
+            return [(sura_id, aya_id, text, ()) for sura_id, aya_id, text in ayas]
+        texts = self.get_editions_text(editions, *aya_range)
+        columns = [texts[edition] for edition in editions]
+        first = aya_range[0]
+        return [
+            (sura_id, aya_id, text, tuple(column.get(first + offset) for column in columns))
+            for offset, (sura_id, aya_id, text) in enumerate(ayas)
+        ]
+
+    def get_edition_list(self) -> List[EditionEntity]:
+        """Text editions mirrored into the database."""
+        try:
+            rows = self.db.fetchall(
+                "SELECT identifier, language, name, english_name, format, type FROM Editions ORDER BY identifier")
+        except sqlite3.Error as e:
+            print(f"[ERROR] Reading editions failed: {e}")
+            return []
+        return [EditionEntity(*row) for row in rows]
 
+    def store_edition_text(self, edition: str, rows: List[Tuple[int, str]]) -> bool:
+        """Upsert (aya_number, text) rows of `edition` into EditionAyas."""
+        return self._executemany(
+            "INSERT OR REPLACE INTO EditionAyas (edition, aya_number, text) VALUES (?, ?, ?)",
+            [(edition, aya_number, text) for aya_number, text in rows])
 
-    def fetch_page_text(self, page: PageEntity) -> List[Tuple[int, int, str]]:
+    def _executemany(self, sql: str, rows: List[tuple]) -> bool:
+        """Run one write transaction on a short-lived writable connection (the pool is read-only)."""
+        try:
+            conn = sqlite3.connect(self.db_file)
+            try:
+                with conn:
+                    conn.executemany(sql, rows)
+            finally:
+                conn.close()
+            return True
+        except sqlite3.Error as e:
+            print(f"[ERROR] Writing to {self.db_file} failed: {e}")
+            return False
+
+    def get_search_backend(self):
         """
-        Fetch ayas starting from a specific (sura_id, aya_id), using global Quranic ID order.
-        Returns ayas as a list of (sura_id, aya_id, text) tuples.
+        Backend answering search(), chosen by config "search_backend": "fts5"
+        uses the FTS5 index built by migration (or here, if the migration ran
+        on an sqlite3 without FTS5), "trigram" the pure-Python trigram index
+        cached in "search_index_path", and "auto" (the default) FTS5 when this
+        sqlite3 could build the index, else the trigram index.
         """
-        query = """
-            SELECT sura_id, aya_id, text
-            FROM Ayas
-            WHERE id >= (
-                SELECT id FROM Ayas WHERE sura_id = ? AND aya_id = ?
-            )
-            ORDER BY id
-            LIMIT ?
+        if self._search_backend is None:
+            choice = self.config.get('search_backend', 'auto')
+            if choice not in self.SEARCH_BACKENDS:
+                print(f"[WARN] Unknown search_backend '{choice}', expected one of {self.SEARCH_BACKENDS}; using auto")
+                choice = 'auto'
+            fts = FtsSearchBackend(self.db)
+            if choice != 'trigram' and not fts.is_available() and self._build_search_index():
+                fts = FtsSearchBackend(self.db)
+            if choice == 'fts5' or (choice == 'auto' and fts.is_available()):
+                if not fts.is_available():
+                    print("[WARN] search_backend 'fts5' configured but the FTS5 index is missing")
+                self._search_backend = fts
+            else:
+                self._search_backend = TrigramSearchBackend(
+                    self.db, self.config.get('search_index_path', 'data/quran_search.tri'))
+        return self._search_backend
+
+    def _build_search_index(self) -> bool:
+        """
+        Build the FTS5 index that migration 6 skipped because the sqlite3 that
+        ran it had no FTS5. Returns False if this one has none either.
         """
-
         try:
-            with self._connect_db() as conn:
-                cur = conn.cursor()
-                start_sura_id = page.sura_id_list[0] if page.sura_id_list else None
-                print(f"page.id: {page.id} start_sura_id: {start_sura_id} aya_id: {page.start_id} ayas_count: {page.ayas_count}")
-
-                if start_sura_id is None:
-                    raise ValueError("PageEntity.sura_id_list is empty or missing.")
+            conn = sqlite3.connect(self.db_file)
+            try:
+                with conn:
+                    built = build_fts_index(conn)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"[ERROR] Building the search index in {self.db_file} failed: {e}")
+            return False
+        if built:
+            print(f"[INFO] Built the FTS5 search index missing from {self.db_file}")
+        return built
 
-                cur.execute(query, (start_sura_id, page.start_id, page.ayas_count))
-                result = cur.fetchall()
-                return result
+    def search(self, query: str, limit: int = 50) -> List[SearchResultEntity]:
+        """
+        Ayas matching `query` (see SearchQuery for the syntax), best first, with
+        their page and a snippet of the matching words. Matching ignores
+        tashkeel, tatweel and alef/hamza spelling variants.
+        """
+        parsed = SearchQuery.parse(query)
+        backend = self.get_search_backend()
+        if not parsed or not backend.is_available():
+            return []
+        try:
+            hits = backend.search(parsed, limit)
+            if not hits:
+                return []
+            placeholders = ", ".join("?" * len(hits))
+            aya_numbers = [aya_number for aya_number, _ in hits]
+            texts = dict(self.db.fetchall(f"SELECT id, text FROM Ayas WHERE id IN ({placeholders})", aya_numbers))
+            spellings = backend.get_normalized_words(aya_numbers)
+        except sqlite3.Error as e:
+            print(f"[ERROR] Search for {query!r} failed: {e}")
+            return []
 
-        except (sqlite3.Error, ValueError) as e:
-            print(f"Error while fetching page text: {e}")
+        index = self.get_navigation_index()
+        results = []
+        for aya_number, score in hits:
+            sura_id, aya_id = index.from_global(aya_number)
+            page = index.page_for_global_aya(aya_number)
+            results.append(SearchResultEntity(sura_id, aya_id, page.id if page else None,
+                                              make_snippet(texts[aya_number], parsed,
+                                                           spellings=spellings.get(aya_number)),
+                                              aya_number, score))
+        return results
+
+    def get_root_index(self) -> RootIndex:
+        if self._root_index is None:
+            self._root_index = RootIndex(self.db)
+        return self._root_index
+
+    def import_morphology(self, path: str) -> Optional[ImportResult]:
+        """Fill the root index from a Quranic Arabic Corpus morphology file."""
+        try:
+            conn = sqlite3.connect(self.db_file)
+            try:
+                return import_morphology(conn, path)
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error) as e:
+            print(f"[ERROR] Importing morphology from {path} failed: {e}")
+            return None
+
+    def search_root(self, root: str, limit: int = 50) -> List[SearchResultEntity]:
+        """
+        Ayas containing a word derived from `root` ("ك ت ب", "كتب" or Buckwalter
+        "ktb"), in mushaf order, with the derived words as word_indexes and
+        marked in the snippet. Empty until a morphology file has been imported.
+        """
+        try:
+            ayas = self.get_root_index().find_root_ayas(root)
+            hits = list(ayas)[:limit]
+            if not hits:
+                return []
+            placeholders = ", ".join("?" * len(hits))
+            texts = dict(self.db.fetchall(f"SELECT id, text FROM Ayas WHERE id IN ({placeholders})", hits))
+            positions = {}
+            for aya_number, word_index, position in self.db.fetchall(
+                    f"SELECT aya_number, word_index, position FROM Words WHERE aya_number IN ({placeholders})", hits):
+                positions[aya_number, word_index] = position
+        except sqlite3.Error as e:
+            print(f"[ERROR] Root search for {root!r} failed: {e}")
             return []
 
+        index = self.get_navigation_index()
+        results = []
+        for aya_number in hits:
+            sura_id, aya_id = index.from_global(aya_number)
+            page = index.page_for_global_aya(aya_number)
+            marked = [positions[aya_number, word_index] for word_index in ayas[aya_number]]
+            results.append(SearchResultEntity(sura_id, aya_id, page.id if page else None,
+                                              make_snippet(texts[aya_number], None, positions=marked),
+                                              aya_number, word_indexes=ayas[aya_number]))
+        return results
+
+    def get_similarity_index(self) -> SimilarityIndex:
+        """
+        The most similar ayas of every aya, loaded from config "similarity_index_path"
+        or built (MinHash/LSH, a second or two) and written there on first use.
+        """
+        with self._similarity_lock:
+            if self._similarity_index is None:
+                self._similarity_index = self._load_similarity_index()
+            return self._similarity_index
+
+    def is_similarity_index_ready(self) -> bool:
+        """True once get_similarity_index() returns without loading or building anything."""
+        return self._similarity_index is not None
+
+    def _load_similarity_index(self) -> SimilarityIndex:
+        path = self.config.get('similarity_index_path', 'data/quran_similar.bin')
+        aya_count = self.get_aya_numbering().total_ayas
+        if os.path.exists(path):
+            try:
+                index = SimilarityIndex.load(path)
+                if index.aya_count == aya_count:
+                    return index
+                print(f"[WARN] Rebuilding similarity index {path}: built for {index.aya_count} ayas, not {aya_count}")
+            except (OSError, ValueError) as e:
+                print(f"[WARN] Rebuilding similarity index {path}: {e}")
+        print(f"[INFO] Building similarity index: {path}")
+        index = SimilarityIndex.build(self.db.fetchall("SELECT id, text FROM Ayas ORDER BY id"))
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            index.save(path)
+        except OSError as e:
+            print(f"[WARN] Could not write similarity index {path}: {e}")
+        return index
+
+    def get_similar_ayas(self, sura_id: int, aya_id: int, limit: int = 10) -> List[SimilarAyaEntity]:
+        """The ayas most similar to (sura_id, aya_id), most similar first: one index lookup and one text query."""
+        index = self.get_navigation_index()
+        if not index.numbering.is_valid(sura_id, aya_id):
+            return []
+        similar = self.get_similarity_index().similar(index.to_global(sura_id, aya_id))[:limit]
+        if not similar:
+            return []
+        placeholders = ", ".join("?" * len(similar))
+        try:
+            texts = dict(self.db.fetchall(f"SELECT id, text FROM Ayas WHERE id IN ({placeholders})",
+                                          [aya_number for aya_number, _ in similar]))
+        except sqlite3.Error as e:
+            print(f"[ERROR] Reading ayas similar to {sura_id}:{aya_id} failed: {e}")
+            return []
+        results = []
+        for aya_number, similarity in similar:
+            other_sura, other_aya = index.from_global(aya_number)
+            page = index.page_for_global_aya(aya_number)
+            results.append(SimilarAyaEntity(other_sura, other_aya, page.id if page else None,
+                                            texts[aya_number], aya_number, similarity))
+        return results
+
+    def get_division_index(self) -> DivisionIndex:
+        """
+        Juz/hizb/quarter/manzil/ruku starts and sajda ayas by global aya number, read once:
+        meta_data.xml (config "metadata_file"), with the juz, quarter and sajda lists
+        taken from config "juz_file", "hizb_file" and "sajda_file" (config/*.json).
+        """
+        if self._division_index is None:
+            divisions = {}
+            xml_path = self.config.get('metadata_file', METADATA_FILE)
+            try:
+                divisions.update(read_metadata_xml(xml_path))
+            except (OSError, ValueError, KeyError) as e:
+                print(f"[WARN] Could not read division metadata {xml_path}: {e}")
+            for kind, key, name in (("juz", 'juz_file', 'juz.json'), ("quarter", 'hizb_file', 'hizb.json'),
+                                    ("sajda", 'sajda_file', 'sajda.json')):
+                path = self.config.get(key, os.path.join(CONFIG_DIR, name))
+                try:
+                    divisions[kind] = read_metadata_json(path)
+                except (OSError, ValueError, KeyError, TypeError) as e:
+                    print(f"[WARN] Could not read {kind} metadata {path}: {e}")
+
+            numbering = self.get_aya_numbering()
+            starts, sajdas = {}, {}
+            for kind, entries in divisions.items():
+                valid = [(sura, aya, kind_type) for _, sura, aya, kind_type in entries if numbering.is_valid(sura, aya)]
+                if len(valid) != len(entries):
+                    print(f"[WARN] Skipped {len(entries) - len(valid)} {kind} entries with unknown ayas")
+                if kind == "sajda":
+                    sajdas = {numbering.to_global(sura, aya): kind_type or "recommended" for sura, aya, kind_type in valid}
+                else:
+                    starts[kind] = [numbering.to_global(sura, aya) for sura, aya, _ in valid]
+            self._division_index = DivisionIndex(starts, sajdas)
+        return self._division_index
+
+    def get_sajda_ayas(self) -> Dict[Tuple[int, int], str]:
+        """{(sura_id, aya_id): "recommended" | "obligatory"} of the sajda ayas."""
+        numbering = self.get_aya_numbering()
+        return {numbering.from_global(aya_number): sajda_type
+                for aya_number, sajda_type in self.get_division_index().sajdas.items()}
+
+    def get_first_page_for_division(self, kind: str, number: int) -> Optional[PageEntity]:
+        """The page on which juz/hizb/quarter/... `number` starts."""
+        try:
+            aya_number = self.get_division_index().start_of(kind, number)
+        except ValueError as e:
+            print(f"[ERROR] {e}")
+            return None
+        return self.get_navigation_index().page_for_global_aya(aya_number) if aya_number else None
+
+    def get_corpus_stats(self) -> CorpusStats:
+        """Word/letter statistics over the Words table by sura, page, juz and hizb (needs numpy)."""
+        index = self.get_navigation_index()
+        divisions = self.get_division_index()
+        pages = self.get_page_list()
+        segment_starts = {
+            "sura": [index.numbering.sura_range(sura.id)[0] for sura in self.get_sura_list()],
+            "page": [index.page_aya_range(page.id)[0] for page in pages],
+            "juz": divisions.starts("juz"),
+            "hizb": divisions.starts("hizb"),
+        }
+        words = self.db.fetchall("SELECT aya_number, word_index, form FROM Words ORDER BY aya_number, word_index")
+        return CorpusStats(words, segment_starts)
 
     def get_sura_info(self, sura_id: int):
-        conn = sqlite3.connect(self.db_file)
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM Suras WHERE id = ?", (sura_id,))
+        cur = self.db.execute("SELECT * FROM Suras WHERE id = ?", (sura_id,))
         row = cur.fetchone()
         return dict(zip([col[0] for col in cur.description], row)) if row else None
 
     def get_sura_list(self) -> List[SuraEntity]:
         """Fetch all suras and convert them into SuraEntity objects."""
-        conn = sqlite3.connect(self.db_file)
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM Suras ORDER BY id")
-        rows = cur.fetchall()
-        conn.close()
+        rows = self.db.fetchall("SELECT * FROM Suras ORDER BY id")
 
         return [
             SuraEntity(
@@ -183,18 +573,15 @@ class QuranLocalDataSource:
 
     def get_page_list(self) -> List[PageEntity]:
         """Fetch all pages and convert them into PageEntity objects."""
-        conn = sqlite3.connect(self.db_file)
-        cur = conn.cursor()
-        cur.execute("SELECT page, start_id, ayas_count, sura_ids FROM Pages ORDER BY page")
-        rows = cur.fetchall()
-        conn.close()
+        rows = self.db.fetchall("SELECT page, start_id, ayas_count, sura_ids, start_aya FROM Pages ORDER BY page")
 
         return [
             PageEntity(
                 id=row[0],
                 start_id=row[1],
                 ayas_count=row[2],
-                sura_id_list=[int(sid) for sid in row[3].split(',')]
+                sura_id_list=[int(sid) for sid in row[3].split(',')],
+                start_aya=row[4]
             )
             for row in rows
         ]
@@ -202,11 +589,7 @@ class QuranLocalDataSource:
 
     def get_reciter_list(self) -> List[ReciterEntity]:
         """Fetch all reciters and convert them into ReciterEntity objects."""
-        conn = sqlite3.connect(self.db_file)
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM Reciters ORDER BY id")
-        rows = cur.fetchall()
-        conn.close()
+        rows = self.db.fetchall("SELECT * FROM Reciters ORDER BY id")
 
         return [
             ReciterEntity(
@@ -220,112 +603,66 @@ class QuranLocalDataSource:
 
 
     def get_audio_playlist_by_range(self, first_sura, first_aya, last_sura, last_aya, reciter):
-        conn = sqlite3.connect(self.db_file)
-        cur = conn.cursor()
-        base_folder = "C:\\Flutter\\Quran\\quran_data\\audio\\"
-        table_name = f"Audio_{reciter}"
-
+        index = self.get_navigation_index()
         try:
-            # Get all ayas in the range [first_sura:aya .. last_sura:aya], ordered
-            cur.execute("""
-                SELECT sura_id, aya_id
-                FROM Ayas
-                WHERE (sura_id > ? OR (sura_id = ? AND aya_id >= ?))
-                AND (sura_id < ? OR (sura_id = ? AND aya_id <= ?))
-                ORDER BY sura_id, aya_id
-            """, (first_sura, first_sura, first_aya, last_sura, last_sura, last_aya))
-            aya_list = cur.fetchall()
-            playlist = []
-            for sura_id, aya_id in aya_list:
-                cur.execute(f"""
-                    SELECT audio_url
-                    FROM '{table_name}'
-                    WHERE sura_id = ? AND aya_id = ?
-                """, (sura_id, aya_id))
-                row = cur.fetchone()
-                if row:
-                    audio_url = row[0]
-                    if audio_url.startswith(('http://', 'https://')):
-                        full_path = audio_url
-                    elif os.path.isabs(audio_url):
-                        full_path = audio_url
-                    else:
-                        full_path = os.path.join(base_folder, audio_url)
-                    playlist.append((sura_id, aya_id, full_path))
-                else:
-                    print(f"[WARN] No audio found for {sura_id}:{aya_id}")
-
+            first_id = index.to_global(first_sura, first_aya)
+            last_id = index.to_global(last_sura, last_aya)
+        except KeyError:
+            print(f"[ERROR] Invalid playlist range {first_sura}:{first_aya}-{last_sura}:{last_aya}")
+            return []
+        return self._get_playlist(reciter, first_id, last_id)
+
+    def _get_playlist(self, reciter, first_id, last_id):
+        """Cached playlist for the global aya range [first_id, last_id]."""
+        key = (reciter, first_id, last_id)
+        playlist = self.playlist_cache.get(key)
+        if playlist is None:
+            playlist = self._resolve_playlist(reciter, first_id, last_id)
+            if playlist:
+                self.playlist_cache.put(key, tuple(playlist))
             return playlist
+        return list(playlist)
 
-        except sqlite3.Error as e:
-            print(f"[ERROR] SQLite error in get_audio_playlist_by_range: {e}")
+    def _resolve_playlist(self, reciter, first_id, last_id):
+        """Compute (sura_id, aya_id, path) for a global aya range from the reciter's template."""
+        catalog = self.get_audio_catalog()
+        if not catalog.has_reciter(reciter):
+            print(f"[ERROR] Unknown reciter: {reciter}")
             return []
-
-        finally:
-            conn.close()
-
+        return catalog.playlist(reciter, self.get_navigation_index().iter_ayas(first_id, last_id))
+
+    def store_audio_urls(self, reciter: str, rows: List[Tuple[int, int, str]]) -> bool:
+        """Write (sura_id, aya_id, url) rows for `reciter` to AudioOverrides (write-back from remote)."""
+        written = self._executemany(
+            "INSERT OR REPLACE INTO AudioOverrides (reciter_key, sura_id, aya_id, audio_url) VALUES (?, ?, ?, ?)",
+            [(reciter, sura_id, aya_id, url) for sura_id, aya_id, url in rows])
+        if written:
+            self.get_audio_catalog().add_overrides(reciter, {(sura_id, aya_id): url for sura_id, aya_id, url in rows})
+            self.playlist_cache.clear()
+        return written
+
+    def get_audio_catalog(self) -> AudioCatalog:
+        """Reciter URL templates and overrides, loaded once."""
+        if self._audio_catalog is None:
+            self._audio_catalog = AudioCatalog.from_connection_manager(
+                self.db, self.config.get('audio_base_dir', 'data/audio'))
+        return self._audio_catalog
+
+    def get_playlist_cache_stats(self):
+        """Hit/miss counters of the playlist cache."""
+        return self.playlist_cache.get_stats()
 
 
     def get_sura_playlist(self, sura_id, reciter):
-        conn = sqlite3.connect(self.db_file)
-        cur = conn.cursor()
-        try:
-            # Get the first and last aya of the sura
-            cur.execute("""
-                SELECT MIN(aya_id), MAX(aya_id)
-                FROM Ayas
-                WHERE sura_id = ?
-            """, (sura_id,))
-            result = cur.fetchone()
-            if not result:
-                return []
-
-            first_aya, last_aya = result
-            print(f"first_aya: {first_aya} last_aya: {last_aya}")
-            return self.get_audio_playlist_by_range(sura_id, first_aya, sura_id, last_aya, reciter)
-
-        except sqlite3.Error as e:
-            print(f"[ERROR] in get_sura_playlist: {e}")
+        index = self.get_navigation_index()
+        sura = index.sura(sura_id)
+        if not sura:
             return []
-        finally:
-            conn.close()
+        return self._get_playlist(reciter, index.to_global(sura_id, 1), index.to_global(sura_id, sura.ayas))
 
 
     def get_page_playlist(self, page_number, reciter):
-        conn = sqlite3.connect(self.db_file)
-        cur = conn.cursor()
-
-        try:
-            # Get page metadata
-            cur.execute("""
-                SELECT sura_id, aya_id, ayas_count
-                FROM pages
-                WHERE page = ?
-            """, (page_number,))
-            result = cur.fetchone()
-            if not result:
-                return []
-
-            start_sura, start_aya, ayas_count = result
-
-            # Get the last aya for the page
-            cur.execute("""
-                SELECT sura_id, aya_id
-                FROM Ayas
-                WHERE (sura_id > ?) OR (sura_id = ? AND aya_id >= ?)
-                ORDER BY sura_id, aya_id
-                LIMIT ?
-            """, (start_sura, start_sura, start_aya, ayas_count))
-            aya_rows = cur.fetchall()
-            if not aya_rows:
-                return []
-
-            end_sura, end_aya = aya_rows[-1]
-
-            return self.get_audio_playlist_by_range(start_sura, start_aya, end_sura, end_aya, reciter)
-
-        except sqlite3.Error as e:
-            print(f"[ERROR] in get_page_playlist: {e}")
+        aya_range = self.get_navigation_index().page_aya_range(page_number)
+        if not aya_range:
             return []
-        finally:
-            conn.close()
+        return self._get_playlist(reciter, *aya_range)
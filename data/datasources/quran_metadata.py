@@ -0,0 +1,44 @@
+#data/datasources/quran_metadata.py
+"""
+Readers for the division metadata shipped with the app.
+
+meta_data.xml is the Tanzil metadata (juz, hizb quarters, manzils, rukus,
+pages, sajdas as `<juz index=".." sura=".." aya=".."/>` elements);
+config/juz.json, config/hizb.json and config/sajda.json hold the same juz,
+quarter and sajda lists as JSON. Both readers return
+{kind: [(index, sura, aya, type)]} with type set for sajdas only.
+"""
+import json
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional, Tuple
+
+Division = Tuple[int, int, int, Optional[str]]  # index, sura, aya, type
+
+# XML element -> division kind (the 240 hizb entries are quarters)
+XML_KINDS = {"juz": "juz", "quarter": "quarter", "manzil": "manzil", "ruku": "ruku", "sajda": "sajda"}
+
+
+def _division(entry) -> Division:
+    return int(entry["index"]), int(entry["sura"]), int(entry["aya"]), entry.get("type")
+
+
+def read_metadata_xml(path: str) -> Dict[str, List[Division]]:
+    """Divisions and sajdas of a Tanzil metadata file, sorted by index."""
+    try:
+        root = ET.parse(path).getroot()
+    except ET.ParseError as e:
+        raise ValueError(f"{path}: {e}") from e
+    divisions: Dict[str, List[Division]] = {}
+    for element in root.iter():
+        kind = XML_KINDS.get(element.tag)
+        if kind:
+            divisions.setdefault(kind, []).append(_division(element.attrib))
+    for entries in divisions.values():
+        entries.sort()
+    return divisions
+
+
+def read_metadata_json(path: str) -> List[Division]:
+    """One division list ([{"index", "sura", "aya"[, "type"]}, ...]), sorted by index."""
+    with open(path, "r", encoding="utf-8") as f:
+        return sorted(_division(entry) for entry in json.load(f))
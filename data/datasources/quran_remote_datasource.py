@@ -1,21 +1,157 @@
-import requests
-from typing import List, Optional
+import asyncio
+import http.client
+import json
+from typing import Iterable, List, Optional
 from domain.entities.sura_entity import SuraEntity
 from domain.entities.page_entity import PageEntity
+from data.datasources.disk_cache import DiskCache
+from data.datasources.http_client import AsyncHttpClient, EventLoopThread, HttpError
 
 
 class QuranRemoteDataSource:
+    """
+    alquran.cloud API client.
+
+    The `fetch_*` coroutines are the primitive API and share one pooled
+    AsyncHttpClient, so e.g. `await remote.fetch_suras(range(1, 115))` downloads
+    all suras concurrently within the per-host limit. The synchronous methods
+    keep the datasource contract and run those coroutines on a private loop.
+
+    With a DiskCache every resource is downloaded once, revalidated after the
+    cache TTL, and served stale when the network is unreachable.
+    """
     BASE_URL = "https://api.alquran.cloud/v1"
 
-    def __init__(self, edition: str = "ar.alafasy"):
+    def __init__(self, edition: str = "ar.alafasy", base_url: Optional[str] = None,
+                 client: Optional[AsyncHttpClient] = None, cache: Optional[DiskCache] = None):
         self.edition = edition
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self._owns_client = client is None
+        self.client = client or AsyncHttpClient()
+        self.cache = cache
+        self._loop = EventLoopThread("quran-remote")
+
+    @classmethod
+    def from_config(cls, config: dict) -> "QuranRemoteDataSource":
+        """Build from the "remote" block of config.json."""
+        remote = config.get("remote", {})
+        cache_dir = remote.get("cache_dir")
+        cache = DiskCache(cache_dir, ttl=remote.get("cache_ttl", 30 * 24 * 3600),
+                          max_bytes=remote.get("cache_max_bytes", 256 * 1024 * 1024)) if cache_dir else None
+        client = AsyncHttpClient(max_per_host=remote.get("max_per_host", 6),
+                                 timeout=remote.get("timeout", 10.0),
+                                 retries=remote.get("retries", 3))
+        datasource = cls(remote.get("edition", "ar.alafasy"), remote.get("base_url"), client, cache)
+        datasource._owns_client = True
+        return datasource
+
+    def close(self):
+        self._loop.stop()
+        if self._owns_client:
+            self.client.close()
+
+    def _run(self, coro):
+        return self._loop.run(coro)
+
+    # --- async API ---
+    async def fetch(self, path: str):
+        """GET `path` below the API root and return the response's `data` member."""
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        body = await self._get_body(url) if self.cache else (await self.client.get(url)).body
+        return json.loads(body.decode("utf-8"))["data"]
+
+    async def _get_body(self, url: str) -> bytes:
+        cache = self.cache
+        entry = cache.lookup(url)
+        if entry and cache.is_fresh(entry):
+            body = cache.read(entry)
+            if body is not None:
+                return body
+            entry = None
+        try:
+            response = await self.client.get(url, entry.validators() if entry else None, ok_statuses=(304,))
+        except (OSError, http.client.HTTPException, HttpError) as e:
+            if entry and not (isinstance(e, HttpError) and e.status == 404):
+                body = cache.read(entry, "stale")
+                if body is not None:
+                    print(f"[WARN] Serving cached {url} after fetch failed: {e}")
+                    return body
+            raise
+        if response.status == 304 and entry:
+            cache.refresh(entry)
+            body = cache.read(entry, "revalidated")
+            if body is not None:
+                return body
+            response = await self.client.get(url)
+        cache.record_miss()
+        cache.store(url, response.body, response.headers.get("etag"), response.headers.get("last-modified"))
+        return response.body
+
+    async def warm_async(self, editions: Iterable[str], sura_ids: Iterable[int] = range(1, 115)) -> int:
+        """Prefetch every sura of each edition (plus the sura list); returns the number of resources."""
+        sura_ids = list(sura_ids)
+        results = await asyncio.gather(
+            self.fetch_sura_list(),
+            *(self.fetch_suras(sura_ids, edition) for edition in editions))
+        return 1 + sum(len(suras) for suras in results[1:])
+
+    def warm(self, editions: Optional[Iterable[str]] = None, sura_ids: Iterable[int] = range(1, 115)) -> int:
+        """Bulk-prefetch editions into the disk cache so later sessions can run offline."""
+        try:
+            return self._run(self.warm_async(editions or [self.edition], sura_ids))
+        except Exception as e:
+            print(f"[ERROR] Cache warm-up failed: {e}")
+            return 0
+
+    def get_cache_stats(self) -> dict:
+        stats = self.cache.get_stats() if self.cache else {}
+        stats.update(self.client.get_stats())
+        return stats
+
+    async def fetch_sura_list(self) -> List[dict]:
+        return await self.fetch("surah")
+
+    async def fetch_sura(self, sura_id: int, edition: Optional[str] = None,
+                         offset: Optional[int] = None, limit: Optional[int] = None) -> dict:
+        path = f"surah/{sura_id}/{edition or self.edition}"
+        if offset is not None or limit is not None:
+            path += f"?offset={offset or 0}&limit={limit or 0}"
+        return await self.fetch(path)
+
+    async def fetch_suras(self, sura_ids: Iterable[int], edition: Optional[str] = None) -> List[dict]:
+        """Fetch several suras concurrently, in the order given."""
+        return list(await asyncio.gather(*(self.fetch_sura(sura_id, edition) for sura_id in sura_ids)))
+
+    async def fetch_ayah(self, sura_id: int, aya_id: int, edition: Optional[str] = None) -> dict:
+        return await self.fetch(f"ayah/{sura_id}:{aya_id}/{edition or self.edition}")
+
+    async def fetch_editions(self, format: str = "audio", type: str = "versebyverse") -> List[dict]:
+        return await self.fetch(f"edition?format={format}&type={type}")
+
+    async def fetch_page(self, page_num: int, edition: Optional[str] = None) -> dict:
+        return await self.fetch(f"page/{page_num}/{edition or self.edition}")
+
+    def get_sura_data(self, sura_id: int, edition: Optional[str] = None) -> Optional[dict]:
+        """Raw /surah payload (None on failure), e.g. for write-back into the local database."""
+        try:
+            return self._run(self.fetch_sura(sura_id, edition))
+        except Exception as e:
+            print(f"Error fetching sura {sura_id} ({edition or self.edition}): {e}")
+            return None
+
+    def get_page_data(self, page_num: int, edition: Optional[str] = None) -> Optional[dict]:
+        """Raw /page payload (None on failure)."""
+        try:
+            return self._run(self.fetch_page(page_num, edition))
+        except Exception as e:
+            print(f"Error fetching page {page_num} ({edition or self.edition}): {e}")
+            return None
 
+    # --- datasource contract ---
     def get_sura_list(self) -> List[SuraEntity]:
         """Fetch the list of surahs."""
         try:
-            response = requests.get(f"{self.BASE_URL}/surah")
-            response.raise_for_status()
-            suras = response.json()["data"]
+            suras = self._run(self.fetch_sura_list())
             return [
                 SuraEntity(
                     id=sura["number"],
@@ -33,9 +169,7 @@ class QuranRemoteDataSource:
     def get_aya_list(self, sura_id: int) -> List[int]:
         """Get list of ayah numbers in a surah."""
         try:
-            response = requests.get(f"{self.BASE_URL}/surah/{sura_id}")
-            response.raise_for_status()
-            ayahs = response.json()["data"]["ayahs"]
+            ayahs = self._run(self.fetch_sura(sura_id))["ayahs"]
             return [ayah["numberInSurah"] for ayah in ayahs]
         except Exception as e:
             print(f"Error fetching aya list for sura {sura_id}: {e}")
@@ -45,95 +179,99 @@ class QuranRemoteDataSource:
         """Get Quran text for a full sura or a single ayah."""
         try:
             if aya_id and aya_id != 0:
-                response = requests.get(f"{self.BASE_URL}/ayah/{sura_id}:{aya_id}")
-                response.raise_for_status()
-                ayah = response.json()["data"]
+                ayah = self._run(self.fetch_ayah(sura_id, aya_id))
                 return [(ayah["numberInSurah"], ayah["text"])]
-            else:
-                response = requests.get(f"{self.BASE_URL}/surah/{sura_id}/{self.edition}")
-                response.raise_for_status()
-                ayahs = response.json()["data"]["ayahs"]
-                return [(a["numberInSurah"], a["text"]) for a in ayahs]
+            ayahs = self._run(self.fetch_sura(sura_id))["ayahs"]
+            return [(a["numberInSurah"], a["text"]) for a in ayahs]
         except Exception as e:
             print(f"Error fetching quran text for sura {sura_id}: {e}")
             return []
 
     def get_audio_url(self, sura_id: int, aya_id: int, reciter: Optional[str] = None) -> Optional[str]:
         """Get audio URL for a specific ayah."""
-        reciter_edition = reciter if reciter else self.edition
         try:
-            response = requests.get(f"{self.BASE_URL}/ayah/{sura_id}:{aya_id}/{reciter_edition}")
-            response.raise_for_status()
-            return response.json()["data"]["audio"]
+            return self._run(self.fetch_ayah(sura_id, aya_id, reciter))["audio"]
         except Exception as e:
             print(f"Error fetching audio for {sura_id}:{aya_id}: {e}")
             return None
 
     def get_sura_playlist(self, sura_id: int, reciter: Optional[str] = None) -> List[tuple]:
-        """Get audio playlist for a whole surah."""
-        reciter_edition = reciter if reciter else self.edition
-        try:
-            response = requests.get(f"{self.BASE_URL}/surah/{sura_id}/{reciter_edition}")
-            response.raise_for_status()
-            ayahs = response.json()["data"]["ayahs"]
-            # Not all ayahs have 'audio' key. Check before accessing.
-            playlist = []
-            for a in ayahs:
-                audio_url = a.get("audio")
-                if audio_url:
-                    playlist.append((a["numberInSurah"], audio_url))
-            return playlist
-        except Exception as e:
-            print(f"Error fetching audio playlist for sura {sura_id}: {e}")
-            return []
+        """(sura_id, aya_id, url) for a whole surah, like QuranLocalDataSource."""
+        data = self.get_sura_data(sura_id, reciter)
+        return self._playlist(data["ayahs"], sura_id) if data else []
+
+    def get_page_playlist(self, page_num: int, reciter: Optional[str] = None) -> List[tuple]:
+        data = self.get_page_data(page_num, reciter)
+        return self._playlist(data["ayahs"]) if data else []
+
+    @staticmethod
+    def _playlist(ayahs: List[dict], sura_id: Optional[int] = None) -> List[tuple]:
+        # Sura payloads omit the per-ayah "surah" object that page payloads carry.
+        # Not all ayahs have 'audio' key. Check before accessing.
+        return [(a["surah"]["number"] if "surah" in a else sura_id, a["numberInSurah"], a["audio"])
+                for a in ayahs if a.get("audio")]
 
     def get_reciters(self) -> List[str]:
         """Get list of available audio reciters."""
         try:
-            response = requests.get(f"{self.BASE_URL}/edition?format=audio&type=versebyverse")
-            response.raise_for_status()
-            editions = response.json()["data"]
-            return [e["identifier"] for e in editions]
+            return [e["identifier"] for e in self._run(self.fetch_editions())]
         except Exception as e:
             print(f"Error fetching reciters: {e}")
             return []
 
     def get_page_info(self, page_num: int) -> Optional[PageEntity]:
-        """Page info not supported by this API."""
-        return None
+        """Page layout from the API's /page endpoint."""
+        data = self.get_page_data(page_num)
+        if not data or not data["ayahs"]:
+            return None
+        ayahs = data["ayahs"]
+        sura_ids = list(dict.fromkeys(a["surah"]["number"] for a in ayahs))
+        return PageEntity(id=page_num, sura_id_list=sura_ids, start_id=ayahs[0]["numberInSurah"],
+                          ayas_count=len(ayahs), start_aya=ayahs[0]["number"])
+
+    def fetch_page_text(self, page: PageEntity, edition: Optional[str] = None) -> List[tuple]:
+        """(sura_id, aya_id, text) for the page, like QuranLocalDataSource."""
+        data = self.get_page_data(page.id, edition)
+        if not data:
+            return []
+        return [(a["surah"]["number"], a["numberInSurah"], a["text"]) for a in data["ayahs"]]
 
     def get_ayas_for_page(self, current_page: int) -> List[int]:
         """Not supported by this API."""
         return []
 
     def get_quran_text_range(self, sura_id: int, start_aya: int, count: int) -> List[tuple]:
-        """Get a range of ayahs from a sura."""
-        all_ayahs = self.get_quran_text(sura_id)
-        # Defensive slice: ensure indices are valid
-        start_index = max(start_aya - 1, 0)
-        end_index = start_index + count
-        return all_ayahs[start_index:end_index]
+        """Get a range of ayahs from a sura, downloading only that range."""
+        if count <= 0:
+            return []
+        try:
+            ayahs = self._run(self.fetch_sura(sura_id, offset=max(start_aya - 1, 0), limit=count))["ayahs"]
+            return [(a["numberInSurah"], a["text"]) for a in ayahs]
+        except Exception as e:
+            print(f"Error fetching quran text range for sura {sura_id}: {e}")
+            return []
 
-    def get_first_page_for_sura(self, sura_id: int):
-        """Not supported, return default."""
-        return 1
+    def get_first_page_for_sura(self, sura_id: int) -> Optional[PageEntity]:
+        """The PageEntity holding the sura's first ayah."""
+        data = self.get_sura_data(sura_id)
+        if not data or not data["ayahs"]:
+            return None
+        return self.get_page_info(data["ayahs"][0]["page"])
 
     def get_sura_info(self, sura_id: int) -> Optional[dict]:
-        """Get metadata about a sura."""
-        try:
-            response = requests.get(f"{self.BASE_URL}/surah/{sura_id}")
-            response.raise_for_status()
-            data = response.json()["data"]
-            return {
-                "id": data["number"],
-                "name": data["name"],
-                "englishName": data["englishName"],
-                "numberOfAyahs": data["numberOfAyahs"],
-                "revelationType": data["revelationType"]
-            }
-        except Exception as e:
-            print(f"Error fetching sura info: {e}")
+        """Sura metadata with the same keys as a row of the local Suras table."""
+        data = self.get_sura_data(sura_id)
+        if not data:
             return None
+        return {
+            "id": data["number"],
+            "ayas": data["numberOfAyahs"],
+            "start": data["ayahs"][0]["number"] - 1,
+            "name": data["name"],
+            "tname": data["englishName"],
+            "ename": data.get("englishNameTranslation"),
+            "type": data["revelationType"],
+        }
 
     def get_sura_list_1(self) -> List[int]:
         """Helper to get list of sura IDs."""
@@ -0,0 +1,107 @@
+#data/datasources/sqlite_connection_manager.py
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+
+class SQLiteConnectionManager:
+    """
+    Owns the long-lived read-only connections to the Quran database.
+
+    Each thread gets exactly one connection (opened lazily on first use and
+    kept until close()), so a page turn no longer pays for connect/teardown.
+    Connections are opened in read-only URI mode with mmap and page-cache
+    pragmas and a per-connection prepared statement cache.
+    """
+
+    DEFAULT_MMAP_SIZE = 64 * 1024 * 1024      # bytes
+    DEFAULT_CACHE_SIZE_KIB = 16 * 1024        # negative cache_size => KiB
+    DEFAULT_CACHED_STATEMENTS = 128
+
+    def __init__(self, db_file: str,
+                 mmap_size: int = DEFAULT_MMAP_SIZE,
+                 cache_size_kib: int = DEFAULT_CACHE_SIZE_KIB,
+                 cached_statements: int = DEFAULT_CACHED_STATEMENTS):
+        self.db_file = db_file
+        self.mmap_size = int(mmap_size)
+        self.cache_size_kib = int(cache_size_kib)
+        self.cached_statements = int(cached_statements)
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+        self._closed = False
+
+        self.connections_opened = 0
+        self.queries_executed = 0
+
+    def _uri(self) -> str:
+        return Path(os.path.abspath(self.db_file)).as_uri() + "?mode=ro"
+
+    def _open(self) -> sqlite3.Connection:
+        # check_same_thread=False only so close() can run from the shutdown
+        # thread; confinement is enforced by the thread-local lookup below.
+        conn = sqlite3.connect(
+            self._uri(),
+            uri=True,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+        )
+        conn.execute(f"PRAGMA mmap_size={self.mmap_size}")
+        conn.execute(f"PRAGMA cache_size=-{self.cache_size_kib}")
+        conn.execute("PRAGMA query_only=ON")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        with self._lock:
+            self._connections.append(conn)
+            self.connections_opened += 1
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+        if self._closed:
+            raise sqlite3.ProgrammingError("SQLiteConnectionManager is closed")
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+        return conn
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> sqlite3.Cursor:
+        cursor = self.connection().execute(sql, params)
+        with self._lock:
+            self.queries_executed += 1
+        return cursor
+
+    def fetchall(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        return self.execute(sql, params).fetchall()
+
+    def fetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[tuple]:
+        return self.execute(sql, params).fetchone()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Counters used to verify that page loads reuse connections."""
+        with self._lock:
+            return {
+                "connections_opened": self.connections_opened,
+                "connections_open": len(self._connections),
+                "queries_executed": self.queries_executed,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.connections_opened = len(self._connections)
+            self.queries_executed = 0
+
+    def close(self) -> None:
+        """Close every connection handed out by this manager."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._closed = True
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                print(f"[WARN] Failed to close SQLite connection: {e}")
+        self._local = threading.local()
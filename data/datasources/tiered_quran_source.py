@@ -0,0 +1,183 @@
+#data/datasources/tiered_quran_source.py
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from domain.entities.page_entity import PageEntity
+from data.datasources.lru_cache import LRUCache
+from data.datasources.quran_local_datasource import QuranLocalDataSource
+from data.datasources.quran_remote_datasource import QuranRemoteDataSource
+
+
+class TieredQuranSource:
+    """
+    Read-through lookups over three tiers, cheapest first:
+
+    1. memory - an in-process LRU of results
+    2. local  - quran.db (Ayas, mirrored EditionAyas, the reciter audio catalog)
+    3. remote - the alquran.cloud API (itself backed by its disk cache, if configured)
+
+    An empty result counts as a miss and falls through to the next tier; every
+    hit and miss is counted per tier. Texts of other editions and playlists of
+    other reciters fetched remotely are written back to the local database a
+    whole sura (or page) at a time, so the next request stops at the local tier.
+    """
+
+    TIERS = ("memory", "local", "remote")
+
+    def __init__(self, local: QuranLocalDataSource, remote: QuranRemoteDataSource,
+                 cache_size: int = 256, local_edition: str = "quran-uthmani"):
+        self.local = local
+        self.remote = remote
+        self.text_source = local.get_text_source()
+        self.memory = LRUCache(cache_size)
+        self.local_edition = local_edition
+        self._stats = {tier: {"hits": 0, "misses": 0} for tier in self.TIERS}
+        self._lock = threading.Lock()
+
+    def _record(self, tier: str, hit: bool) -> None:
+        with self._lock:
+            self._stats[tier]["hits" if hit else "misses"] += 1
+
+    def get_tier_stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {tier: dict(counts) for tier, counts in self._stats.items()}
+
+    def _read(self, key: Hashable, local: Callable[[], Any], remote: Callable[[], Any]) -> Any:
+        value = self.memory.get(key)
+        if value is not None:
+            self._record("memory", True)
+            return list(value) if isinstance(value, tuple) else value
+        self._record("memory", False)
+
+        for tier, source in (("local", local), ("remote", remote)):
+            value = source()
+            self._record(tier, bool(value))
+            if value:
+                # Lists are cached as tuples so callers cannot mutate the cached copy.
+                self.memory.put(key, tuple(value) if isinstance(value, list) else value)
+                return value
+        return value
+
+    def _is_local_edition(self, edition: Optional[str]) -> bool:
+        return edition is None or edition == self.local_edition
+
+    # --- editions ---
+    def _local_edition_range(self, edition: str, first_id: int, last_id: int) -> List[Tuple[int, str]]:
+        """Mirrored rows for the range, or [] unless every aya of it is present."""
+        rows = self.local.get_edition_text(edition, first_id, last_id)
+        return rows if len(rows) == last_id - first_id + 1 else []
+
+    def _remote_edition_sura(self, sura_id: int, edition: str) -> List[Tuple[int, str]]:
+        data = self.remote.get_sura_data(sura_id, edition)
+        if not data:
+            return []
+        rows = [(a["number"], a["text"]) for a in data["ayahs"]]
+        if not self._is_local_edition(edition):
+            self.local.store_edition_text(edition, rows)
+        return rows
+
+    def _sura_slice(self, sura_id: int, start_aya: int, count: int) -> Optional[Tuple[int, int]]:
+        sura_range = self.local.get_aya_numbering().sura_range(sura_id)
+        if not sura_range or count <= 0:
+            return None
+        first = sura_range[0] + max(start_aya, 1) - 1
+        return first, min(first + count - 1, sura_range[1])
+
+    def get_quran_text(self, sura_id: int, aya_id: int = 0, edition: Optional[str] = None) -> List[Tuple[int, str]]:
+        if aya_id:
+            return self.get_quran_text_range(sura_id, aya_id, 1, edition)
+        sura = self.local.get_navigation_index().sura(sura_id)
+        return self.get_quran_text_range(sura_id, 1, sura.ayas if sura else 0, edition)
+
+    def get_quran_text_range(self, sura_id: int, start_aya: int, count: int,
+                             edition: Optional[str] = None) -> List[Tuple[int, str]]:
+        bounds = self._sura_slice(sura_id, start_aya, count)
+        if bounds is None:
+            return []
+        first, last = bounds
+        offset = first - max(start_aya, 1)
+
+        def local():
+            if self._is_local_edition(edition):
+                return self.text_source.get_quran_text_range(sura_id, start_aya, count)
+            return [(number - offset, text) for number, text in self._local_edition_range(edition, first, last)]
+
+        def remote():
+            rows = self._remote_edition_sura(sura_id, edition or self.local_edition)
+            return [(number - offset, text) for number, text in rows if first <= number <= last]
+
+        return self._read(("text", edition or self.local_edition, first, last), local, remote)
+
+    def fetch_page_text(self, page: PageEntity, edition: Optional[str] = None) -> List[Tuple[int, int, str]]:
+        aya_range = self.local.get_navigation_index().page_aya_range(page.id)
+        edition = edition or self.local_edition
+
+        def local():
+            if self._is_local_edition(edition):
+                return self.text_source.fetch_page_text(page)
+            if not aya_range:
+                return []
+            from_global = self.local.get_aya_numbering().from_global
+            return [(*from_global(number), text) for number, text in self._local_edition_range(edition, *aya_range)]
+
+        def remote():
+            data = self.remote.get_page_data(page.id, edition)
+            if not data:
+                return []
+            ayahs = data["ayahs"]
+            if not self._is_local_edition(edition):
+                self.local.store_edition_text(edition, [(a["number"], a["text"]) for a in ayahs])
+            # Page boundaries can differ slightly between sources; keep to the local layout.
+            first, last = aya_range or (ayahs[0]["number"], ayahs[-1]["number"])
+            return [(a["surah"]["number"], a["numberInSurah"], a["text"]) for a in ayahs
+                    if first <= a["number"] <= last]
+
+        return self._read(("page_text", edition, page.id), local, remote)
+
+    def fetch_page_editions(self, page: PageEntity, editions: List[str]) -> List[tuple]:
+        """Like QuranLocalDataSource.fetch_page_editions; editions missing locally are filled through the tiers first."""
+        editions = [edition for edition in editions if not self._is_local_edition(edition)]
+        rows = self.local.fetch_page_editions(page, editions)
+        missing = [edition for column, edition in enumerate(editions)
+                   if any(row[3][column] is None for row in rows)]
+        for edition in missing:
+            self.fetch_page_text(page, edition)
+        return self.local.fetch_page_editions(page, editions) if missing else rows
+
+    # --- audio ---
+    def _local_playlist(self, fetch: Callable[[], List[tuple]], reciter: str) -> List[tuple]:
+        # Skip the local lookup (and its "unknown reciter" error) for reciters it has never seen.
+        return fetch() if self.local.get_audio_catalog().has_reciter(reciter) else []
+
+    def _remote_playlist(self, playlist: List[tuple], reciter: str) -> List[tuple]:
+        if playlist:
+            self.local.store_audio_urls(reciter, playlist)
+        return playlist
+
+    def get_sura_playlist(self, sura_id: int, reciter: str) -> List[tuple]:
+        return self._read(
+            ("sura_playlist", reciter, sura_id),
+            lambda: self._local_playlist(lambda: self.local.get_sura_playlist(sura_id, reciter), reciter),
+            lambda: self._remote_playlist(self.remote.get_sura_playlist(sura_id, reciter), reciter))
+
+    def get_page_playlist(self, page_id: int, reciter: str) -> List[tuple]:
+        return self._read(
+            ("page_playlist", reciter, page_id),
+            lambda: self._local_playlist(lambda: self.local.get_page_playlist(page_id, reciter), reciter),
+            lambda: self._remote_playlist(self.remote.get_page_playlist(page_id, reciter), reciter))
+
+    # --- navigation ---
+    def get_page_info(self, page_num: int) -> Optional[PageEntity]:
+        return self._read(("page", page_num),
+                          lambda: self.local.get_page_info(page_num),
+                          lambda: self.remote.get_page_info(page_num))
+
+    def get_first_page_for_sura(self, sura_id: int) -> Optional[PageEntity]:
+        return self._read(("first_page", sura_id),
+                          lambda: self.local.get_first_page_for_sura(sura_id),
+                          lambda: self.remote.get_first_page_for_sura(sura_id))
+
+    def get_sura_info(self, sura_id: int) -> Optional[dict]:
+        return self._read(("sura_info", sura_id),
+                          lambda: self.local.get_sura_info(sura_id),
+                          lambda: self.remote.get_sura_info(sura_id))
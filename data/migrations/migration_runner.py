@@ -0,0 +1,61 @@
+#data/migrations/migration_runner.py
+import sqlite3
+from dataclasses import dataclass
+from typing import Callable, List, Sequence
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A single schema step; `apply` receives a writable connection inside a transaction."""
+    version: int
+    description: str
+    apply: Callable[[sqlite3.Connection], None]
+
+
+class MigrationRunner:
+    """
+    Applies ordered migrations to the Quran database.
+
+    The applied schema version is stamped in the database header
+    (PRAGMA user_version), so every migration runs exactly once and in order.
+    """
+
+    def __init__(self, db_file: str, migrations: Sequence[Migration] = None):
+        if migrations is None:
+            from data.migrations.versions import MIGRATIONS
+            migrations = MIGRATIONS
+        self.db_file = db_file
+        self.migrations: List[Migration] = sorted(migrations, key=lambda m: m.version)
+        versions = [m.version for m in self.migrations]
+        if len(versions) != len(set(versions)):
+            raise ValueError(f"Duplicate migration versions: {versions}")
+
+    @property
+    def latest_version(self) -> int:
+        return self.migrations[-1].version if self.migrations else 0
+
+    @staticmethod
+    def get_version(conn: sqlite3.Connection) -> int:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def pending(self, conn: sqlite3.Connection) -> List[Migration]:
+        current = self.get_version(conn)
+        return [m for m in self.migrations if m.version > current]
+
+    def migrate(self) -> int:
+        """Apply all pending migrations and return the resulting schema version."""
+        conn = sqlite3.connect(self.db_file, isolation_level=None)
+        try:
+            for migration in self.pending(conn):
+                print(f"[INFO] Applying migration {migration.version}: {migration.description}")
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    migration.apply(conn)
+                    conn.execute(f"PRAGMA user_version = {int(migration.version)}")
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+            return self.get_version(conn)
+        finally:
+            conn.close()
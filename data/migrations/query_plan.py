@@ -0,0 +1,50 @@
+#data/migrations/query_plan.py
+import sqlite3
+from typing import List, Sequence, Tuple
+
+
+def explain_query_plan(conn: sqlite3.Connection, sql: str, params: Sequence = ()) -> List[str]:
+    """Return the `detail` column of EXPLAIN QUERY PLAN for a statement."""
+    return [row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def is_full_scan(detail: str) -> bool:
+    """
+    True when a plan step walks a whole table or index.
+
+    Scans of constant rows and of materialized subqueries are not table scans.
+    """
+    detail = detail.strip()
+    if not detail.startswith("SCAN "):
+        return False
+    return not detail.startswith(("SCAN CONSTANT ROW", "SCAN (subquery"))
+
+
+def find_full_scans(conn: sqlite3.Connection, statements: Sequence[str]) -> List[Tuple[str, str]]:
+    """Return (sql, plan step) for every statement whose plan contains a full scan."""
+    offenders = []
+    for sql in statements:
+        for detail in explain_query_plan(conn, sql):
+            if is_full_scan(detail):
+                offenders.append((sql, detail))
+    return offenders
+
+
+class QueryRecorder:
+    """Context manager capturing every SQL statement run on a connection."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.statements: List[str] = []
+
+    def _record(self, sql: str) -> None:
+        if not sql.lstrip().upper().startswith("PRAGMA"):
+            self.statements.append(sql)
+
+    def __enter__(self):
+        self.conn.set_trace_callback(self._record)
+        return self
+
+    def __exit__(self, *exc):
+        self.conn.set_trace_callback(None)
+        return False
@@ -0,0 +1,175 @@
+#data/migrations/versions.py
+"""
+Ordered schema migrations for quran.db.
+
+Append new migrations at the end with the next version number; never edit
+or renumber a migration that has already shipped.
+"""
+import sqlite3
+
+from data.migrations.migration_runner import Migration
+from data.search.fts_search import build_fts_index
+from data.search.word_table import build_word_table
+
+
+def _add_aya_indexes(conn: sqlite3.Connection) -> None:
+    # (sura_id, aya_id) -> id is covered by the index itself (rowid is part of
+    # every index entry), which serves aya lists, the page start lookup and
+    # range bounds without touching the table.
+    conn.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_ayas_sura_aya ON Ayas(sura_id, aya_id)"
+    )
+
+
+def _analyze(conn: sqlite3.Connection) -> None:
+    conn.execute("ANALYZE")
+
+
+DEFAULT_AUDIO_TEMPLATE = "{sura:03d}{aya:03d}.mp3"
+
+
+def _normalize_audio_catalog(conn: sqlite3.Connection) -> None:
+    """
+    Replace the Audios table and the per-reciter Audio_<key> tables with one
+    URL/path template per reciter plus per-aya overrides where a stored URL
+    does not follow the template.
+    """
+    conn.execute("""
+        CREATE TABLE ReciterAudio (
+            reciter_key TEXT PRIMARY KEY NOT NULL,
+            url_template TEXT NOT NULL
+        ) WITHOUT ROWID
+    """)
+    conn.execute("""
+        CREATE TABLE AudioOverrides (
+            reciter_key TEXT NOT NULL,
+            sura_id INTEGER NOT NULL,
+            aya_id INTEGER NOT NULL,
+            audio_url TEXT NOT NULL,
+            PRIMARY KEY (reciter_key, sura_id, aya_id)
+        ) WITHOUT ROWID
+    """)
+
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    base_urls = dict(conn.execute("SELECT reciter, base_url FROM Audios")) if "Audios" in tables else {}
+    for (key,) in conn.execute("SELECT key FROM Reciters ORDER BY id").fetchall():
+        template = (base_urls.get(key) or f"{key}/") + DEFAULT_AUDIO_TEMPLATE
+        conn.execute("INSERT INTO ReciterAudio (reciter_key, url_template) VALUES (?, ?)", (key, template))
+
+        table_name = f"Audio_{key}"
+        if table_name not in tables:
+            continue
+        rows = conn.execute(f'SELECT sura_id, aya_id, audio_url FROM "{table_name}"').fetchall()
+        overrides = [
+            (key, sura_id, aya_id, url) for sura_id, aya_id, url in rows
+            if url != template.format(sura=sura_id, aya=aya_id)
+        ]
+        conn.executemany(
+            "INSERT INTO AudioOverrides (reciter_key, sura_id, aya_id, audio_url) VALUES (?, ?, ?, ?)",
+            overrides,
+        )
+        conn.execute(f'DROP TABLE "{table_name}"')
+
+    if "Audios" in tables:
+        conn.execute("DROP TABLE Audios")
+
+
+def _add_page_global_aya(conn: sqlite3.Connection) -> None:
+    """Store each page's first aya as a global aya number (= Ayas.id)."""
+    conn.execute("ALTER TABLE Pages ADD COLUMN start_aya INTEGER")
+    # CAST takes the leading integer of the CSV list, i.e. the page's first sura.
+    conn.execute("""
+        UPDATE Pages
+        SET start_aya = start_id + (SELECT start FROM Suras WHERE id = CAST(Pages.sura_ids AS INTEGER))
+    """)
+
+
+def _add_edition_tables(conn: sqlite3.Connection) -> None:
+    """Tables for text editions mirrored from the remote API."""
+    conn.execute("""
+        CREATE TABLE Editions (
+            identifier TEXT PRIMARY KEY NOT NULL,
+            language TEXT,
+            name TEXT,
+            english_name TEXT,
+            format TEXT,
+            type TEXT,
+            synced_at TEXT
+        ) WITHOUT ROWID
+    """)
+    # Keyed by global aya number so a page's ayas are one range scan per edition.
+    conn.execute("""
+        CREATE TABLE EditionAyas (
+            edition TEXT NOT NULL,
+            aya_number INTEGER NOT NULL,
+            text TEXT NOT NULL,
+            PRIMARY KEY (edition, aya_number)
+        ) WITHOUT ROWID
+    """)
+
+
+def _add_search_index(conn: sqlite3.Connection) -> None:
+    """
+    Full-text index over the normalized aya text; re-run (new version) whenever
+    normalization changes. Without FTS5 the version is still stamped: the
+    datasource builds the index later, on the first search with an sqlite3
+    that has FTS5 (see QuranLocalDataSource.get_search_backend).
+    """
+    if not build_fts_index(conn):
+        print("[WARN] sqlite3 was built without FTS5; search index not created yet")
+
+
+def _add_root_index_tables(conn: sqlite3.Connection) -> None:
+    """Root -> word form -> occurrence tables, filled by `cli import-morphology`."""
+    conn.execute("""
+        CREATE TABLE Roots (
+            id INTEGER PRIMARY KEY,
+            root TEXT NOT NULL UNIQUE
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE WordForms (
+            id INTEGER PRIMARY KEY,
+            root_id INTEGER NOT NULL,
+            lemma TEXT NOT NULL,
+            form TEXT NOT NULL,
+            UNIQUE (root_id, lemma, form)
+        )
+    """)
+    # Clustered by form, so a root's occurrences are one range scan per form.
+    conn.execute("""
+        CREATE TABLE RootOccurrences (
+            form_id INTEGER NOT NULL,
+            aya_number INTEGER NOT NULL,
+            word_index INTEGER NOT NULL,
+            PRIMARY KEY (form_id, aya_number, word_index)
+        ) WITHOUT ROWID
+    """)
+
+
+def _add_word_table(conn: sqlite3.Connection) -> None:
+    """Per-word offsets and normalized forms, so nothing re-splits aya text at runtime."""
+    conn.execute("""
+        CREATE TABLE Words (
+            aya_number INTEGER NOT NULL,
+            word_index INTEGER NOT NULL,
+            position INTEGER NOT NULL,
+            char_start INTEGER NOT NULL,
+            char_end INTEGER NOT NULL,
+            form TEXT NOT NULL,
+            PRIMARY KEY (aya_number, word_index)
+        ) WITHOUT ROWID
+    """)
+    build_word_table(conn)
+
+
+MIGRATIONS = [
+    Migration(1, "Covering index on Ayas(sura_id, aya_id)", _add_aya_indexes),
+    Migration(2, "Collect planner statistics", _analyze),
+    Migration(3, "Template-based reciter audio catalog", _normalize_audio_catalog),
+    Migration(4, "Global aya number on Pages", _add_page_global_aya),
+    Migration(5, "Mirrored text editions", _add_edition_tables),
+    Migration(6, "Full-text search index over normalized aya text", _add_search_index),
+    Migration(7, "Root/lemma inverted index", _add_root_index_tables),
+    Migration(8, "Word table with offsets and normalized forms", _add_word_table),
+]
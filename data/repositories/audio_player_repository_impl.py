@@ -20,7 +20,8 @@ class AudioPlayerImpl(IAudioPlayer):
         audio_data = self.quran_repository.get_sura_playlist(sura_id, reciter)
         for sura_id, aya_id, path in audio_data:
             print(f"path for {sura_id}:{aya_id} → {path}")
-            self.playlist.addMedia(QMediaContent(QUrl.fromLocalFile(path)))
+            url = QUrl(path) if path.startswith(('http://', 'https://')) else QUrl.fromLocalFile(path)
+            self.playlist.addMedia(QMediaContent(url))
         self.playlist.setCurrentIndex(0)
         return True
 
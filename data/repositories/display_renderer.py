@@ -1,23 +1,54 @@
 #data/repositories/display_renderer.py
+import html
 from PyQt5.QtGui import QColor
 
+_ARABIC_DIGITS = str.maketrans("0123456789", "٠١٢٣٤٥٦٧٨٩")
+# Aya numbers 1..286 (al-Baqara, the longest sura) as Arabic-Indic numerals
+ARABIC_NUMERALS = tuple(str(number).translate(_ARABIC_DIGITS) for number in range(287))
+
+
+def arabic_numeral(number):
+    if 0 <= number < len(ARABIC_NUMERALS):
+        return ARABIC_NUMERALS[number]
+    return str(number).translate(_ARABIC_DIGITS)
+
+
 class DisplayRenderer:
+    # How extra editions (translations, ...) are placed next to the Arabic text
+    EDITION_LAYOUTS = ("interleaved", "side_by_side")
+
     def __init__(self, font_color=QColor(0, 0, 0), bg_color=QColor(255, 255, 255),
                  highlight_color=QColor("#FFFFAA"), font_size=24):
         self.font_color = font_color
         self.bg_color = bg_color
         self.highlight_color = highlight_color
         self.font_size = font_size
-       
+        self.edition_layout = "interleaved"
+        # {(sura_id, aya_id): [word_index, ...]} of words to mark, e.g. root search matches
+        self.word_highlights = {}
+        # {(sura_id, aya_id): "recommended" | "obligatory"}, set once from the division metadata
+        self.sajda_ayas = {}
+        # Bumped by the setters that change page fragments (layout, marked words, sajdas); part of cached page keys
+        self.style_version = 0
+        # Bumped by the setters that change the shell's CSS and marker symbol (fonts, colors)
+        self.shell_version = 0
+
+    def _bump_style_version(self):
+        self.style_version += 1
+
+    def _bump_shell_version(self):
+        self.shell_version += 1
 
     def set_font_color(self, color):
         self.font_color = QColor(color) if isinstance(color, str) else color
+        self._bump_shell_version()
 
     def get_font_color(self):
         return self.font_color
 
     def set_bg_color(self, color):
         self.bg_color = QColor(color) if isinstance(color, str) else color
+        self._bump_shell_version()
 
     def get_bg_color(self):
         return self.bg_color
@@ -25,65 +56,118 @@ class DisplayRenderer:
     def set_font_size(self, size):
         if isinstance(size, (int, float)) and size > 0:
             self.font_size = size
+            self._bump_shell_version()
 
     def get_font_size(self):
         return self.font_size
     
     def set_highlight_color(self, color):
         self.highlight_color = QColor(color) if isinstance(color, str) else color
+        self._bump_shell_version()
 
     def get_highlight_color(self):
         return self.highlight_color
 
-    def html_aya(self, number, circle_stroke_width=3, decoration_stroke_width=1):
-        digits = ['٠', '١', '٢', '٣', '٤', '٥', '٦', '٧', '٨', '٩']
-        num = ''.join(digits[int(d)] for d in str(number))
-        font_color = self.font_color.name()
+    def set_edition_layout(self, layout):
+        if layout in self.EDITION_LAYOUTS and layout != self.edition_layout:
+            self.edition_layout = layout
+            self._bump_style_version()
+
+    def get_edition_layout(self):
+        return self.edition_layout
+
+    def set_word_highlights(self, highlights):
+        highlights = dict(highlights or {})
+        if highlights != self.word_highlights:
+            self.word_highlights = highlights
+            self._bump_style_version()
+
+    def set_sajda_ayas(self, sajdas):
+        self.sajda_ayas = dict(sajdas or {})
+        self._bump_style_version()
+
+    def word_spans(self, aya_num, text, words, marked=()):
+        """
+        The aya text with every word wrapped in a span (id "w-AYA-WORD"), cut at
+        the precomputed (word_index, char_start, char_end) offsets of the Words
+        table; waqf marks and spaces between words are copied as they are.
+        """
+        parts = []
+        last = 0
+        for word_index, start, end in words:
+            css_class = "word word-match" if word_index in marked else "word"
+            parts.append(text[last:start])
+            parts.append(f'<span id="w-{aya_num}-{word_index}" class="{css_class}">{text[start:end]}</span>')
+            last = end
+        parts.append(text[last:])
+        return "".join(parts)
+
+    def marker_geometry(self):
+        """(svg size, inner radius, outer radius, numeral font size) in px for the current font size."""
         font_size_px = self.font_size * 1.1
-        svg_size = font_size_px * 1.5
         inner_radius = font_size_px * 0.45
-        outer_radius = inner_radius * 1.3
+        return font_size_px * 1.5, inner_radius, inner_radius * 1.3, font_size_px * 0.5
+
+    def generate_marker_symbol(self, circle_stroke_width=3, decoration_stroke_width=1):
+        """
+        The aya marker decoration (two circles, eight petals) as an SVG <symbol>,
+        emitted once per document; every aya marker is a <use> of it plus its numeral.
+        """
+        font_color = self.font_color.name()
+        svg_size, inner_radius, outer_radius, _ = self.marker_geometry()
         center = svg_size / 2
         decoration_count = 8
-
-        def get_decoration_path(angle):
-            return f"""
-                <g transform="rotate({angle})">
-                    <path d="
-                        M 0,{-inner_radius}
-                        C {inner_radius * 0.3},{-outer_radius} {inner_radius * 0.7},{-outer_radius} 0,{-outer_radius}
-                        S {-inner_radius * 0.7},{-outer_radius} 0,{-inner_radius}
-                        Z
-                    " stroke-width="{decoration_stroke_width}"/>
-                </g>
-            """
-
-        return f"""<svg width="{svg_size}" height="{svg_size}" viewBox="0 0 {svg_size} {svg_size}" xmlns="http://www.w3.org/2000/svg">
-            <circle cx="{center}" cy="{center}" r="{outer_radius}" fill="transparent" stroke="{font_color}" stroke-width="1" stroke-dasharray="1,3" opacity="0.3"/>
-            <circle cx="{center}" cy="{center}" r="{inner_radius}" fill="transparent" stroke="{font_color}" stroke-width="{circle_stroke_width}"/>
-            <g transform="translate({center},{center})" fill="{font_color}" stroke="{font_color}">
-                {''.join(get_decoration_path(i * (360 / decoration_count)) for i in range(decoration_count))}
-            </g>
-            <text x="{center}" y="{center}" text-anchor="middle" dominant-baseline="middle"
-                  font-family="Amiri, Traditional Arabic, serif"
-                  font-size="{font_size_px*0.5}" fill="{font_color}" font-weight="bold">
-                {num}
-            </text>
+        petal = (f"M 0,{-inner_radius} "
+                 f"C {inner_radius * 0.3},{-outer_radius} {inner_radius * 0.7},{-outer_radius} 0,{-outer_radius} "
+                 f"S {-inner_radius * 0.7},{-outer_radius} 0,{-inner_radius} Z")
+        petals = "".join(
+            f'<path transform="rotate({i * (360 / decoration_count)})" d="{petal}" stroke-width="{decoration_stroke_width}"/>'
+            for i in range(decoration_count)
+        )
+        return f"""<svg width="0" height="0" style="position: absolute" aria-hidden="true">
+            <symbol id="aya-marker" viewBox="0 0 {svg_size} {svg_size}">
+                <circle cx="{center}" cy="{center}" r="{outer_radius}" fill="transparent" stroke="{font_color}" stroke-width="1" stroke-dasharray="1,3" opacity="0.3"/>
+                <circle cx="{center}" cy="{center}" r="{inner_radius}" fill="transparent" stroke="{font_color}" stroke-width="{circle_stroke_width}"/>
+                <g transform="translate({center},{center})" fill="{font_color}" stroke="{font_color}">{petals}</g>
+            </symbol>
         </svg>"""
 
-    def generate_aya_html(self, sura_id, aya_num, text):
+    def html_aya(self, number):
+        """The marker of aya `number`: the shared symbol and its Arabic-Indic numeral (styled by .aya-marker)."""
+        return f'<svg class="aya-marker"><use href="#aya-marker"/><text x="50%" y="50%">{arabic_numeral(number)}</text></svg>'
+
+    def generate_aya_html(self, sura_id, aya_num, text, words=None):
         marker_svg = self.html_aya(aya_num)
         link = f"play-{sura_id}-{aya_num}"
+        if words:
+            text = self.word_spans(aya_num, text, words, self.word_highlights.get((sura_id, aya_num), ()))
+        sajda = self.sajda_ayas.get((sura_id, aya_num))
+        sajda_html = f'<span class="sajda-mark {sajda}" title="سجدة">۩</span>' if sajda else ""
 
         return f"""
         <span id="aya-{aya_num}" class="aya-inline">
-            {text}
+            {text}{sajda_html}
             <span class="aya-number">
                 <a href="#" onclick="bridge.handleMarkerClick('{link}')">{marker_svg}</a>
             </span>
         </span>
         """
+
+    def generate_aya_row_html(self, sura_id, aya_num, text, edition_texts, words=None):
+        """An aya followed (interleaved) or accompanied (side_by_side) by its edition texts."""
+        editions_html = "".join(
+            f'<div class="edition-text" dir="auto">{html.escape(edition_text)}</div>'
+            for edition_text in edition_texts if edition_text
+        )
+        return f"""
+        <div class="aya-row {self.edition_layout}">
+            <div class="aya-source">{self.generate_aya_html(sura_id, aya_num, text, words)}</div>
+            <div class="aya-editions">{editions_html}</div>
+        </div>
+        """
+
     def generate_css(self):
+        svg_size, _, _, numeral_size = self.marker_geometry()
         return f"""
         <style>
         :root {{
@@ -157,6 +241,60 @@ class DisplayRenderer:
             box-shadow: 0 4px 8px rgba(0,0,0,0.2);
         }}
         
+        .word-match {{
+            background-color: var(--highlight-color);
+            color: var(--highlight-text-color);
+            border-radius: 3px;
+        }}
+
+        .sajda-mark {{
+            margin: 0 4px;
+            color: {self._calculate_secondary_color(self.font_color).name()};
+        }}
+
+        .sajda-mark.obligatory {{
+            font-weight: bold;
+        }}
+
+        .aya-row {{
+            margin: 0.6em 0;
+        }}
+
+        .aya-row.side_by_side {{
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 1.5em;
+            align-items: start;
+        }}
+
+        .aya-row.interleaved .aya-editions {{
+            border-inline-start: 2px solid {self._calculate_secondary_color(self.font_color).name()};
+            padding-inline-start: 0.8em;
+        }}
+
+        .edition-text {{
+            font-family: 'Noto Sans', 'Segoe UI', sans-serif;
+            font-size: calc(var(--font-size) * 0.55);
+            line-height: 1.6;
+            text-align: start;
+            margin: 0.2em 0;
+        }}
+
+        .aya-marker {{
+            width: {svg_size}px;
+            height: {svg_size}px;
+            vertical-align: middle;
+        }}
+
+        .aya-marker text {{
+            font-family: Amiri, 'Traditional Arabic', serif;
+            font-size: {numeral_size}px;
+            font-weight: bold;
+            fill: {self.font_color.name()};
+            text-anchor: middle;
+            dominant-baseline: middle;
+        }}
+
         .aya-number {{
             display: inline-block;
             margin: 0 5px;
@@ -174,6 +312,16 @@ class DisplayRenderer:
             text-decoration: underline;
         }}
         
+        /* Continuous scrolling: one slot per page; the script keeps the view anchored itself */
+        #page-container.continuous {{
+            overflow-anchor: none;
+        }}
+
+        .page-slot {{
+            display: flow-root;
+            contain: layout style;
+        }}
+
         @media (max-width: 600px) {{
             body {{
                 font-size: calc(var(--font-size) * 0.9);
@@ -196,18 +344,22 @@ class DisplayRenderer:
         h, s, v, _ = main_color.getHsv()
         return QColor.fromHsv(h, int(s * 0.7), int(v * 0.8))
 
-    def generate_html(self, page_number, sura_info_list, quran_data):
-
+    def generate_page_fragment(self, page_number, sura_info_list, quran_data, page_words=None):
+        """The page itself (sura headers, ayas, footer): what the shell swaps in on a page turn."""
         # Start the page container
         page_html = """
         <div class="page-frame">
         """
 
-        # Group ayas by sura_id from quran_data
+        # Group ayas by sura_id from quran_data; rows may carry a 4th item with
+        # the texts of the selected editions (see fetch_page_editions).
+        # page_words has the word offsets per (sura_id, aya_id) (see fetch_page_words).
+        page_words = page_words or {}
         from collections import defaultdict
         sura_ayas = defaultdict(list)
-        for sid, aid, text in quran_data:
-            sura_ayas[sid].append((sid, aid, text))
+        for row in quran_data:
+            sura_ayas[row[0]].append(row)
+        with_editions = any(len(row) > 3 and any(row[3]) for row in quran_data)
 
         # Build HTML for each sura
         for sura_info in sura_info_list:
@@ -221,9 +373,17 @@ class DisplayRenderer:
             """
 
             # Ayas of the sura
-            ayas_html = "\n".join(
-                self.generate_aya_html(sid, aid, text) for sid, aid, text in sura_ayas[sura_id]
-            )
+            if with_editions:
+                ayas_html = "\n".join(
+                    self.generate_aya_row_html(row[0], row[1], row[2], row[3] if len(row) > 3 else (),
+                                               page_words.get((row[0], row[1])))
+                    for row in sura_ayas[sura_id]
+                )
+            else:
+                ayas_html = "\n".join(
+                    self.generate_aya_html(row[0], row[1], row[2], page_words.get((row[0], row[1])))
+                    for row in sura_ayas[sura_id]
+                )
 
             page_html += f"{sura_header_html}\n<div class='sura-block'>{ayas_html}</div>\n"
 
@@ -234,8 +394,25 @@ class DisplayRenderer:
             </div>
         </div>
         """
+        return page_html + footer_html
 
-        # Final HTML
+    def generate_html(self, page_number, sura_info_list, quran_data, page_words=None):
+        """A complete document showing one page (the shell with the page already in it)."""
+        return self.generate_shell(self.generate_page_fragment(page_number, sura_info_list, quran_data, page_words))
+
+    def generate_shell(self, content=""):
+        """
+        The long-lived document: CSS, scripts, the marker symbol and an empty
+        #page-container. Pages arrive as fragments over the web channel
+        (bridge.pageFragmentReady -> showPage), so a page turn neither reloads
+        the document nor sets up the channel again.
+
+        In continuous mode (bridge.readingModeChanged) the container holds a
+        window of consecutive page slots instead: pages near the view are asked
+        for with bridge.requestWindowPage and arrive on bridge.windowPageReady,
+        slots far from the view are removed, and the page in the middle of the
+        view is reported with bridge.pageVisible.
+        """
         return f"""
         <html>
         <head>
@@ -245,43 +422,270 @@ class DisplayRenderer:
             <script>
             let bridge = null;
             let currentPlayingAya = null;
+            let currentAyaElement = null;  // aya ids repeat across the pages of the continuous window
+            let pendingAya = null;
+
+            // Continuous mode: a window of page slots around the page in view
+            let continuous = false;
+            let windowPages = 7;
+            let visiblePage = null;
+            let firstPageLimit = 1;
+            let lastPageLimit = Infinity;
+            const requestedPages = new Set();
+            let scrollFrame = null;
 
             document.addEventListener('DOMContentLoaded', function () {{
                 new QWebChannel(qt.webChannelTransport, function (channel) {{
                     bridge = channel.objects.bridge;
+                    window.bridge = bridge;
+                    if (bridge.pageFragmentReady) {{
+                        bridge.pageFragmentReady.connect(showPage);
+                    }}
+                    if (bridge.readingModeChanged) {{
+                        bridge.readingModeChanged.connect(setReadingMode);
+                        bridge.windowPageReady.connect(insertPage);
+                    }}
+                    if (bridge.shellReady) {{
+                        bridge.shellReady();
+                    }}
                 }});
+                document.addEventListener('wheel', handleWheelEvent, {{ passive: false }});
+                window.addEventListener('scroll', scheduleWindowUpdate, {{ passive: true }});
             }});
 
-            function highlightAya(ayaId) {{
-                if (currentPlayingAya === ayaId) return;
+            function showPage(pageId, fragment) {{
+                const start = performance.now();
+                const container = document.getElementById('page-container');
+                if (!continuous) {{
+                    container.innerHTML = fragment;
+                    currentPlayingAya = null;
+                    currentAyaElement = null;
+                    currentWord = null;
+                    window.scrollTo(0, 0);
+                }} else {{
+                    const slot = findSlot(pageId);
+                    if (slot && slot.fragment === fragment) {{
+                        // Already in the window (e.g. the next page during a recitation): scroll to it
+                        clearHighlight();
+                        slot.scrollIntoView({{ block: 'start' }});
+                    }} else {{
+                        // A jump, or the page changed (editions, marked words): start a new window
+                        container.innerHTML = '';
+                        requestedPages.clear();
+                        container.appendChild(makeSlot(pageId, fragment));
+                        currentPlayingAya = null;
+                        currentAyaElement = null;
+                        window.scrollTo(0, 0);
+                    }}
+                    currentWord = null;
+                    visiblePage = pageId;
+                }}
+                void container.offsetHeight;  // lay the page out inside the measurement
+                const elapsed = performance.now() - start;
+                if (pendingAya) {{
+                    const ayaId = pendingAya;
+                    pendingAya = null;
+                    highlightAya(ayaId);
+                }}
+                if (bridge && bridge.pageShown) {{
+                    bridge.pageShown(pageId, elapsed);
+                }}
+                scheduleWindowUpdate();
+            }}
+
+            function setReadingMode(on, maxPages) {{
+                continuous = on;
+                windowPages = Math.max(3, maxPages || windowPages);
+                firstPageLimit = 1;
+                lastPageLimit = Infinity;
+                requestedPages.clear();
+                document.getElementById('page-container').classList.toggle('continuous', on);
+            }}
 
-                if (currentPlayingAya) {{
-                    const prevEl = document.getElementById('aya-' + currentPlayingAya);
-                    if (prevEl) {{
-                        prevEl.classList.remove('current');
+            function makeSlot(pageId, fragment) {{
+                const slot = document.createElement('section');
+                slot.className = 'page-slot';
+                slot.dataset.page = pageId;
+                slot.innerHTML = fragment;
+                slot.fragment = fragment;
+                return slot;
+            }}
+
+            function findSlot(pageId) {{
+                for (const slot of document.getElementById('page-container').children) {{
+                    if (+slot.dataset.page === pageId) return slot;
+                }}
+                return null;
+            }}
+
+            function slotAt(y) {{
+                // The slot under the viewport line y, else the nearest one
+                let best = null;
+                let bestDistance = Infinity;
+                for (const slot of document.getElementById('page-container').children) {{
+                    const rect = slot.getBoundingClientRect();
+                    const distance = y < rect.top ? rect.top - y : (y >= rect.bottom ? y - rect.bottom : 0);
+                    if (distance < bestDistance) {{
+                        best = slot;
+                        bestDistance = distance;
                     }}
+                    if (distance === 0) break;
                 }}
+                return best;
+            }}
 
-                const newEl = document.getElementById('aya-' + ayaId);
-                if (newEl) {{
-                    newEl.classList.add('current');
-                    newEl.scrollIntoView({{
-                        behavior: 'smooth',
-                        block: 'center',
-                        inline: 'center'
-                    }});
-                    currentPlayingAya = ayaId;
-
-                    const event = new CustomEvent('ayahighlighted', {{ detail: {{ ayaId }} }});
-                    document.dispatchEvent(event);
+            function keepAnchor(change, removed) {{
+                // Slots added or removed above the view must not move the text being read
+                let anchor = slotAt(window.innerHeight / 2);
+                if (anchor === removed) anchor = removed.nextElementSibling;
+                const before = anchor ? anchor.getBoundingClientRect().top : 0;
+                change();
+                if (anchor) {{
+                    window.scrollBy(0, anchor.getBoundingClientRect().top - before);
                 }}
             }}
 
+            function insertPage(pageId, fragment) {{
+                requestedPages.delete(pageId);
+                const container = document.getElementById('page-container');
+                const first = container.firstElementChild;
+                const last = container.lastElementChild;
+                if (!continuous || !first) return;
+                if (!fragment) {{
+                    // No such page: stop asking past it
+                    if (pageId < +first.dataset.page) firstPageLimit = pageId + 1;
+                    else lastPageLimit = pageId - 1;
+                    return;
+                }}
+                const start = performance.now();
+                if (pageId === +last.dataset.page + 1) {{
+                    container.appendChild(makeSlot(pageId, fragment));
+                }} else if (pageId === +first.dataset.page - 1) {{
+                    keepAnchor(() => container.insertBefore(makeSlot(pageId, fragment), first));
+                }} else {{
+                    return;  // asked for before a jump; no longer next to the window
+                }}
+                evictPages();
+                const elapsed = performance.now() - start;
+                if (bridge && bridge.pageShown) {{
+                    bridge.pageShown(pageId, elapsed);
+                }}
+                scheduleWindowUpdate();
+            }}
+
+            function evictPages() {{
+                // Drop the end slot farthest from the view while the window is over its size,
+                // but never one within the prefetch margin (short pages would just come back)
+                const container = document.getElementById('page-container');
+                const margin = window.innerHeight * 1.5;
+                while (container.children.length > windowPages) {{
+                    const first = container.firstElementChild;
+                    const last = container.lastElementChild;
+                    const above = -first.getBoundingClientRect().bottom;
+                    const below = last.getBoundingClientRect().top - window.innerHeight;
+                    if (Math.max(above, below) <= margin) break;
+                    if (above > below) {{
+                        keepAnchor(() => first.remove(), first);
+                    }} else {{
+                        last.remove();
+                    }}
+                }}
+            }}
+
+            function requestPage(pageId) {{
+                if (requestedPages.has(pageId)) return;
+                requestedPages.add(pageId);
+                bridge.requestWindowPage(pageId);
+            }}
+
+            function fillWindow() {{
+                // Ask for the next page below and the previous one above while they are within
+                // one and a half screens of the view; one page per side at a time
+                const container = document.getElementById('page-container');
+                const first = container.firstElementChild;
+                const last = container.lastElementChild;
+                if (!first || !bridge || !bridge.requestWindowPage) return;
+                const margin = window.innerHeight * 1.5;
+                const firstPage = +first.dataset.page;
+                const lastPage = +last.dataset.page;
+                if (last.getBoundingClientRect().bottom - window.innerHeight < margin && lastPage < lastPageLimit) {{
+                    requestPage(lastPage + 1);
+                }}
+                if (-first.getBoundingClientRect().top < margin && firstPage > firstPageLimit) {{
+                    requestPage(firstPage - 1);
+                }}
+            }}
+
+            function scheduleWindowUpdate() {{
+                // At most once per frame: report the page in the middle of the view, then fill and trim
+                if (!continuous || scrollFrame !== null) return;
+                scrollFrame = requestAnimationFrame(function () {{
+                    scrollFrame = null;
+                    const slot = slotAt(window.innerHeight / 2);
+                    if (slot && +slot.dataset.page !== visiblePage) {{
+                        visiblePage = +slot.dataset.page;
+                        if (bridge && bridge.pageVisible) {{
+                            bridge.pageVisible(visiblePage);
+                        }}
+                    }}
+                    fillWindow();
+                    evictPages();
+                }});
+            }}
+
+            function pageElement(id) {{
+                // Aya and word ids repeat from page to page; look in the page in view first
+                const slot = continuous && visiblePage !== null ? findSlot(visiblePage) : null;
+                return (slot && slot.querySelector('[id="' + id + '"]')) || document.getElementById(id);
+            }}
+
+            function handleWheelEvent(e) {{
+                if (!bridge || continuous) return;
+                const scrollTop = Math.max(document.documentElement.scrollTop, document.body.scrollTop);
+                const scrollHeight = Math.max(document.documentElement.scrollHeight, document.body.scrollHeight);
+                const clientHeight = Math.max(document.documentElement.clientHeight, document.body.clientHeight);
+
+                // At the top scrolling up, or at the bottom scrolling down: turn the page
+                if (scrollTop <= 0 && e.deltaY < 0) {{
+                    bridge.requestPreviousPage();
+                    e.preventDefault();
+                }} else if (scrollTop >= scrollHeight - clientHeight && e.deltaY > 0) {{
+                    bridge.requestNextPage();
+                    e.preventDefault();
+                }}
+            }}
+
+            function highlightAya(ayaId) {{
+                if (currentPlayingAya === ayaId && currentAyaElement && currentAyaElement.isConnected) return;
+
+                if (currentAyaElement) {{
+                    currentAyaElement.classList.remove('current');
+                    currentAyaElement = null;
+                }}
+
+                const newEl = pageElement('aya-' + ayaId);
+                if (!newEl) {{
+                    // The page may still be on its way over the channel
+                    pendingAya = ayaId;
+                    return;
+                }}
+                newEl.classList.add('current');
+                newEl.scrollIntoView({{
+                    behavior: 'smooth',
+                    block: 'center',
+                    inline: 'center'
+                }});
+                currentPlayingAya = ayaId;
+                currentAyaElement = newEl;
+
+                const event = new CustomEvent('ayahighlighted', {{ detail: {{ ayaId }} }});
+                document.dispatchEvent(event);
+            }}
+
             function clearHighlight() {{
-                if (!currentPlayingAya) return;
-                const el = document.getElementById('aya-' + currentPlayingAya);
-                if (el) {{
-                    el.classList.remove('current');
+                if (currentAyaElement) {{
+                    currentAyaElement.classList.remove('current');
+                    currentAyaElement = null;
                 }}
                 currentPlayingAya = null;
             }}
@@ -302,156 +706,21 @@ class DisplayRenderer:
                 document.body.style.fontSize = sizePt + 'pt';
             }}
 
+            window.showPage = showPage;
+            window.setReadingMode = setReadingMode;
+            window.insertPage = insertPage;
             window.highlightAya = highlightAya;
             window.clearHighlight = clearHighlight;
             </script>
         </head>
         <body dir="rtl">
-            {page_html}
+            {self.generate_marker_symbol()}
+            <div id="page-container">{content}</div>
             <script>
             if (window.initialAyaToHighlight) {{
                 highlightAya(window.initialAyaToHighlight);
             }}
             </script>
-            {footer_html}
-        </body>
-        </html>
-        """
-
-    
-    def generate_html_new_1(self, current_page_number, get_sura_info_list_func, get_quran_data_func):
-        """
-        Generate HTML for multiple pages according to current page and scrolling rules.
-
-        Args:
-        current_page_number (int): The currently active page number
-        get_sura_info_list_func (Callable[[int], List[Dict]]): function to get sura info list by page number
-        get_quran_data_func (Callable[[int], List[Tuple[int,int,str]]]): function to get quran data by page number
-        """
-
-        total_pages = 604
-
-        # Determine pages to render based on rules
-        if current_page_number == 1:
-            pages_to_render = [1, 2] if total_pages >= 2 else [1]
-        elif current_page_number == total_pages:
-            pages_to_render = [total_pages-1, total_pages] if total_pages > 1 else [total_pages]
-        else:
-            # For pages between 2 and last-1
-            pages_to_render = [current_page_number-1, current_page_number, current_page_number+1]
-            # Clamp values inside valid range
-            pages_to_render = [p for p in pages_to_render if 1 <= p <= total_pages]
-
-        def render_page_html(page_num):
-            sura_info_list = get_sura_info_list_func(page_num)
-            quran_data = get_quran_data_func(page_num)
-
-            # Build page html same as before, but for one page only
-            page_html = """
-            <div class="page-frame" id="page-{page_num}">
-            """.format(page_num=page_num)
-
-            from collections import defaultdict
-            sura_ayas = defaultdict(list)
-            for sid, aid, text in quran_data:
-                sura_ayas[sid].append((sid, aid, text))
-
-            for sura_info in sura_info_list:
-                sura_id = sura_info["id"]
-                sura_name = sura_info["name"]
-
-                sura_header_html = f"""
-                <div class="page-header">
-                    <div class="sura-name">سورة {sura_name}</div>
-                </div>
-                """
-
-                ayas_html = "\n".join(
-                    self.generate_aya_html(sid, aid, text) for sid, aid, text in sura_ayas[sura_id]
-                )
-
-                page_html += f"{sura_header_html}\n<div class='sura-block'>{ayas_html}</div>\n"
-
-            page_html += f"""
-                <div class="page-footer">
-                    <div class="page-number">صفحة {page_num}</div>
-                </div>
-            </div>
-            """
-            return page_html
-
-        all_pages_html = "\n".join(render_page_html(p) for p in pages_to_render)
-
-        # JS to handle scrollbar position, loading prev/next pages dynamically,
-        # and centering scroll on middle page after load
-        middle_page_index = pages_to_render.index(current_page_number) if current_page_number in pages_to_render else 0
-
-        js = f"""
-        <script>
-        document.addEventListener('DOMContentLoaded', function() {{
-            const container = document.getElementById('pages-container');
-            const pageFrames = container.getElementsByClassName('page-frame');
-
-            // Scroll to middle page on initial load
-            if(pageFrames.length > 0) {{
-            const middlePage = pageFrames[{middle_page_index}];
-            middlePage.scrollIntoView({{behavior: 'auto', block: 'center'}});
-            }}
-
-            let isLoading = false;
-
-            container.addEventListener('scroll', function() {{
-            if(isLoading) return;
-
-            const scrollTop = container.scrollTop;
-            const scrollHeight = container.scrollHeight;
-            const containerHeight = container.clientHeight;
-
-            // near top: load previous pages
-            if(scrollTop < 50) {{
-                isLoading = true;
-                // You should implement a callback to fetch x-2 page, e.g. via Qt bridge or other mechanism
-                if(typeof window.loadPreviousPages === 'function') {{
-                window.loadPreviousPages();
-                }}
-                isLoading = false;
-            }}
-
-            // near bottom: load next pages
-            else if(scrollTop + containerHeight > scrollHeight - 50) {{
-                isLoading = true;
-                if(typeof window.loadNextPages === 'function') {{
-                window.loadNextPages();
-                }}
-                isLoading = false;
-            }}
-            }});
-        }});
-        </script>
-        """
-
-        css = self.generate_css()
-
-        return f"""
-        <html>
-        <head>
-        <meta charset="UTF-8">
-        {css}
-        <script src="qrc:///qtwebchannel/qwebchannel.js"></script>
-        <script>
-            let bridge = null;
-            document.addEventListener('DOMContentLoaded', function () {{
-                new QWebChannel(qt.webChannelTransport, function (channel) {{
-                    bridge = channel.objects.bridge;
-                }});
-            }});
-        </script>
-        {js}
-        </head>
-        <body dir="rtl">
-        <div id="pages-container" style="overflow-y: auto; height: 100vh;">
-            {all_pages_html}
-        </div>
         </body>
         </html>
         """
@@ -1,6 +1,7 @@
 #data/repositories/quran_repository_impl.py
 from PyQt5.QtGui import QColor
 from data.datasources.quran_local_datasource import QuranLocalDataSource
+from data.datasources.lru_cache import LRUCache
 from domain.repository_interfaces.quran_repository_interface import IQuranRepository
 from domain.entities.page_entity import PageEntity
 from data.repositories.display_renderer import DisplayRenderer
@@ -9,6 +10,14 @@ class QuranRepositoryImpl(IQuranRepository):
     def __init__(self, config_path):
         self.local = QuranLocalDataSource(config_path)
         self.renderer = DisplayRenderer()
+        # SQLite, in-memory corpus or mmap'ed corpus file, per config "text_backend"
+        self.text_source = self.local.get_text_source()
+        # Sajda ayas are marked from a lookup table set once, not looked up per render
+        self.renderer.set_sajda_ayas(self.local.get_sajda_ayas())
+        # Rendered page fragments by (page id, editions, renderer style version); bounded by count and bytes
+        self.page_html_cache = LRUCache(self.local.config.get('page_html_cache_size', 64),
+                                        max_bytes=self.local.config.get('page_html_cache_bytes', 8 * 1024 * 1024))
+        self._shell = None  # (shell version, shell document)
 
     # Quran Data Access Methods
     def get_sura_list(self):
@@ -18,10 +27,10 @@ class QuranRepositoryImpl(IQuranRepository):
         return self.local.get_page_list()
 
     def get_aya_list(self, sura_id):
-        return self.local.get_aya_list(sura_id)
+        return self.text_source.get_aya_list(sura_id)
 
     def get_quran_text(self, sura_id, aya_id=0):
-        return self.local.get_quran_text(sura_id, aya_id)
+        return self.text_source.get_quran_text(sura_id, aya_id)
 
     def get_reciter_list(self):
         return self.local.get_reciter_list()
@@ -36,10 +45,34 @@ class QuranRepositoryImpl(IQuranRepository):
         return self.local.get_page_info(page_num)
 
     def get_quran_text_range(self, sura_id, start_aya, count):
-        return self.local.get_quran_text_range(sura_id, start_aya, count)
+        return self.text_source.get_quran_text_range(sura_id, start_aya, count)
 
     def get_page_text(self, page: PageEntity):
-        return self.local.fetch_page_text(page)
+        return self.text_source.fetch_page_text(page)
+
+    def get_page_editions(self, page: PageEntity, editions):
+        return self.local.fetch_page_editions(page, list(editions))
+
+    def get_page_words(self, page: PageEntity):
+        return self.local.fetch_page_words(page)
+
+    def get_edition_list(self):
+        return self.local.get_edition_list()
+
+    def search(self, query: str, limit: int = 50):
+        return self.local.search(query, limit)
+
+    def search_root(self, root: str, limit: int = 50):
+        return self.local.search_root(root, limit)
+
+    def get_similar_ayas(self, sura_id: int, aya_id: int, limit: int = 10):
+        return self.local.get_similar_ayas(sura_id, aya_id, limit)
+
+    def is_similarity_index_ready(self) -> bool:
+        return self.local.is_similarity_index_ready()
+
+    def load_similarity_index(self) -> None:
+        self.local.get_similarity_index()
 
     def get_first_page_for_sura(self, sura_id: int):
         return self.local.get_first_page_for_sura(sura_id)
@@ -47,10 +80,31 @@ class QuranRepositoryImpl(IQuranRepository):
     def get_sura_info(self, sura_id: int):
         return self.local.get_sura_info(sura_id)
 
+    def get_navigation_index(self):
+        return self.local.get_navigation_index()
+
+    def get_division_index(self):
+        return self.local.get_division_index()
+
+    def get_first_page_for_division(self, kind: str, number: int):
+        return self.local.get_first_page_for_division(kind, number)
+
     @property
     def model(self):
         return self.local
 
+    def get_db_stats(self):
+        return self.local.get_db_stats()
+
+    def get_playlist_cache_stats(self):
+        return self.local.get_playlist_cache_stats()
+
+    def get_page_html_cache_stats(self):
+        return self.page_html_cache.get_stats()
+
+    def close(self):
+        self.local.close()
+
     # Display Rendering Methods
     def set_font_color(self, color: QColor): 
         self.renderer.set_font_color(color)
@@ -75,9 +129,42 @@ class QuranRepositoryImpl(IQuranRepository):
 
     def get_font_size(self) -> int: 
         return self.renderer.get_font_size()  
+
+    def set_edition_layout(self, layout: str):
+        self.renderer.set_edition_layout(layout)
+
+    def get_edition_layout(self) -> str:
+        return self.renderer.get_edition_layout()
+
+    def set_word_highlights(self, highlights):
+        self.renderer.set_word_highlights(highlights)
     
-    def generate_html(self, sura_id, sura_info, quran_data) -> str:
-        return self.renderer.generate_html(sura_id, sura_info, quran_data)
+    def _page_html_key(self, page_id, editions):
+        return page_id, tuple(editions or ()), self.renderer.style_version
+
+    def get_cached_page_fragment(self, page_id, editions=()):
+        """The page fragment as last rendered with these editions and the current style, or None."""
+        return self.page_html_cache.get(self._page_html_key(page_id, editions))
+
+    def is_page_fragment_cached(self, page_id, editions=()) -> bool:
+        """Like get_cached_page_fragment() without counting a hit or miss (for the prefetcher)."""
+        return self._page_html_key(page_id, editions) in self.page_html_cache
+
+    def generate_page_fragment(self, page_id, sura_info, quran_data, page_words=None, editions=()) -> str:
+        # Key taken first: a style change during a background render must not label old HTML as new
+        key = self._page_html_key(page_id, editions)
+        fragment = self.renderer.generate_page_fragment(page_id, sura_info, quran_data, page_words)
+        self.page_html_cache.put(key, fragment)
+        return fragment
+
+    def get_shell_html(self) -> str:
+        """The document page fragments are swapped into; rebuilt only when fonts or colors change."""
+        if self._shell is None or self._shell[0] != self.renderer.shell_version:
+            self._shell = (self.renderer.shell_version, self.renderer.generate_shell())
+        return self._shell[1]
+
+    def generate_html(self, sura_id, sura_info, quran_data, page_words=None) -> str:
+        return self.renderer.generate_html(sura_id, sura_info, quran_data, page_words)
         #return self.renderer.generate_html_new(
         #    sura_id
         #)
@@ -0,0 +1,57 @@
+#data/repositories/tiered_quran_repository.py
+from data.datasources.quran_remote_datasource import QuranRemoteDataSource
+from data.datasources.tiered_quran_source import TieredQuranSource
+from data.repositories.quran_repository_impl import QuranRepositoryImpl
+from domain.entities.page_entity import PageEntity
+
+
+class TieredQuranRepository(QuranRepositoryImpl):
+    """
+    QuranRepositoryImpl that reads text, playlists and page/sura lookups through
+    TieredQuranSource (in-process cache -> local DB -> remote API), so other
+    editions and reciters are filled in lazily and written back locally.
+    """
+
+    def __init__(self, config_path, remote: QuranRemoteDataSource = None):
+        super().__init__(config_path)
+        config = self.local.config
+        self.remote = remote or QuranRemoteDataSource.from_config(config)
+        self.tiers = TieredQuranSource(
+            self.local, self.remote,
+            cache_size=config.get('memory_cache_size', 256),
+            local_edition=config.get('local_edition', 'quran-uthmani'),
+        )
+
+    def get_quran_text(self, sura_id, aya_id=0, edition=None):
+        return self.tiers.get_quran_text(sura_id, aya_id, edition)
+
+    def get_quran_text_range(self, sura_id, start_aya, count, edition=None):
+        return self.tiers.get_quran_text_range(sura_id, start_aya, count, edition)
+
+    def get_page_text(self, page: PageEntity, edition=None):
+        return self.tiers.fetch_page_text(page, edition)
+
+    def get_page_editions(self, page: PageEntity, editions):
+        return self.tiers.fetch_page_editions(page, list(editions))
+
+    def get_sura_playlist(self, sura_id, reciter):
+        return self.tiers.get_sura_playlist(sura_id, reciter)
+
+    def get_page_playlist(self, page_id, reciter):
+        return self.tiers.get_page_playlist(page_id, reciter)
+
+    def get_page_info(self, page_num):
+        return self.tiers.get_page_info(page_num)
+
+    def get_first_page_for_sura(self, sura_id: int):
+        return self.tiers.get_first_page_for_sura(sura_id)
+
+    def get_sura_info(self, sura_id: int):
+        return self.tiers.get_sura_info(sura_id)
+
+    def get_tier_stats(self):
+        return self.tiers.get_tier_stats()
+
+    def close(self):
+        self.remote.close()
+        super().close()
@@ -0,0 +1,68 @@
+#data/search/arabic_normalizer.py
+"""
+Folding of Quranic Arabic text for search: both the indexed aya text and the
+user's query go through normalize_arabic, so matching ignores tashkeel,
+tatweel, Quranic annotation marks and the spelling variants of alef/hamza.
+"""
+import re
+from typing import Dict, List
+
+ALEF = "ا"
+SUPERSCRIPT_ALEF = "ٰ"
+
+# Harakat, tanween, shadda, sukun, maddah/hamza above and below, ...
+_DIACRITICS = [chr(c) for c in range(0x064B, 0x0660)]
+# Small high/low letters, waqf signs, rub el hizb and sajda marks of the Uthmani script
+_QURANIC_MARKS = [chr(c) for c in range(0x06D6, 0x06EE)]
+_TATWEEL = "ـ"
+
+_FOLDED_LETTERS = {
+    "آ": ALEF,      # alef with madda above
+    "أ": ALEF,      # alef with hamza above
+    "إ": ALEF,      # alef with hamza below
+    "ٱ": ALEF,      # alef wasla
+    "ؤ": "و",  # waw with hamza above -> waw
+    "ئ": "ي",  # yeh with hamza above -> yeh
+    "ى": "ي",  # alef maksura -> yeh
+    "ة": "ه",  # teh marbuta -> heh
+}
+
+
+def _table(superscript_alef: str) -> Dict[int, str]:
+    table = {ord(ch): None for ch in _DIACRITICS + _QURANIC_MARKS + [_TATWEEL]}
+    table.update({ord(ch): folded for ch, folded in _FOLDED_LETTERS.items()})
+    table[ord(SUPERSCRIPT_ALEF)] = superscript_alef or None
+    return table
+
+
+_TABLES = {"": _table(""), ALEF: _table(ALEF)}
+
+# In the spelled-out form a superscript alef over waw replaces the waw
+# ("ٱلصَّلَوٰةَ" -> "الصلاه") and over alef maksura adds nothing ("عَلَىٰ" -> "علي").
+_SPELLED_FIXES = [
+    (re.compile("و([\u064B-\u065F]*)\u0670"), "ا\\1"),
+    (re.compile("ى([\u064B-\u065F]*)\u0670"), "ى\\1"),
+]
+
+
+def _fold(text: str, superscript_alef: str) -> str:
+    if superscript_alef == ALEF and SUPERSCRIPT_ALEF in text:
+        for pattern, replacement in _SPELLED_FIXES:
+            text = pattern.sub(replacement, text)
+    return text.translate(_TABLES.get(superscript_alef) or _table(superscript_alef))
+
+
+def normalize_arabic(text: str, superscript_alef: str = "") -> str:
+    """
+    Fold `text` for matching and collapse whitespace. The Uthmani superscript
+    alef is dropped by default ("ٱلرَّحْمَـٰنِ" -> "الرحمن"); pass
+    superscript_alef=ALEF for the spelled-out form ("ٱلْعَـٰلَمِينَ" -> "العالمين").
+    """
+    return " ".join(_fold(text, superscript_alef).split())
+
+
+def normalize_words(text: str, superscript_alef: str = "") -> List[str]:
+    """normalize_arabic applied per whitespace-separated word; words made only of marks become ""."""
+    # Folding never adds or removes whitespace, so the words stay aligned with text.split()
+    return _fold(" ".join(text.split()), superscript_alef).split(" ")
+
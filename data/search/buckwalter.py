@@ -0,0 +1,24 @@
+#data/search/buckwalter.py
+"""Extended Buckwalter transliteration, as used by the Quranic Arabic Corpus."""
+
+_BUCKWALTER = {
+    "'": "ء", ">": "أ", "&": "ؤ", "<": "إ", "}": "ئ", "A": "ا", "b": "ب", "p": "ة",
+    "t": "ت", "v": "ث", "j": "ج", "H": "ح", "x": "خ", "d": "د", "*": "ذ", "r": "ر",
+    "z": "ز", "s": "س", "$": "ش", "S": "ص", "D": "ض", "T": "ط", "Z": "ظ", "E": "ع",
+    "g": "غ", "_": "ـ", "f": "ف", "q": "ق", "k": "ك", "l": "ل", "m": "م", "n": "ن",
+    "h": "ه", "w": "و", "Y": "ى", "y": "ي", "F": "ً", "N": "ٌ", "K": "ٍ", "a": "َ",
+    "u": "ُ", "i": "ِ", "~": "ّ", "o": "ْ", "^": "ٓ", "#": "ٔ", "`": "ٰ", "{": "ٱ",
+    "|": "آ", ":": "ۜ", "@": "۟", "\"": "۠", "[": "ۢ", ";": "۪", ",": "ۭ", ".": "۬",
+    "!": "ۨ", "-": "ۣ", "+": "۫", "%": "ۮ",
+}
+_TABLE = str.maketrans(_BUCKWALTER)
+
+
+def buckwalter_to_arabic(text: str) -> str:
+    """Transliterate Buckwalter to Arabic script; characters outside the scheme are kept."""
+    return text.translate(_TABLE)
+
+
+def is_buckwalter(text: str) -> bool:
+    """Whether `text` is written in Buckwalter (ASCII) rather than Arabic script."""
+    return text.isascii()
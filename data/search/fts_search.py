@@ -0,0 +1,97 @@
+#data/search/fts_search.py
+import sqlite3
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from data.datasources.sqlite_connection_manager import SQLiteConnectionManager
+from data.search.arabic_normalizer import ALEF, SUPERSCRIPT_ALEF, normalize_words
+from data.search.search_query import Phrase, SearchQuery
+
+FTS_TABLE = "AyasSearch"
+
+
+def fts5_available(conn: sqlite3.Connection) -> bool:
+    """Whether this sqlite3 build has the FTS5 extension compiled in."""
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp.fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def build_fts_index(conn: sqlite3.Connection) -> bool:
+    """
+    (Re)create the AyasSearch FTS5 table over the normalized text of every aya,
+    keyed by global aya number. `plain` has the Uthmani superscript alef
+    dropped; `spelled` has it spelled out and is only filled for ayas where
+    that differs, so both common spellings of a query match. Both keep one
+    (possibly empty) word per word of Ayas.text, which lets snippets map
+    matches back to the original text without normalizing it again.
+    Returns False when FTS5 is not available.
+    """
+    if not fts5_available(conn):
+        return False
+    conn.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    conn.execute(f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(plain, spelled, tokenize='unicode61')")
+    conn.executemany(
+        f"INSERT INTO {FTS_TABLE} (rowid, plain, spelled) VALUES (?, ?, ?)",
+        ((aya_number, " ".join(normalize_words(text)),
+          " ".join(normalize_words(text, ALEF)) if SUPERSCRIPT_ALEF in text else "")
+         for aya_number, text in conn.execute("SELECT id, text FROM Ayas ORDER BY id").fetchall()))
+    conn.execute(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('optimize')")
+    return True
+
+
+def _fts_phrase(phrase: Phrase) -> str:
+    return '"' + " ".join(phrase.words) + '"' + (" *" if phrase.prefix else "")
+
+
+def to_fts_expression(query: SearchQuery) -> Optional[str]:
+    """The FTS5 MATCH expression for `query`, or None if it requires nothing."""
+    if not query.required:
+        return None
+    expression = " AND ".join(_fts_phrase(phrase) for phrase in query.required)
+    for phrase in query.excluded:
+        expression = f"({expression}) NOT {_fts_phrase(phrase)}"
+    return expression
+
+
+class FtsSearchBackend:
+    """Ranked aya search on the AyasSearch FTS5 table built by migration."""
+
+    name = "fts5"
+
+    def __init__(self, db: SQLiteConnectionManager):
+        self.db = db
+        self._available: Optional[bool] = None
+
+    def is_available(self) -> bool:
+        if self._available is None:
+            try:
+                self._available = self.db.fetchone(
+                    "SELECT 1 FROM sqlite_master WHERE name = ?", (FTS_TABLE,)) is not None
+                if self._available:
+                    self.db.fetchone(f"SELECT rowid FROM {FTS_TABLE} LIMIT 1")
+            except sqlite3.Error:
+                # e.g. the index was built by an sqlite3 with FTS5 and is read by one without
+                self._available = False
+        return self._available
+
+    def search(self, query: SearchQuery, limit: int = 50) -> List[Tuple[int, float]]:
+        """(global aya number, score) of the best matches, best first (BM25; lower is better)."""
+        expression = to_fts_expression(query)
+        if expression is None or not self.is_available():
+            return []
+        return self.db.fetchall(
+            f"SELECT rowid, rank FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ? ORDER BY rank LIMIT ?",
+            (expression, limit))
+
+    def get_normalized_words(self, aya_numbers: Sequence[int]) -> Dict[int, List[List[str]]]:
+        """{aya_number: [plain words, spelled words (only if different)]}, aligned with Ayas.text.split()."""
+        if not aya_numbers:
+            return {}
+        placeholders = ", ".join("?" * len(aya_numbers))
+        rows = self.db.fetchall(
+            f"SELECT rowid, plain, spelled FROM {FTS_TABLE} WHERE rowid IN ({placeholders})", list(aya_numbers))
+        return {aya_number: [plain.split(" ")] + ([spelled.split(" ")] if spelled else [])
+                for aya_number, plain, spelled in rows}
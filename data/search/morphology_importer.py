@@ -0,0 +1,122 @@
+#data/search/morphology_importer.py
+"""
+Import of the Quranic Arabic Corpus morphology file
+(quranic-corpus-morphology-0.4.txt) into the root index tables:
+
+    Roots(id, root)                         normalized root letters, e.g. "كتب"
+    WordForms(id, root_id, lemma, form)     a lemma and a normalized word form of a root
+    RootOccurrences(form_id, aya_number, word_index)
+
+Each data line of the file is one segment of a word:
+
+    (2:2:2:2)	kita`bu	N	STEM|POS:N|LEM:kita`b|ROOT:ktb|M|NOM
+
+i.e. (sura:aya:word:segment), the segment in Buckwalter, its tag and the
+features; the STEM segment carries the word's LEM and ROOT.
+"""
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from data.search.arabic_normalizer import normalize_arabic
+from data.search.buckwalter import buckwalter_to_arabic, is_buckwalter
+
+_LOCATION = re.compile(r"\((\d+):(\d+):(\d+):(\d+)\)")
+
+
+@dataclass
+class MorphologyWord:
+    sura_id: int
+    aya_id: int
+    word_index: int      # 1-based, marks not counted
+    root: str            # Arabic letters
+    lemma: str           # Arabic, vocalized
+    form: str            # Buckwalter segments joined
+
+
+@dataclass
+class ImportResult:
+    words: int = 0       # words with a root
+    roots: int = 0
+    forms: int = 0
+    skipped: int = 0     # words whose location does not exist in the Words table
+    seconds: float = 0.0
+
+
+def normalize_root(root: str) -> str:
+    """Root letters as stored in Roots.root: "ك ت ب", "كتب" and Buckwalter "ktb" all give "كتب"."""
+    root = "".join(root.split())
+    if is_buckwalter(root):
+        root = buckwalter_to_arabic(root)
+    return normalize_arabic(root)
+
+
+def parse_morphology(lines: Iterable[str]) -> Iterator[MorphologyWord]:
+    """Words with a root, in file order; segments of a word are merged."""
+    current: Optional[Tuple[int, int, int]] = None
+    form, root, lemma = "", None, None
+    for line in lines:
+        parts = line.rstrip("\n").split("\t")
+        match = _LOCATION.fullmatch(parts[0]) if len(parts) >= 4 else None
+        if match is None:
+            continue  # comments, header
+        sura_id, aya_id, word_index, _ = map(int, match.groups())
+        if (sura_id, aya_id, word_index) != current:
+            if current is not None and root:
+                yield MorphologyWord(*current, buckwalter_to_arabic(root), buckwalter_to_arabic(lemma or ""), form)
+            current, form, root, lemma = (sura_id, aya_id, word_index), "", None, None
+        form += parts[1]
+        for feature in parts[3].split("|"):
+            if feature.startswith("ROOT:"):
+                root = feature[5:]
+            elif feature.startswith("LEM:"):
+                lemma = feature[4:]
+    if current is not None and root:
+        yield MorphologyWord(*current, buckwalter_to_arabic(root), buckwalter_to_arabic(lemma or ""), form)
+
+
+def import_morphology(conn: sqlite3.Connection, path: str) -> ImportResult:
+    """
+    Replace the root index with the contents of the morphology file at `path`.
+    Word forms are taken from the Words table (the normalized aya text), so
+    they match what search and the renderer see.
+    """
+    start = time.perf_counter()
+    words: Dict[Tuple[int, int, int], Tuple[int, str]] = {
+        (sura_id, aya_id, word_index): (aya_number, form)
+        for sura_id, aya_id, aya_number, word_index, form in conn.execute(
+            "SELECT a.sura_id, a.aya_id, w.aya_number, w.word_index, w.form "
+            "FROM Words w JOIN Ayas a ON a.id = w.aya_number")
+    }
+
+    result = ImportResult()
+    roots: Dict[str, int] = {}
+    forms: Dict[Tuple[int, str, str], int] = {}
+    occurrences = []
+    with open(path, "r", encoding="utf-8") as f:
+        for word in parse_morphology(f):
+            known = words.get((word.sura_id, word.aya_id, word.word_index))
+            if known is None:
+                result.skipped += 1
+                continue
+            aya_number, surface = known
+            root_id = roots.setdefault(normalize_root(word.root), len(roots) + 1)
+            form_id = forms.setdefault((root_id, word.lemma, surface), len(forms) + 1)
+            occurrences.append((form_id, aya_number, word.word_index))
+
+    with conn:
+        conn.execute("DELETE FROM RootOccurrences")
+        conn.execute("DELETE FROM WordForms")
+        conn.execute("DELETE FROM Roots")
+        conn.executemany("INSERT INTO Roots (id, root) VALUES (?, ?)",
+                         [(root_id, root) for root, root_id in roots.items()])
+        conn.executemany("INSERT INTO WordForms (id, root_id, lemma, form) VALUES (?, ?, ?, ?)",
+                         [(form_id, *key) for key, form_id in forms.items()])
+        conn.executemany("INSERT OR IGNORE INTO RootOccurrences (form_id, aya_number, word_index) VALUES (?, ?, ?)",
+                         occurrences)
+
+    result.words, result.roots, result.forms = len(occurrences), len(roots), len(forms)
+    result.seconds = time.perf_counter() - start
+    return result
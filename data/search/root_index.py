@@ -0,0 +1,60 @@
+#data/search/root_index.py
+import sqlite3
+from typing import Dict, List, Tuple
+
+from data.datasources.sqlite_connection_manager import SQLiteConnectionManager
+from data.search.morphology_importer import normalize_root
+
+
+class RootIndex:
+    """
+    Lookups on the Roots/WordForms/RootOccurrences tables (migration 7,
+    filled by import_morphology): every word of the Quran derived from a root.
+    """
+
+    def __init__(self, db: SQLiteConnectionManager):
+        self.db = db
+
+    def is_available(self) -> bool:
+        """Whether a morphology dataset has been imported."""
+        try:
+            return self.db.fetchone("SELECT 1 FROM Roots LIMIT 1") is not None
+        except sqlite3.Error:
+            return False
+
+    def find_root(self, root: str) -> List[Tuple[int, int, str, str]]:
+        """
+        (aya_number, word_index, form, lemma) of every word derived from `root`,
+        in mushaf order; `root` may be spaced ("ك ت ب"), joined ("كتب") or
+        Buckwalter ("ktb"). word_index is 1-based, as in the Words table.
+        """
+        root = normalize_root(root)
+        if not root:
+            return []
+        return self.db.fetchall("""
+            SELECT o.aya_number, o.word_index, f.form, f.lemma
+            FROM Roots r
+            JOIN WordForms f ON f.root_id = r.id
+            JOIN RootOccurrences o ON o.form_id = f.id
+            WHERE r.root = ?
+            ORDER BY o.aya_number, o.word_index
+        """, (root,))
+
+    def find_root_ayas(self, root: str) -> Dict[int, List[int]]:
+        """{aya_number: [word_index, ...]} of the words derived from `root`, in mushaf order."""
+        ayas: Dict[int, List[int]] = {}
+        for aya_number, word_index, _, _ in self.find_root(root):
+            ayas.setdefault(aya_number, []).append(word_index)
+        return ayas
+
+    def get_forms(self, root: str) -> List[Tuple[str, str, int]]:
+        """(lemma, form, occurrences) of a root, most frequent first."""
+        return self.db.fetchall("""
+            SELECT f.lemma, f.form, COUNT(*) AS n
+            FROM Roots r
+            JOIN WordForms f ON f.root_id = r.id
+            JOIN RootOccurrences o ON o.form_id = f.id
+            WHERE r.root = ?
+            GROUP BY f.id
+            ORDER BY n DESC, f.form
+        """, (normalize_root(root),))
@@ -0,0 +1,51 @@
+#data/search/search_query.py
+import re
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from data.search.arabic_normalizer import normalize_arabic
+
+_PARTS = re.compile(r'-?"[^"]*"?|\S+')
+
+
+@dataclass(frozen=True)
+class Phrase:
+    """Consecutive normalized words; with `prefix` the last word may be the start of a longer word."""
+    words: Tuple[str, ...]
+    prefix: bool = False
+
+
+@dataclass
+class SearchQuery:
+    """
+    A parsed search: every `required` phrase must occur in the aya and no
+    `excluded` one may. Query syntax (words are normalized like aya text):
+
+        word            the word must occur
+        "two words"     the words must occur consecutively
+        word*           a word starting with "word" must occur
+        -word, -"a b"   the word/phrase must not occur
+    """
+    required: List[Phrase] = field(default_factory=list)
+    excluded: List[Phrase] = field(default_factory=list)
+
+    @classmethod
+    def parse(cls, text: str) -> "SearchQuery":
+        query = cls()
+        for part in _PARTS.findall(text or ""):
+            negated = part.startswith("-") and len(part) > 1
+            if negated:
+                part = part[1:]
+            prefix = part.rstrip('"').endswith("*")
+            words = tuple(normalize_arabic(part.replace('"', " ").replace("*", " ")).split())
+            if words:
+                (query.excluded if negated else query.required).append(Phrase(words, prefix))
+        return query
+
+    def __bool__(self) -> bool:
+        return bool(self.required)
+
+    def words(self) -> List[Tuple[str, bool]]:
+        """(word, is_prefix) for every word of the required phrases, for highlighting."""
+        return [(word, phrase.prefix and i == len(phrase.words) - 1)
+                for phrase in self.required for i, word in enumerate(phrase.words)]
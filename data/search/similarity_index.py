@@ -0,0 +1,162 @@
+#data/search/similarity_index.py
+"""
+Near-duplicate ayas (mutashabihat) precomputed with MinHash and LSH.
+
+Every aya is reduced to its set of word shingles (pairs of consecutive
+normalized words; the word itself for one-word ayas). A MinHash signature of
+NUM_PERM hash minima estimates the Jaccard similarity of two such sets;
+cutting the signature into BANDS bands of ROWS values and bucketing ayas by
+band makes ayas that share any band candidates (from about 20% similarity
+on, nearly all pairs at MIN_SIMILARITY are found), so only some thousands of
+the ~19M pairs are compared exactly.
+
+The index keeps the `top_k` most similar ayas of every aya, so a lookup is
+one slice. Cache file layout (little-endian):
+
+    header     magic b"QRSI", uint16 version, uint16 top_k, uint32 aya_count
+    neighbors  aya_count x top_k uint16 global aya numbers (0 = none), row n-1 for aya n
+    scores     aya_count x top_k uint8 Jaccard similarity in percent
+"""
+import hashlib
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from data.search.arabic_normalizer import normalize_words
+
+MAGIC = b"QRSI"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sHHI")
+
+NUM_PERM = 64
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+TOP_K = 10
+MIN_SIMILARITY = 0.3     # Jaccard; pairs below are not kept
+_EMPTY = (1 << 32) - 1
+
+
+def shingles(words: Sequence[str]) -> Set[str]:
+    """Pairs of consecutive words ("a b"), or the single word of a one-word aya."""
+    words = [word for word in words if word]
+    if len(words) < 2:
+        return set(words)
+    return {f"{first} {second}" for first, second in zip(words, words[1:])}
+
+
+def shingle_hashes(shingle: str) -> array:
+    """NUM_PERM independent 32-bit hashes of a shingle (SHAKE-128 output cut into uint32s)."""
+    return array("I", hashlib.shake_128(shingle.encode("utf-8")).digest(NUM_PERM * 4))
+
+
+def minhash(shingle_set: Iterable[str], cache: Optional[Dict[str, array]] = None) -> Tuple[int, ...]:
+    """MinHash signature: per hash function, the minimum over the shingles' hashes."""
+    cache = {} if cache is None else cache
+    hashes = []
+    for shingle in shingle_set:
+        values = cache.get(shingle)
+        if values is None:
+            values = cache[shingle] = shingle_hashes(shingle)
+        hashes.append(values)
+    if not hashes:
+        return (_EMPTY,) * NUM_PERM
+    return tuple(map(min, zip(*hashes)))
+
+
+def jaccard(first: Set[str], second: Set[str]) -> float:
+    if not first or not second:
+        return 0.0
+    common = len(first & second)
+    return common / (len(first) + len(second) - common)
+
+
+class SimilarityIndex:
+    def __init__(self, neighbors: array, scores: array, top_k: int = TOP_K):
+        self.neighbors = neighbors    # aya_count * top_k global aya numbers, 0 = none
+        self.scores = scores          # matching Jaccard similarity in percent
+        self.top_k = top_k
+
+    @property
+    def aya_count(self) -> int:
+        return len(self.neighbors) // self.top_k if self.top_k else 0
+
+    # --- building and persistence ---
+    @classmethod
+    def build(cls, rows: Iterable[Tuple[int, str]], top_k: int = TOP_K,
+              min_similarity: float = MIN_SIMILARITY) -> "SimilarityIndex":
+        """Index (aya_number, text) rows; aya numbers must run 1..n."""
+        sets: Dict[int, Set[str]] = {aya_number: shingles(normalize_words(text)) for aya_number, text in rows}
+        cache: Dict[str, array] = {}
+        buckets: Dict[Tuple[int, ...], List[int]] = {}
+        for aya_number, shingle_set in sets.items():
+            signature = minhash(shingle_set, cache)
+            for band in range(BANDS):
+                key = (band,) + signature[band * ROWS:(band + 1) * ROWS]
+                buckets.setdefault(key, []).append(aya_number)
+
+        candidates: Set[Tuple[int, int]] = set()
+        for members in buckets.values():
+            for i, first in enumerate(members):
+                for second in members[i + 1:]:
+                    candidates.add((first, second))
+
+        similar: Dict[int, List[Tuple[float, int]]] = {}
+        for first, second in candidates:
+            score = jaccard(sets[first], sets[second])
+            if score >= min_similarity:
+                similar.setdefault(first, []).append((score, second))
+                similar.setdefault(second, []).append((score, first))
+
+        aya_count = max(sets, default=0)
+        neighbors = array("H", [0]) * (aya_count * top_k)
+        scores = array("B", [0]) * (aya_count * top_k)
+        for aya_number, found in similar.items():
+            found.sort(key=lambda item: (-item[0], item[1]))
+            row = (aya_number - 1) * top_k
+            for offset, (score, other) in enumerate(found[:top_k]):
+                neighbors[row + offset] = other
+                scores[row + offset] = round(score * 100)
+        return cls(neighbors, scores, top_k)
+
+    def save(self, path: str) -> int:
+        """Write the index to `path` (atomically); returns the file size."""
+        neighbors, scores = array("H", self.neighbors), array("B", self.scores)
+        if sys.byteorder != "little":
+            neighbors.byteswap()
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, self.top_k, self.aya_count))
+            f.write(neighbors.tobytes())
+            f.write(scores.tobytes())
+        os.replace(tmp_path, path)
+        return os.path.getsize(path)
+
+    @classmethod
+    def load(cls, path: str) -> "SimilarityIndex":
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path} is truncated")
+        magic, version, top_k, aya_count = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} similarity index")
+        entries = aya_count * top_k
+        if len(data) != _HEADER.size + entries * 3:
+            raise ValueError(f"{path} is corrupt")
+        neighbors = array("H")
+        neighbors.frombytes(data[_HEADER.size:_HEADER.size + entries * 2])
+        if sys.byteorder != "little":
+            neighbors.byteswap()
+        scores = array("B", data[_HEADER.size + entries * 2:])
+        return cls(neighbors, scores, top_k)
+
+    # --- queries ---
+    def similar(self, aya_number: int) -> List[Tuple[int, int]]:
+        """(global aya number, similarity in percent) of the ayas most like `aya_number`, best first."""
+        if not 1 <= aya_number <= self.aya_count:
+            return []
+        row = (aya_number - 1) * self.top_k
+        return [(other, self.scores[row + offset])
+                for offset, other in enumerate(self.neighbors[row:row + self.top_k]) if other]
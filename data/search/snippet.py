@@ -0,0 +1,52 @@
+#data/search/snippet.py
+from typing import List, Optional, Sequence
+
+from data.search.arabic_normalizer import ALEF, SUPERSCRIPT_ALEF, normalize_words
+from data.search.search_query import SearchQuery
+
+SNIPPET_MARKS = ("[", "]")
+ELLIPSIS = "…"
+
+
+def matched_word_positions(text: str, query: SearchQuery,
+                           spellings: Optional[List[List[str]]] = None) -> List[int]:
+    """
+    Indexes of the whitespace-separated words of `text` that match a word of
+    the query. `spellings` are the text's normalized words if already known
+    (see FtsSearchBackend.get_normalized_words).
+    """
+    exact = {word for word, prefix in query.words() if not prefix}
+    prefixes = tuple(word for word, prefix in query.words() if prefix)
+    # Both spellings were indexed; the spelled-out one only differs where a superscript alef occurs
+    if spellings is None:
+        spellings = [normalize_words(text)]
+        if SUPERSCRIPT_ALEF in text:
+            spellings.append(normalize_words(text, ALEF))
+    positions = set()
+    for words in spellings:
+        for position, word in enumerate(words):
+            # "" (a word of only marks) is never in `exact` and starts with no prefix
+            if word in exact or (prefixes and word.startswith(prefixes)):
+                positions.add(position)
+    return sorted(positions)
+
+
+def make_snippet(text: str, query: Optional[SearchQuery], window: int = 12,
+                 marks: Sequence[str] = SNIPPET_MARKS, spellings: Optional[List[List[str]]] = None,
+                 positions: Optional[Sequence[int]] = None) -> str:
+    """
+    Up to `window` words of the original (diacritized) aya text around the
+    first match, with matched words wrapped in `marks`. `positions` (sorted
+    indexes into text.split()) replace the query matching when given.
+    """
+    words = text.split()
+    if positions is None:
+        positions = matched_word_positions(text, query, spellings)
+    start = 0
+    if positions and len(words) > window:
+        start = max(0, min(positions[0] - window // 3, len(words) - window))
+    end = min(len(words), start + window)
+    matched = set(positions)
+    shown = [f"{marks[0]}{word}{marks[1]}" if i in matched else word for i, word in enumerate(words[start:end], start)]
+    return (ELLIPSIS + " " if start > 0 else "") + " ".join(shown) + (" " + ELLIPSIS if end < len(words) else "")
+
@@ -0,0 +1,250 @@
+#data/search/trigram_index.py
+"""
+Pure-Python trigram index over normalized aya text, the search backend for
+sqlite3 builds without FTS5.
+
+Every word is padded with spaces (" word ") before it is cut into
+trigrams, so a whole-word query only needs the ayas containing all of its
+padded trigrams, and a prefix query (" word") the ones at a word start.
+Postings are sorted aya positions, delta-encoded into a single array('I').
+Candidates from the postings intersection are verified against the aya's
+normalized words, which also gives the term counts for ranking.
+
+Cache file layout (all integers little-endian):
+
+    header        magic b"QRTI", uint16 version, uint16 reserved,
+                  uint32 aya_count, uint32 trigram_count, uint32 postings_count,
+                  uint32 trigrams_bytes, uint32 words_bytes
+    aya numbers   aya_count x uint32
+    trigram table trigram_count x (uint32 start, uint32 count) into the postings
+    postings      postings_count x uint32 deltas
+    trigrams      UTF-8 trigrams joined by "\n", in table order
+    words         UTF-8, one line per aya: plain words, then "\t" and the
+                  spelled-out words if they differ (see build_fts_index)
+"""
+import math
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from data.search.arabic_normalizer import ALEF, SUPERSCRIPT_ALEF, normalize_words
+from data.search.search_query import Phrase, SearchQuery
+
+MAGIC = b"QRTI"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sHHIIIII")
+
+# BM25 parameters, as in FTS5
+K1 = 1.2
+B = 0.75
+
+
+def word_trigrams(word: str, prefix: bool = False) -> List[str]:
+    """Trigrams of " word " (" word" for a prefix); [] when the word is too short to have any."""
+    padded = f" {word}" if prefix else f" {word} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def intersect_sorted(small: Sequence[int], large: Sequence[int]) -> List[int]:
+    """Intersection of two sorted lists, galloping through the larger one with bisect."""
+    if len(small) > len(large):
+        small, large = large, small
+    result = []
+    position, end = 0, len(large)
+    for value in small:
+        position = bisect_left(large, value, position)
+        if position == end:
+            break
+        if large[position] == value:
+            result.append(value)
+    return result
+
+
+def _occurrences(words: List[str], phrase: Phrase) -> int:
+    """How often the phrase occurs as consecutive words (the last one a prefix if phrase.prefix)."""
+    first, size = phrase.words[0], len(phrase.words)
+    if size == 1:
+        return sum(1 for word in words if word.startswith(first)) if phrase.prefix else words.count(first)
+    count = 0
+    for i in range(len(words) - size + 1):
+        if words[i] != first:
+            continue
+        tail = words[i + 1:i + size]
+        if tail[:-1] == list(phrase.words[1:-1]) and (
+                tail[-1].startswith(phrase.words[-1]) if phrase.prefix else tail[-1] == phrase.words[-1]):
+            count += 1
+    return count
+
+
+class TrigramIndex:
+    def __init__(self, aya_numbers: array, spellings: List[List[List[str]]],
+                 table: Dict[str, Tuple[int, int]], postings: array):
+        self.aya_numbers = aya_numbers
+        self.spellings = spellings          # per aya: [plain words] or [plain words, spelled words]
+        self.table = table                  # trigram -> (start, count) in postings
+        self.postings = postings            # delta-encoded aya positions
+        self._position = {aya_number: i for i, aya_number in enumerate(aya_numbers)}
+        lengths = [len(words[0]) for words in spellings]
+        average = (sum(lengths) / len(lengths)) if lengths else 1.0
+        # BM25 length normalization per aya, precomputed
+        self._norms = [K1 * (1 - B + B * length / average) for length in lengths]
+
+    # --- building and persistence ---
+    @classmethod
+    def build(cls, rows: Iterable[Tuple[int, str]]) -> "TrigramIndex":
+        """Index (aya_number, text) rows given in aya order."""
+        aya_numbers = array("I")
+        spellings: List[List[List[str]]] = []
+        grams: Dict[str, List[int]] = {}
+        for position, (aya_number, text) in enumerate(rows):
+            aya_numbers.append(aya_number)
+            words = [normalize_words(text)]
+            if SUPERSCRIPT_ALEF in text:
+                spelled = normalize_words(text, ALEF)
+                if spelled != words[0]:
+                    words.append(spelled)
+            spellings.append(words)
+            for trigram in {t for variant in words for word in variant if word for t in word_trigrams(word)}:
+                grams.setdefault(trigram, []).append(position)
+
+        table: Dict[str, Tuple[int, int]] = {}
+        postings = array("I")
+        for trigram in sorted(grams):
+            positions = grams[trigram]
+            table[trigram] = (len(postings), len(positions))
+            postings.extend(current - previous for previous, current in zip([0] + positions, positions))
+        return cls(aya_numbers, spellings, table, postings)
+
+    def save(self, path: str) -> int:
+        """Write the index to `path` (atomically); returns the file size."""
+        trigrams = list(self.table)
+        entries = array("I", [value for trigram in trigrams for value in self.table[trigram]])
+        aya_numbers, postings = array("I", self.aya_numbers), array("I", self.postings)
+        if sys.byteorder != "little":
+            for values in (aya_numbers, entries, postings):
+                values.byteswap()
+        trigram_blob = "\n".join(trigrams).encode("utf-8")
+        words_blob = "\n".join("\t".join(" ".join(words) for words in variants)
+                               for variants in self.spellings).encode("utf-8")
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(aya_numbers), len(trigrams), len(postings),
+                                 len(trigram_blob), len(words_blob)))
+            for blob in (aya_numbers.tobytes(), entries.tobytes(), postings.tobytes(), trigram_blob, words_blob):
+                f.write(blob)
+        os.replace(tmp_path, path)
+        return os.path.getsize(path)
+
+    @classmethod
+    def load(cls, path: str) -> "TrigramIndex":
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path} is truncated")
+        magic, version, _, aya_count, trigram_count, postings_count, trigrams_bytes, words_bytes = \
+            _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} trigram index")
+
+        def take(position: int, count: int) -> array:
+            values = array("I")
+            values.frombytes(data[position:position + count * 4])
+            if sys.byteorder != "little":
+                values.byteswap()
+            return values
+
+        position = _HEADER.size
+        aya_numbers = take(position, aya_count)
+        position += aya_count * 4
+        entries = take(position, trigram_count * 2)
+        position += trigram_count * 8
+        postings = take(position, postings_count)
+        position += postings_count * 4
+        trigrams = data[position:position + trigrams_bytes].decode("utf-8").split("\n") if trigram_count else []
+        position += trigrams_bytes
+        lines = data[position:position + words_bytes].decode("utf-8").split("\n")
+        if len(trigrams) != trigram_count or len(lines) != aya_count or position + words_bytes != len(data):
+            raise ValueError(f"{path} is corrupt")
+
+        table = {trigram: (entries[2 * i], entries[2 * i + 1]) for i, trigram in enumerate(trigrams)}
+        spellings = [[variant.split(" ") for variant in line.split("\t")] for line in lines]
+        return cls(aya_numbers, spellings, table, postings)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "ayas": len(self.aya_numbers),
+            "trigrams": len(self.table),
+            "postings": len(self.postings),
+            "postings_bytes": len(self.postings) * self.postings.itemsize,
+        }
+
+    # --- queries ---
+    def positions(self, trigram: str) -> List[int]:
+        """Sorted aya positions containing the trigram (decoded from its delta list)."""
+        entry = self.table.get(trigram)
+        if entry is None:
+            return []
+        start, count = entry
+        return list(accumulate(self.postings[start:start + count]))
+
+    def candidates(self, phrase: Phrase) -> Optional[List[int]]:
+        """
+        Aya positions that may contain the phrase: the intersection of its
+        words' trigram postings, rarest first. None if the phrase has no
+        trigram at all (a one-letter prefix), i.e. every aya is a candidate.
+        """
+        trigrams = set()
+        for i, word in enumerate(phrase.words):
+            trigrams.update(word_trigrams(word, phrase.prefix and i == len(phrase.words) - 1))
+        if not trigrams:
+            return None
+        lists = sorted((self.positions(trigram) for trigram in trigrams), key=len)
+        result = lists[0]
+        for positions in lists[1:]:
+            if not result:
+                break
+            result = intersect_sorted(result, positions)
+        return result
+
+    def search(self, query: SearchQuery, limit: int = 50) -> List[Tuple[int, float]]:
+        """(aya number, score) of the best matches, best first, scored by BM25 like FTS5 (lower is better)."""
+        if not query.required:
+            return []
+        phrase_candidates = [self.candidates(phrase) for phrase in query.required]
+        known = sorted((c for c in phrase_candidates if c is not None), key=len)
+        if known:
+            candidates = known[0]
+            for positions in known[1:]:
+                candidates = intersect_sorted(candidates, positions)
+        else:
+            candidates = range(len(self.aya_numbers))
+
+        total = len(self.aya_numbers)
+        # Document frequencies are estimated from the (unverified) candidates of each phrase
+        idf = [math.log(1 + (total - df + 0.5) / (df + 0.5))
+               for df in (len(c) if c is not None else total for c in phrase_candidates)]
+        required, excluded = query.required, query.excluded
+        scored = []
+        for position in candidates:
+            spellings = self.spellings[position]
+            score = 0.0
+            for phrase, weight in zip(required, idf):
+                count = max(_occurrences(words, phrase) for words in spellings) if len(spellings) > 1 \
+                    else _occurrences(spellings[0], phrase)
+                if not count:
+                    break
+                score -= weight * count * (K1 + 1) / (count + self._norms[position])
+            else:
+                if not (excluded and any(_occurrences(words, phrase) for phrase in excluded for words in spellings)):
+                    scored.append((score, self.aya_numbers[position]))
+        scored.sort()
+        return [(aya_number, score) for score, aya_number in scored[:limit]]
+
+    def get_normalized_words(self, aya_numbers: Sequence[int]) -> Dict[int, List[List[str]]]:
+        return {aya_number: self.spellings[self._position[aya_number]]
+                for aya_number in aya_numbers if aya_number in self._position}
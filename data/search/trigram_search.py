@@ -0,0 +1,68 @@
+#data/search/trigram_search.py
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from data.datasources.sqlite_connection_manager import SQLiteConnectionManager
+from data.search.search_query import SearchQuery
+from data.search.trigram_index import TrigramIndex
+
+
+class TrigramSearchBackend:
+    """
+    Search backend over a TrigramIndex, for sqlite3 builds without FTS5.
+    Same interface and query semantics as FtsSearchBackend.
+
+    The index is loaded from `path` on first use, or built from the Ayas
+    table and written there if the file is missing, stale or unreadable.
+    """
+
+    name = "trigram"
+
+    def __init__(self, db: SQLiteConnectionManager, path: Optional[str] = None):
+        self.db = db
+        self.path = path
+        self._index: Optional[TrigramIndex] = None
+        self._lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        return True
+
+    def get_index(self) -> TrigramIndex:
+        with self._lock:
+            if self._index is None:
+                self._index = self._load() or self._build()
+            return self._index
+
+    def _load(self) -> Optional[TrigramIndex]:
+        if not self.path or not os.path.exists(self.path):
+            return None
+        try:
+            index = TrigramIndex.load(self.path)
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Rebuilding search index {self.path}: {e}")
+            return None
+        aya_count = self.db.fetchone("SELECT COUNT(*) FROM Ayas")[0]
+        if len(index.aya_numbers) != aya_count:
+            print(f"[WARN] Rebuilding search index {self.path}: built for {len(index.aya_numbers)} ayas, not {aya_count}")
+            return None
+        return index
+
+    def _build(self) -> TrigramIndex:
+        index = TrigramIndex.build(self.db.fetchall("SELECT id, text FROM Ayas ORDER BY id"))
+        if self.path:
+            print(f"[INFO] Building search index: {self.path}")
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                index.save(self.path)
+            except OSError as e:
+                print(f"[WARN] Could not write search index {self.path}: {e}")
+        return index
+
+    def search(self, query: SearchQuery, limit: int = 50) -> List[Tuple[int, float]]:
+        """(global aya number, score) of the best matches, best first (BM25; lower is better)."""
+        return self.get_index().search(query, limit) if query else []
+
+    def get_normalized_words(self, aya_numbers: Sequence[int]) -> Dict[int, List[List[str]]]:
+        """{aya_number: [plain words, spelled words (only if different)]}, aligned with Ayas.text.split()."""
+        return self.get_index().get_normalized_words(aya_numbers)
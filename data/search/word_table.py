@@ -0,0 +1,44 @@
+#data/search/word_table.py
+"""
+The Words table: every word of every aya, tokenized once at build time.
+
+    Words(aya_number, word_index, position, char_start, char_end, form)
+
+word_index is 1-based over the real words of the aya (tokens made only of
+waqf marks are not words), the numbering of the Quranic Arabic Corpus;
+position is the word's index in Ayas.text.split(); char_start/char_end are
+offsets into Ayas.text, so text[char_start:char_end] is the word; form is the
+normalized spelling (see normalize_words).
+"""
+import re
+import sqlite3
+from typing import List, Tuple
+
+from data.search.arabic_normalizer import normalize_words
+
+WordRow = Tuple[int, int, int, int, str]  # word_index, position, start, end, form
+
+_TOKEN = re.compile(r"\S+")
+
+
+def tokenize_aya(text: str) -> List[WordRow]:
+    """(word_index, position, start, end, form) of the words of an aya, in order."""
+    forms = normalize_words(text)
+    words = []
+    for position, match in enumerate(_TOKEN.finditer(text)):
+        if forms[position]:
+            words.append((len(words) + 1, position, match.start(), match.end(), forms[position]))
+    return words
+
+
+def build_word_table(conn: sqlite3.Connection) -> int:
+    """(Re)fill the Words table from Ayas; returns the number of words."""
+    conn.execute("DELETE FROM Words")
+    rows = [
+        (aya_number, *word)
+        for aya_number, text in conn.execute("SELECT id, text FROM Ayas ORDER BY id").fetchall()
+        for word in tokenize_aya(text)
+    ]
+    conn.executemany(
+        "INSERT INTO Words (aya_number, word_index, position, char_start, char_end, form) VALUES (?, ?, ?, ?, ?, ?)", rows)
+    return len(rows)
@@ -0,0 +1,211 @@
+#data/sync/mirror_sync.py
+import asyncio
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from data.datasources.quran_remote_datasource import QuranRemoteDataSource
+
+KINDS = ("text", "audio")
+
+# Placeholders tried when inferring a reciter's URL template, most specific first.
+_TEMPLATE_PLACEHOLDERS = (
+    ("{sura:03d}{aya:03d}", lambda sura, aya, number: f"{sura:03d}{aya:03d}"),
+    ("{aya_number}", lambda sura, aya, number: str(number)),
+)
+
+
+def _escape_format(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def infer_audio_template(rows: Iterable[Tuple[int, int, int, str]]) -> Optional[str]:
+    """
+    Most common URL template over (sura_id, aya_id, aya_number, url) rows,
+    e.g. "https://cdn/.../ar.alafasy/{aya_number}.mp3"; None if nothing fits.
+    """
+    votes: Counter = Counter()
+    for sura_id, aya_id, number, url in rows:
+        for placeholder, value in _TEMPLATE_PLACEHOLDERS:
+            head, found, tail = url.rpartition(value(sura_id, aya_id, number))
+            if found:
+                votes[_escape_format(head) + placeholder + _escape_format(tail)] += 1
+                break
+    return votes.most_common(1)[0][0] if votes else None
+
+
+@dataclass
+class SyncResult:
+    edition: str
+    kind: str
+    fetched_suras: int = 0
+    resumed_suras: int = 0
+    rows_written: int = 0
+    failed_suras: List[int] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def complete(self) -> bool:
+        return not self.failed_suras
+
+
+class MirrorSync:
+    """
+    Mirrors a remote text edition or audio edition into quran.db.
+
+    Suras are fetched by a bounded pool of asyncio workers and written in
+    `executemany` batches, one transaction per batch. After each batch the
+    finished sura ids are checkpointed to `<checkpoint_dir>/<edition>.<kind>.json`,
+    so an interrupted sync resumes with the missing suras only (rows are
+    upserted, so a batch written just before a crash is harmless to repeat).
+
+    - text editions go to EditionAyas, keyed by global aya number, plus a row in Editions
+    - audio editions become a reciter: a URL template in ReciterAudio inferred
+      from the downloaded URLs, AudioOverrides for ayas that deviate, and a Reciters row
+
+    Expects a database already migrated to the current schema.
+    """
+
+    def __init__(self, db_file: str, remote: QuranRemoteDataSource, checkpoint_dir: str,
+                 workers: int = 8, commit_every: int = 16):
+        self.db_file = db_file
+        self.remote = remote
+        self.checkpoint_dir = checkpoint_dir
+        self.workers = workers
+        self.commit_every = commit_every
+
+    # --- checkpoints ---
+    def _checkpoint_path(self, edition: str, kind: str) -> str:
+        return os.path.join(self.checkpoint_dir, f"{edition}.{kind}.json")
+
+    def _load_checkpoint(self, edition: str, kind: str) -> Dict:
+        try:
+            with open(self._checkpoint_path(edition, kind), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"edition": edition, "kind": kind, "done": [], "meta": None}
+
+    def _save_checkpoint(self, checkpoint: Dict) -> None:
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        path = self._checkpoint_path(checkpoint["edition"], checkpoint["kind"])
+        fd, tmp_path = tempfile.mkstemp(dir=self.checkpoint_dir, prefix=".tmp-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, path)
+
+    # --- sync ---
+    def sync(self, edition: str, kind: str = "text") -> SyncResult:
+        """Mirror `edition`; safe to call again after an interruption or partial failure."""
+        if kind not in KINDS:
+            raise ValueError(f"Unknown sync kind {kind!r}, expected one of {KINDS}")
+        started = time.perf_counter()
+        # Batches are written from the remote's event loop thread; access stays sequential.
+        conn = sqlite3.connect(self.db_file, isolation_level=None, check_same_thread=False)
+        try:
+            sura_starts = dict(conn.execute("SELECT id, start FROM Suras"))
+            checkpoint = self._load_checkpoint(edition, kind)
+            result = SyncResult(edition, kind, resumed_suras=len(checkpoint["done"]))
+            done = set(checkpoint["done"])
+            pending = [sura_id for sura_id in sorted(sura_starts) if sura_id not in done]
+            self.remote._run(self._fetch_all(conn, edition, kind, pending, sura_starts, checkpoint, result))
+            if result.complete:
+                self._finish(conn, edition, kind, checkpoint.get("meta") or {})
+                if os.path.exists(self._checkpoint_path(edition, kind)):
+                    os.remove(self._checkpoint_path(edition, kind))
+            else:
+                print(f"[WARN] Sync of {edition} incomplete, failed suras: {result.failed_suras}")
+        finally:
+            conn.close()
+        result.seconds = time.perf_counter() - started
+        return result
+
+    async def _fetch_all(self, conn, edition, kind, pending, sura_starts, checkpoint, result) -> None:
+        semaphore = asyncio.Semaphore(self.workers)
+
+        async def fetch(sura_id: int):
+            async with semaphore:
+                try:
+                    return sura_id, await self.remote.fetch_sura(sura_id, edition)
+                except Exception as e:
+                    print(f"[ERROR] Fetching sura {sura_id} of {edition} failed: {e}")
+                    return sura_id, None
+
+        rows, done = [], []
+        for next_result in asyncio.as_completed([fetch(sura_id) for sura_id in pending]):
+            sura_id, data = await next_result
+            if data is None:
+                result.failed_suras.append(sura_id)
+                continue
+            if checkpoint.get("meta") is None:
+                checkpoint["meta"] = data.get("edition", {})
+            rows.extend(self._rows(edition, kind, sura_id, sura_starts[sura_id], data["ayahs"]))
+            done.append(sura_id)
+            if len(done) >= self.commit_every:
+                self._write(conn, kind, rows, done, checkpoint, result)
+                rows, done = [], []
+        if done:
+            self._write(conn, kind, rows, done, checkpoint, result)
+        result.failed_suras.sort()
+
+    @staticmethod
+    def _rows(edition: str, kind: str, sura_id: int, sura_start: int, ayahs: List[dict]) -> List[tuple]:
+        if kind == "text":
+            return [(edition, sura_start + a["numberInSurah"], a["text"]) for a in ayahs]
+        return [(edition, sura_id, a["numberInSurah"], a["audio"]) for a in ayahs if a.get("audio")]
+
+    def _write(self, conn, kind, rows, done, checkpoint, result) -> None:
+        sql = ("INSERT OR REPLACE INTO EditionAyas (edition, aya_number, text) VALUES (?, ?, ?)"
+               if kind == "text" else
+               "INSERT OR REPLACE INTO AudioOverrides (reciter_key, sura_id, aya_id, audio_url) VALUES (?, ?, ?, ?)")
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(sql, rows)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        checkpoint["done"].extend(done)
+        self._save_checkpoint(checkpoint)
+        result.fetched_suras += len(done)
+        result.rows_written += len(rows)
+
+    def _finish(self, conn, edition: str, kind: str, meta: Dict) -> None:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if kind == "text":
+                conn.execute(
+                    "INSERT OR REPLACE INTO Editions (identifier, language, name, english_name, format, type, synced_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, datetime('now'))",
+                    (edition, meta.get("language"), meta.get("name"), meta.get("englishName"),
+                     meta.get("format"), meta.get("type")))
+            else:
+                self._finish_audio(conn, edition, meta)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _finish_audio(conn, edition: str, meta: Dict) -> None:
+        """Collapse the downloaded per-aya URLs into a template plus real overrides."""
+        rows = conn.execute("""
+            SELECT o.sura_id, o.aya_id, s.start + o.aya_id, o.audio_url
+            FROM AudioOverrides o JOIN Suras s ON s.id = o.sura_id
+            WHERE o.reciter_key = ?
+        """, (edition,)).fetchall()
+        template = infer_audio_template(rows)
+        if template is None:
+            raise ValueError(f"No audio URLs found for {edition}")
+        conn.execute("INSERT OR REPLACE INTO ReciterAudio (reciter_key, url_template) VALUES (?, ?)",
+                     (edition, template))
+        conn.executemany(
+            "DELETE FROM AudioOverrides WHERE reciter_key = ? AND sura_id = ? AND aya_id = ?",
+            [(edition, sura_id, aya_id) for sura_id, aya_id, number, url in rows
+             if template.format(sura=sura_id, aya=aya_id, aya_number=number, reciter=edition) == url])
+        conn.execute("INSERT OR IGNORE INTO Reciters (name, ename, key) VALUES (?, ?, ?)",
+                     (meta.get("name") or edition, meta.get("englishName"), edition))
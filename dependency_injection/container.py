@@ -1,7 +1,14 @@
+import json
+import threading
+
+CONFIG_PATH = "config/config.json"
+
+
 class ServiceContainer:
     def __init__(self):
         # Infrastructure
         from data.repositories.quran_repository_impl import QuranRepositoryImpl
+        from data.repositories.tiered_quran_repository import TieredQuranRepository
         from data.repositories.audio_player_repository_impl import AudioPlayerImpl
 
         # Use Cases
@@ -9,6 +16,9 @@ class ServiceContainer:
         from domain.use_cases.load_quran_page_use_case import LoadQuranPageUseCase
         from domain.use_cases.update_display_settings_use_case import UpdateDisplaySettingsUseCase
         from domain.use_cases.get_data_list_use_case import GetDataListUseCase
+        from domain.use_cases.search_quran_use_case import SearchQuranUseCase
+        from domain.use_cases.find_similar_ayas_use_case import FindSimilarAyasUseCase
+        from domain.use_cases.prefetch_pages_use_case import PrefetchPagesUseCase
 
         # Presentation Layer (Controllers, Events)
         from presentation.controllers.quran_viewer_controller import QuranViewerController
@@ -20,15 +30,25 @@ class ServiceContainer:
 
         # Initialize core services
         self.quran_state = QuranState()
-        self.repository = QuranRepositoryImpl("config/config.json")
+        # "local" reads quran.db only; "tiered" adds an in-process cache and the remote API
+        config = self._load_config()
+        repository_kind = config.get("repository", "local")
+        repository_class = TieredQuranRepository if repository_kind == "tiered" else QuranRepositoryImpl
+        self.repository = repository_class(CONFIG_PATH)
         #self.text_renderer_repository_impl = DisplayRendererRepositoryImpl()
-        self.audio_player = AudioPlayerImpl(self.repository.model, self.quran_state)
+        self.audio_player = AudioPlayerImpl(self.repository, self.quran_state)
 
         # Use Cases
         self.play_audio_uc = PlayAudioUseCase(self.audio_player, self.quran_state)
         self.load_page_uc = LoadQuranPageUseCase(self.repository)
         self.display_update_uc = UpdateDisplaySettingsUseCase(self.repository)
         self.get_data_list_uc = GetDataListUseCase( self.repository)
+        self.search_uc = SearchQuranUseCase(self.repository)
+        self.similar_uc = FindSimilarAyasUseCase(self.repository)
+        # Neighbouring pages are rendered into the page cache in the background
+        self.prefetch_uc = PrefetchPagesUseCase(self.load_page_uc, self.display_update_uc,
+                                                depth=config.get("prefetch_pages", 2),
+                                                workers=config.get("prefetch_workers", 2))
 
         # Event Dispatcher
         self.event_dispatcher = QuranEventDispatcher()
@@ -38,7 +58,11 @@ class ServiceContainer:
             load_page_uc=self.load_page_uc,
             quran_state=self.quran_state,
             get_data_list_uc = self.get_data_list_uc,
-            display_update_uc=self.display_update_uc
+            display_update_uc=self.display_update_uc,
+            search_uc=self.search_uc,
+            similar_uc=self.similar_uc,
+            prefetch_uc=self.prefetch_uc,
+            window_pages=config.get("continuous_window_pages", 7)
         )
         self.event_dispatcher.event_emitted.connect(self.quran_viewer_controller.handle_event)
         self.audio_player_controller = AudioPlayerController(
@@ -46,6 +70,38 @@ class ServiceContainer:
             self.quran_state
         )
         self.event_dispatcher.event_emitted.connect(self.audio_player_controller.handle_event)
+
+        # Building the similar-aya index takes about a second on first run: keep it off the GUI thread
+        self._similarity_thread = threading.Thread(target=self._prepare_similar_ayas, name="similarity-index",
+                                                   daemon=True)
+        self._similarity_thread.start()
+
+    def _prepare_similar_ayas(self):
+        from presentation.events.quran_events import SimilarityIndexReadyEvent
+
+        try:
+            self.similar_uc.prepare()
+        except Exception as e:
+            print(f"[WARN] Could not prepare the similarity index: {e}")
+            return
+        # Delivered to the controllers on the GUI thread (queued signal)
+        self.event_dispatcher.emit_event(SimilarityIndexReadyEvent())
+
+    @staticmethod
+    def _load_config():
+        try:
+            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def shutdown(self):
+        """Release long-lived resources such as pooled database connections."""
+        self.prefetch_uc.shutdown()
+        # A daemon: a build still running at exit is dropped (the index file is written by rename)
+        self._similarity_thread.join(timeout=0.5)
+        self.repository.close()
+
     def get_gui(self):
         from presentation.views.quran_viewer_screen import QuranViewerScreen
 
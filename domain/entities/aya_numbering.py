@@ -0,0 +1,53 @@
+#domain/entities/aya_numbering.py
+from bisect import bisect_right
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from domain.entities.sura_entity import SuraEntity
+
+
+class AyaNumbering:
+    """
+    Conversion between (sura, aya) and the global aya number.
+
+    The global number runs 1..6236 in mushaf order and equals Ayas.id;
+    it is derived from `Suras.start` as `start + aya`.
+    """
+
+    def __init__(self, suras: List[SuraEntity]):
+        self._suras: Dict[int, SuraEntity] = {s.id: s for s in suras}
+        self._sura_order: List[SuraEntity] = sorted(suras, key=lambda s: s.start)
+        self._sura_starts: List[int] = [s.start for s in self._sura_order]
+        self.total_ayas = sum(s.ayas for s in suras)
+
+    def is_valid(self, sura_id: int, aya_id: int) -> bool:
+        sura = self._suras.get(sura_id)
+        return sura is not None and 1 <= aya_id <= sura.ayas
+
+    def to_global(self, sura_id: int, aya_id: int) -> int:
+        """Global aya number of (sura_id, aya_id); KeyError for an unknown sura."""
+        return self._suras[sura_id].start + aya_id
+
+    def from_global(self, aya_number: int) -> Optional[Tuple[int, int]]:
+        """(sura_id, aya_id) of a global aya number."""
+        if not 1 <= aya_number <= self.total_ayas:
+            return None
+        sura = self._sura_order[bisect_right(self._sura_starts, aya_number - 1) - 1]
+        return sura.id, aya_number - sura.start
+
+    def sura_range(self, sura_id: int) -> Optional[Tuple[int, int]]:
+        """(first, last) global aya numbers of a sura."""
+        sura = self._suras.get(sura_id)
+        if sura is None:
+            return None
+        return sura.start + 1, sura.start + sura.ayas
+
+    def iter_ayas(self, first: int, last: int) -> Iterator[Tuple[int, int, int]]:
+        """Yield (sura_id, aya_id, aya_number) for global aya numbers first..last."""
+        aya_number, last = max(first, 1), min(last, self.total_ayas)
+        while aya_number <= last:
+            sura_id, _ = self.from_global(aya_number)
+            sura = self._suras[sura_id]
+            sura_last = min(last, sura.start + sura.ayas)
+            for number in range(aya_number, sura_last + 1):
+                yield sura_id, number - sura.start, number
+            aya_number = sura_last + 1
@@ -0,0 +1,76 @@
+#domain/entities/division_index.py
+from bisect import bisect_right
+from typing import Dict, List, Optional, Sequence
+
+QUARTERS_PER_HIZB = 4
+
+
+class DivisionIndex:
+    """
+    Juz / hizb / quarter (rub' al-hizb) / manzil / ruku boundaries and sajda ayas,
+    keyed by global aya number (1..6236).
+
+    Every division kind is a sorted list of the first aya numbers of divisions
+    1, 2, ...; "which division holds aya n" is a bisect over that list and
+    "where does division k start" an index into it. Hizbs are not stored:
+    hizb k is quarters 4k-3 .. 4k. Sajda ayas are a dict of aya number -> type
+    ("recommended" or "obligatory").
+    """
+
+    def __init__(self, starts: Dict[str, Sequence[int]], sajdas: Optional[Dict[int, str]] = None):
+        self._starts: Dict[str, List[int]] = {kind: sorted(values) for kind, values in starts.items()}
+        self.sajdas: Dict[int, str] = dict(sajdas or {})
+
+    @property
+    def kinds(self) -> List[str]:
+        kinds = list(self._starts)
+        if "quarter" in self._starts:
+            kinds.append("hizb")
+        return kinds
+
+    def starts(self, kind: str) -> List[int]:
+        """First global aya numbers of divisions 1, 2, ... of `kind`."""
+        if kind == "hizb":
+            return self.starts("quarter")[::QUARTERS_PER_HIZB]
+        if kind not in self._starts:
+            raise ValueError(f"Unknown division '{kind}', expected one of {tuple(self.kinds)}")
+        return self._starts[kind]
+
+    def count(self, kind: str) -> int:
+        return len(self.starts(kind))
+
+    def division_of(self, kind: str, aya_number: int) -> Optional[int]:
+        """1-based number of the division of `kind` that holds the aya (None before the first)."""
+        if kind == "hizb":
+            quarter = self.division_of("quarter", aya_number)
+            return (quarter - 1) // QUARTERS_PER_HIZB + 1 if quarter else None
+        position = bisect_right(self.starts(kind), aya_number)
+        return position if position > 0 else None
+
+    def start_of(self, kind: str, number: int) -> Optional[int]:
+        """Global aya number where division `number` (1-based) of `kind` starts."""
+        starts = self.starts(kind)
+        return starts[number - 1] if 1 <= number <= len(starts) else None
+
+    # --- shorthands ---
+    def juz_of(self, aya_number: int) -> Optional[int]:
+        return self.division_of("juz", aya_number)
+
+    def hizb_of(self, aya_number: int) -> Optional[int]:
+        return self.division_of("hizb", aya_number)
+
+    def quarter_of(self, aya_number: int) -> Optional[int]:
+        """Quarter 1..240 of the whole mushaf; its place in the hizb is (quarter - 1) % 4 + 1."""
+        return self.division_of("quarter", aya_number)
+
+    def juz_start(self, juz: int) -> Optional[int]:
+        return self.start_of("juz", juz)
+
+    def hizb_start(self, hizb: int, quarter: int = 1) -> Optional[int]:
+        """Start of quarter `quarter` (1..4) of hizb `hizb`."""
+        if not 1 <= quarter <= QUARTERS_PER_HIZB:
+            return None
+        return self.start_of("quarter", (hizb - 1) * QUARTERS_PER_HIZB + quarter) if hizb >= 1 else None
+
+    def sajda_type(self, aya_number: int) -> Optional[str]:
+        return self.sajdas.get(aya_number)
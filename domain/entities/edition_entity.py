@@ -0,0 +1,14 @@
+#domain/entities/edition_entity.py
+class EditionEntity:
+    """A text edition (translation, tafsir, other script) mirrored into EditionAyas."""
+
+    def __init__(self, identifier: str, language: str, name: str, english_name: str, format: str, type: str):
+        self.identifier = identifier
+        self.language = language
+        self.name = name
+        self.english_name = english_name
+        self.format = format
+        self.type = type
+
+    def __repr__(self):
+        return f"EditionEntity(identifier={self.identifier}, language={self.language})"
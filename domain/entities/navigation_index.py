@@ -0,0 +1,93 @@
+#domain/entities/navigation_index.py
+from bisect import bisect_right
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from domain.entities.page_entity import PageEntity
+from domain.entities.sura_entity import SuraEntity
+from domain.entities.aya_numbering import AyaNumbering
+
+
+class NavigationIndex:
+    """
+    Page/sura/aya lookups precomputed once from the Pages and Suras tables.
+
+    Ayas are addressed by their global number (1..6236, `Suras.start + aya`).
+    Sura -> first page and page -> aya range are dictionary/list lookups;
+    (sura, aya) -> page is a bisect over the sorted page start positions.
+    """
+
+    def __init__(self, pages: List[PageEntity], suras: List[SuraEntity]):
+        self._pages: List[PageEntity] = sorted(pages, key=lambda p: p.id)
+        self._suras: Dict[int, SuraEntity] = {s.id: s for s in suras}
+        self._suras_by_name: Dict[str, SuraEntity] = {}
+        for sura in suras:
+            self._suras_by_name.setdefault(sura.ename, sura)
+            self._suras_by_name.setdefault(sura.name, sura)
+
+        self._page_positions: Dict[int, int] = {p.id: i for i, p in enumerate(self._pages)}
+        self._first_page_for_sura: Dict[int, PageEntity] = {}
+        for page in self._pages:
+            for sura_id in page.sura_id_list:
+                self._first_page_for_sura.setdefault(sura_id, page)
+
+        self.numbering = AyaNumbering(suras)
+        self.total_ayas = self.numbering.total_ayas
+        self._page_starts: List[int] = [
+            p.start_aya if p.start_aya is not None else self.to_global(p.first_sura_id(), p.start_id)
+            for p in self._pages
+        ]
+
+    # --- aya numbering ---
+    def to_global(self, sura_id: int, aya_id: int) -> int:
+        """Global aya number (1-based) of (sura_id, aya_id)."""
+        return self.numbering.to_global(sura_id, aya_id)
+
+    def from_global(self, aya_number: int) -> Optional[Tuple[int, int]]:
+        return self.numbering.from_global(aya_number)
+
+    def iter_ayas(self, first: int, last: int) -> Iterator[Tuple[int, int, int]]:
+        return self.numbering.iter_ayas(first, last)
+
+    # --- pages ---
+    def page(self, page_id: int) -> Optional[PageEntity]:
+        position = self._page_positions.get(page_id)
+        return self._pages[position] if position is not None else None
+
+    def page_position(self, page_id: int) -> Optional[int]:
+        """0-based position of the page in page order (e.g. a combo box row)."""
+        return self._page_positions.get(page_id)
+
+    def page_aya_range(self, page_id: int) -> Optional[Tuple[int, int]]:
+        """(first, last) global aya numbers shown on the page."""
+        position = self._page_positions.get(page_id)
+        if position is None:
+            return None
+        first = self._page_starts[position]
+        return first, first + self._pages[position].ayas_count - 1
+
+    def page_for_aya(self, sura_id: int, aya_id: int) -> Optional[PageEntity]:
+        if not self.numbering.is_valid(sura_id, aya_id):
+            return None
+        return self.page_for_global_aya(self.to_global(sura_id, aya_id))
+
+    def page_for_global_aya(self, aya_number: int) -> Optional[PageEntity]:
+        if not 1 <= aya_number <= self.total_ayas:
+            return None
+        position = bisect_right(self._page_starts, aya_number) - 1
+        return self._pages[position] if position >= 0 else None
+
+    # --- suras ---
+    def sura(self, sura_id: int) -> Optional[SuraEntity]:
+        return self._suras.get(sura_id)
+
+    def sura_by_name(self, name: str) -> Optional[SuraEntity]:
+        return self._suras_by_name.get(name)
+
+    def first_page_for_sura(self, sura_id: int) -> Optional[PageEntity]:
+        return self._first_page_for_sura.get(sura_id)
+
+    def first_sura_on_page(self, page_id: int) -> Optional[SuraEntity]:
+        page = self.page(page_id)
+        if not page or not page.sura_id_list:
+            return None
+        return self._suras.get(page.first_sura_id())
@@ -1,10 +1,23 @@
 #domain/entities/page_entity.py
+from typing import Optional
+
 class PageEntity:
-    def __init__(self, id: int, sura_id_list: list[int], start_id: int, ayas_count: int):
+    def __init__(self, id: int, sura_id_list: list[int], start_id: int, ayas_count: int,
+                 start_aya: Optional[int] = None):
         self.id = id
         self.sura_id_list = sura_id_list  # List of sura IDs on this page
-        self.start_id = start_id
+        self.start_id = start_id          # Aya number within the first sura
         self.ayas_count = ayas_count
+        self.start_aya = start_aya        # Global aya number (1..6236) of the first aya
+
+    @property
+    def end_aya(self) -> Optional[int]:
+        """Global aya number of the last aya on the page."""
+        return self.start_aya + self.ayas_count - 1 if self.start_aya is not None else None
+
+    def contains_aya(self, aya_number: int) -> bool:
+        """Whether the global aya number is shown on this page."""
+        return self.start_aya is not None and self.start_aya <= aya_number <= self.end_aya
 
     def first_sura_id(self) -> int:
         """Return the first sura ID on the page."""
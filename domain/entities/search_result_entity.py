@@ -0,0 +1,24 @@
+#domain/entities/search_result_entity.py
+from typing import List, Optional
+
+
+class SearchResultEntity:
+    """One aya matching a search, with the page it is shown on and a snippet of its text."""
+
+    def __init__(self, sura_id: int, aya_id: int, page_id: Optional[int], snippet: str,
+                 aya_number: int, score: float = 0.0, word_indexes: Optional[List[int]] = None):
+        self.sura_id = sura_id
+        self.aya_id = aya_id
+        self.page_id = page_id
+        self.snippet = snippet
+        self.aya_number = aya_number  # Global aya number (1..6236)
+        self.score = score            # Backend relevance score; lower ranks first
+        # Matched words (1-based word_index of the Words table), when known (root search)
+        self.word_indexes = word_indexes or []
+
+    def __iter__(self):
+        # Unpacks as the (sura, aya, page, snippet) result tuple
+        return iter((self.sura_id, self.aya_id, self.page_id, self.snippet))
+
+    def __repr__(self):
+        return f"SearchResultEntity(sura_id={self.sura_id}, aya_id={self.aya_id}, page_id={self.page_id})"
@@ -0,0 +1,18 @@
+#domain/entities/similar_aya_entity.py
+from typing import Optional
+
+
+class SimilarAyaEntity:
+    """An aya nearly identical to another one (mutashabih), with the page it is shown on."""
+
+    def __init__(self, sura_id: int, aya_id: int, page_id: Optional[int], text: str,
+                 aya_number: int, similarity: int):
+        self.sura_id = sura_id
+        self.aya_id = aya_id
+        self.page_id = page_id
+        self.text = text
+        self.aya_number = aya_number  # Global aya number (1..6236)
+        self.similarity = similarity  # Jaccard similarity of the word pairs, in percent
+
+    def __repr__(self):
+        return f"SimilarAyaEntity(sura_id={self.sura_id}, aya_id={self.aya_id}, similarity={self.similarity})"
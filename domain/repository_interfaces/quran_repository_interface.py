@@ -1,8 +1,10 @@
 #domain/repository_interfaces/quran_repository_interface.py
 from domain.entities.page_entity import PageEntity
+from domain.entities.navigation_index import NavigationIndex
+from domain.entities.division_index import DivisionIndex
 from abc import ABC, abstractmethod
 from PyQt5.QtGui import QColor
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
 
 class IQuranRepository(ABC):
@@ -50,13 +52,67 @@ class IQuranRepository(ABC):
         """Return list of ayas for the given sura, starting from start_aya, limited to count"""
         pass
 
-    
+    @abstractmethod
+    def get_page_editions(self, page: PageEntity, editions: List[str]):
+        """Return the page's ayas as (sura_id, aya_id, text, edition_texts), all editions batched"""
+        pass
+
+    @abstractmethod
+    def get_page_words(self, page: PageEntity):
+        """Return {(sura_id, aya_id): [(word_index, char_start, char_end)]} for the page's ayas"""
+        pass
+
+    @abstractmethod
+    def get_edition_list(self):
+        """Return the text editions available locally"""
+        pass
+
+    @abstractmethod
+    def search(self, query: str, limit: int = 50):
+        """Return SearchResultEntity objects (sura, aya, page, snippet) for the ayas matching query, best first"""
+        pass
+
+    @abstractmethod
+    def search_root(self, root: str, limit: int = 50):
+        """Return SearchResultEntity objects for the ayas with a word derived from root, in mushaf order"""
+        pass
+
+    @abstractmethod
+    def get_similar_ayas(self, sura_id: int, aya_id: int, limit: int = 10):
+        """Return SimilarAyaEntity objects for the ayas nearly identical to (sura_id, aya_id), most similar first"""
+        pass
+
+    @abstractmethod
+    def is_similarity_index_ready(self) -> bool:
+        """True once get_similar_ayas() is an index lookup (the index is loaded or built)"""
+        pass
+
+    @abstractmethod
+    def load_similarity_index(self) -> None:
+        """Load, or build and save, the similarity index; slow on first use, so call it off the GUI thread"""
+        pass
+
     @abstractmethod
     def get_first_page_for_sura(self, sura_id: int): pass  # <-- ADD THIS
 
     @abstractmethod
     def get_sura_info(self, sura_id: int): pass
 
+    @abstractmethod
+    def get_navigation_index(self) -> NavigationIndex:
+        """Return the precomputed page/sura/aya lookup index"""
+        pass
+
+    @abstractmethod
+    def get_division_index(self) -> DivisionIndex:
+        """Return the juz/hizb/quarter/sajda index by global aya number"""
+        pass
+
+    @abstractmethod
+    def get_first_page_for_division(self, kind: str, number: int):
+        """Return the PageEntity on which division `number` of `kind` ("juz", "hizb", ...) starts"""
+        pass
+
     @abstractmethod
     def set_font_color(self, color: QColor) -> None:
         pass
@@ -90,6 +146,40 @@ class IQuranRepository(ABC):
         pass
 
     @abstractmethod
-    def generate_html(self, sura_id: int, sura_info: Dict, quran_data: List[Dict]) -> str:
+    def set_edition_layout(self, layout: str) -> None:
+        pass
+
+    @abstractmethod
+    def get_edition_layout(self) -> str:
+        pass
+
+    @abstractmethod
+    def set_word_highlights(self, highlights: Dict) -> None:
+        """Words to mark when rendering: {(sura_id, aya_id): [word_index, ...]}"""
+        pass
+
+    @abstractmethod
+    def get_cached_page_fragment(self, page_id: int, editions: Tuple[str, ...] = ()) -> Optional[str]:
+        """The page fragment if it was rendered with these editions and the current style, else None"""
+        pass
+
+    @abstractmethod
+    def is_page_fragment_cached(self, page_id: int, editions: Tuple[str, ...] = ()) -> bool:
+        """Whether get_cached_page_fragment would hit, without counting the lookup"""
+        pass
+
+    @abstractmethod
+    def generate_page_fragment(self, page_id: int, sura_info: Dict, quran_data: List[Dict], page_words: Dict = None,
+                               editions: Tuple[str, ...] = ()) -> str:
+        """The page's HTML without the document around it, for the shell to swap in"""
+        pass
+
+    @abstractmethod
+    def get_shell_html(self) -> str:
+        """The long-lived document (CSS, scripts, #page-container) page fragments are shown in"""
+        pass
+
+    @abstractmethod
+    def generate_html(self, sura_id: int, sura_info: Dict, quran_data: List[Dict], page_words: Dict = None) -> str:
         pass
 
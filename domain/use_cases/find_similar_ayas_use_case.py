@@ -0,0 +1,21 @@
+#domain/use_cases/find_similar_ayas_use_case.py
+from typing import List
+from domain.entities.similar_aya_entity import SimilarAyaEntity
+from domain.repository_interfaces.quran_repository_interface import IQuranRepository
+
+
+class FindSimilarAyasUseCase:
+    def __init__(self, repository: IQuranRepository):
+        self.repository = repository
+
+    def execute(self, sura_id: int, aya_id: int, limit: int = 10) -> List[SimilarAyaEntity]:
+        """Return the ayas most similar to (sura_id, aya_id), most similar first."""
+        return self.repository.get_similar_ayas(sura_id, aya_id, limit)
+
+    def is_ready(self) -> bool:
+        """True once execute() no longer has to load or build the index."""
+        return self.repository.is_similarity_index_ready()
+
+    def prepare(self) -> None:
+        """Load or build the index (about a second to build); meant for a background thread."""
+        self.repository.load_similarity_index()
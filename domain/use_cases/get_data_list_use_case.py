@@ -3,6 +3,9 @@ from typing import List
 from domain.entities.reciter_entity import ReciterEntity
 from domain.entities.sura_entity import SuraEntity
 from domain.entities.page_entity import PageEntity
+from domain.entities.navigation_index import NavigationIndex
+from domain.entities.division_index import DivisionIndex
+from domain.entities.edition_entity import EditionEntity
 from domain.repository_interfaces.quran_repository_interface import IQuranRepository
 # Optional parser imports if needed, e.g., parse_sura_list
 
@@ -30,3 +33,21 @@ class GetDataListUseCase:
         """
         raw_data = self.repository.get_page_list()
         return raw_data
+
+    def get_navigation_index(self) -> NavigationIndex:
+        """
+        Return the page/sura/aya NavigationIndex from repository.
+        """
+        return self.repository.get_navigation_index()
+
+    def get_division_index(self) -> DivisionIndex:
+        """
+        Return the juz/hizb/quarter/sajda DivisionIndex from repository.
+        """
+        return self.repository.get_division_index()
+
+    def get_edition_list(self) -> List[EditionEntity]:
+        """
+        Fetch and return the locally available text editions.
+        """
+        return self.repository.get_edition_list()
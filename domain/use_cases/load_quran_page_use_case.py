@@ -6,9 +6,12 @@ class LoadQuranPageUseCase:
     def __init__(self, repository: IQuranRepository):
         self.repository = repository
 
-    def execute(self, page: PageEntity):
-        # Get the page text (list of ayas)
-        ayas = self.repository.get_page_text(page)
+    def execute(self, page: PageEntity, editions=()):
+        # Get the page text (list of ayas), with the selected editions batched in
+        if editions:
+            ayas = self.repository.get_page_editions(page, list(editions))
+        else:
+            ayas = self.repository.get_page_text(page)
     
 
         # Get sura info for each sura_id in the page
@@ -21,8 +24,19 @@ class LoadQuranPageUseCase:
         return ayas, sura_info_list
 
 
+    def get_page_words(self, page: PageEntity):
+        # Word offsets of the page's ayas, for per-word spans in the rendered page
+        return self.repository.get_page_words(page)
+
     def get_first_page_for_sura(self, sura_id: int):
         return self.repository.get_first_page_for_sura(sura_id)
+
+    def get_first_page_for_juz(self, juz: int):
+        return self.repository.get_first_page_for_division("juz", juz)
+
+    def get_first_page_for_hizb(self, hizb: int, quarter: int = 1):
+        # Quarters are numbered over the whole mushaf (1..240), four per hizb
+        return self.repository.get_first_page_for_division("quarter", (hizb - 1) * 4 + quarter)
     
     def get_page_info(self, page_id: int):
         return self.repository.get_page_info(page_id)
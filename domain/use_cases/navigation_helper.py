@@ -1,12 +1,13 @@
-from typing import List, Optional
+from typing import Optional
 from domain.entities.page_entity import PageEntity
 from domain.entities.sura_entity import SuraEntity
+from domain.entities.navigation_index import NavigationIndex
 
-def find_page_by_sura_id(pages: List[PageEntity], sura_id: int) -> Optional[PageEntity]:
-    return next((p for p in pages if sura_id in p.sura_id_list), None)
+def find_page_by_sura_id(index: NavigationIndex, sura_id: int) -> Optional[PageEntity]:
+    return index.first_page_for_sura(sura_id)
 
-def find_first_sura_on_page(pages: List[PageEntity], suras: List[SuraEntity], page_id: int) -> Optional[SuraEntity]:
-    page = next((p for p in pages if p.id == page_id), None)
-    if not page or not page.sura_id_list:
-        return None
-    return next((s for s in suras if s.id == page.first_sura_id()), None)
+def find_first_sura_on_page(index: NavigationIndex, page_id: int) -> Optional[SuraEntity]:
+    return index.first_sura_on_page(page_id)
+
+def find_page_for_aya(index: NavigationIndex, sura_id: int, aya_id: int) -> Optional[PageEntity]:
+    return index.page_for_aya(sura_id, aya_id)
@@ -0,0 +1,137 @@
+#domain/use_cases/prefetch_pages_use_case.py
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from domain.use_cases.load_quran_page_use_case import LoadQuranPageUseCase
+from domain.use_cases.update_display_settings_use_case import UpdateDisplaySettingsUseCase
+
+
+class PrefetchPagesUseCase:
+    """
+    Renders the pages around the one just shown into the page cache on worker
+    threads, so that turning the page finds its HTML ready.
+
+    After page N, pages N+1..N+depth in the direction of travel are queued
+    first, then N-1..N-depth/2 behind it (on a jump, both sides alternate).
+    Queued pages that fall outside the new window are cancelled, so a far jump
+    does not leave the workers busy with pages nobody will read.
+    """
+
+    def __init__(self, load_page_uc: LoadQuranPageUseCase, display_update_uc: UpdateDisplaySettingsUseCase,
+                 depth: int = 2, workers: int = 2, page_count: int = 604):
+        self.load_page_uc = load_page_uc
+        self.display_update_uc = display_update_uc
+        self.depth = depth
+        self.page_count = page_count
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="prefetch")
+        self._jobs: Dict[Tuple[int, Tuple[str, ...]], Future] = {}
+        # Reentrant: cancelling a future runs _done on the cancelling thread
+        self._lock = threading.RLock()
+
+        self.submitted = 0
+        self.rendered = 0
+        self.cancelled = 0
+        self.failed = 0
+
+    def plan(self, page_id: int, direction: int = 0) -> List[int]:
+        """Pages to render after `page_id`, most urgent first; direction +1 (next), -1 (previous) or 0."""
+        if direction:
+            ahead = [page_id + direction * i for i in range(1, self.depth + 1)]
+            behind = [page_id - direction * i for i in range(1, max(1, self.depth // 2) + 1)]
+            pages = ahead + behind
+        else:
+            pages = [page_id + sign * i for i in range(1, self.depth + 1) for sign in (1, -1)]
+        return [page for page in pages if 1 <= page <= self.page_count]
+
+    def execute(self, page_id: int, direction: int = 0, editions: Sequence[str] = ()) -> List[int]:
+        """Queue the neighbours of `page_id` that are not cached yet; returns the queued page ids."""
+        if self.depth < 1:
+            return []
+        editions = tuple(editions)
+        window = self.plan(page_id, direction)
+        queued = []
+        with self._lock:
+            for key, future in list(self._jobs.items()):
+                if key[0] not in window and future.cancel():
+                    self.cancelled += 1
+            for page in window:
+                key = (page, editions)
+                if key in self._jobs or self.display_update_uc.is_page_fragment_cached(page, editions):
+                    continue
+                future = self._executor.submit(self._render, page, editions)
+                self._jobs[key] = future
+                future.add_done_callback(lambda f, key=key: self._done(key, f))
+                self.submitted += 1
+                queued.append(page)
+        return queued
+
+    def _render(self, page_id: int, editions: Tuple[str, ...]) -> Optional[str]:
+        if self.display_update_uc.is_page_fragment_cached(page_id, editions):
+            return None
+        page = self.load_page_uc.get_page_info(page_id)
+        if page is None:
+            return None
+        ayas, sura_info = self.load_page_uc.execute(page, editions)
+        page_words = self.load_page_uc.get_page_words(page)
+        return self.display_update_uc.render_page_fragment(page_id, sura_info, ayas, page_words, editions)
+
+    def _done(self, key: Tuple[int, Tuple[str, ...]], future: Future) -> None:
+        with self._lock:
+            if self._jobs.get(key) is future:
+                del self._jobs[key]
+            if future.cancelled():
+                return
+            if future.exception() is not None:
+                self.failed += 1
+                print(f"[WARN] Prefetching page {key[0]} failed: {future.exception()}")
+            elif future.result() is not None:
+                self.rendered += 1
+
+    def take(self, page_id: int, editions: Sequence[str] = ()) -> Optional[str]:
+        """
+        The page's HTML from a render already running for it (waiting for it to
+        finish), else None. A page still queued is cancelled: rendering it on the
+        caller's thread is quicker than waiting behind the other queued pages.
+        """
+        with self._lock:
+            future = self._jobs.get((page_id, tuple(editions)))
+            if future is None or future.cancel():
+                return None
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def cancel(self) -> None:
+        """Drop every queued page (running renders still finish)."""
+        with self._lock:
+            for future in list(self._jobs.values()):
+                if future.cancel():
+                    self.cancelled += 1
+
+    def wait(self) -> None:
+        """Block until the queued pages are rendered (for tests and benchmarks)."""
+        while True:
+            with self._lock:
+                futures = list(self._jobs.values())
+            if not futures:
+                return
+            for future in futures:
+                if not future.cancelled():
+                    future.exception()
+
+    def shutdown(self) -> None:
+        self.cancel()
+        self._executor.shutdown(wait=True)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "depth": self.depth,
+                "pending": len(self._jobs),
+                "submitted": self.submitted,
+                "rendered": self.rendered,
+                "cancelled": self.cancelled,
+                "failed": self.failed,
+            }
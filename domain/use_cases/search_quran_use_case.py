@@ -0,0 +1,20 @@
+#domain/use_cases/search_quran_use_case.py
+from typing import List
+from domain.entities.search_result_entity import SearchResultEntity
+from domain.repository_interfaces.quran_repository_interface import IQuranRepository
+
+
+class SearchQuranUseCase:
+    def __init__(self, repository: IQuranRepository):
+        self.repository = repository
+
+    def execute(self, query: str, limit: int = 50, by_root: bool = False) -> List[SearchResultEntity]:
+        """
+        Return the ayas matching query, best first; an empty query finds nothing.
+        With by_root the query is a root and every word derived from it matches.
+        """
+        if not query or not query.strip():
+            return []
+        if by_root:
+            return self.repository.search_root(query.strip(), limit)
+        return self.repository.search(query.strip(), limit)
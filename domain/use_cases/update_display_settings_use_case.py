@@ -5,8 +5,24 @@ class UpdateDisplaySettingsUseCase:
     def __init__(self, renderer: IQuranRepository):
         self.renderer = renderer
 
-    def execute(self, sura_id: int, sura_info_list: list[dict], quran_data: list):
-        return self.renderer.generate_html(sura_id, sura_info_list, quran_data)
+    def execute(self, sura_id: int, sura_info_list: list[dict], quran_data: list, page_words: dict = None):
+        return self.renderer.generate_html(sura_id, sura_info_list, quran_data, page_words)
+
+    def render_page_fragment(self, page_id: int, sura_info_list: list[dict], quran_data: list,
+                             page_words: dict = None, editions: tuple = ()):
+        """The page's HTML for the shell document; kept in the page cache."""
+        return self.renderer.generate_page_fragment(page_id, sura_info_list, quran_data, page_words, editions)
+
+    def get_cached_page_fragment(self, page_id: int, editions: tuple = ()):
+        """The rendered page from the page cache, or None if it must be rendered."""
+        return self.renderer.get_cached_page_fragment(page_id, editions)
+
+    def is_page_fragment_cached(self, page_id: int, editions: tuple = ()):
+        return self.renderer.is_page_fragment_cached(page_id, editions)
+
+    def get_shell_html(self):
+        """The document page fragments are shown in (rebuilt when the style changes)."""
+        return self.renderer.get_shell_html()
 
     def set_font_size(self, font_size: int):
         """Updates font size in the renderer and web view."""
@@ -27,3 +43,11 @@ class UpdateDisplaySettingsUseCase:
         """Updates highlight color in the renderer and web view."""
         self.renderer.set_highlight_color(color)
         #self._run_js(f"setHighlightColor('{color.name()}');")
+
+    def set_edition_layout(self, layout: str):
+        """Sets how extra editions are laid out: "interleaved" or "side_by_side"."""
+        self.renderer.set_edition_layout(layout)
+
+    def set_word_highlights(self, highlights: dict):
+        """Sets the words marked on rendered pages: {(sura_id, aya_id): [word_index, ...]}."""
+        self.renderer.set_word_highlights(highlights)
@@ -13,6 +13,7 @@ if __name__ == "__main__":
 
     # Instantiate your DI container and launch GUI
     container = ServiceContainer()
+    app.aboutToQuit.connect(container.shutdown)
     gui = container.get_gui()
     gui.show()
 
@@ -1,18 +1,30 @@
 #presentation/controllers/quran_viewer_controller.py
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 from PyQt5.QtGui import QColor
 
 from domain.use_cases.get_data_list_use_case import GetDataListUseCase
+from domain.use_cases.search_quran_use_case import SearchQuranUseCase
+from domain.use_cases.find_similar_ayas_use_case import FindSimilarAyasUseCase
+from domain.use_cases.prefetch_pages_use_case import PrefetchPagesUseCase
 from presentation.events.quran_events import (
     LoadFirstPageOfSuraEvent,
     LoadPageEvent,
+    LoadJuzEvent,
+    LoadHizbEvent,
     LoadNextPageEvent,
     LoadPreviousPageEvent,
+    SetReadingModeEvent,
+    LoadWindowPageEvent,
+    PageScrolledIntoViewEvent,
     SuraListRequestEvent,
     ReciterListRequestEvent,
     PageListRequestEvent,
-    HighlightAyaEvent
+    HighlightAyaEvent,
+    EditionListRequestEvent,
+    SelectEditionsEvent,
+    SearchEvent,
+    SimilarityIndexReadyEvent
 )
 from presentation.events.settings_events import (
     FontSizeChangedEvent,
@@ -38,26 +50,46 @@ class QuranViewerController:
         quran_state: Any,
         get_data_list_uc: Optional[GetDataListUseCase] = None,
         display_update_uc: Optional[Any] = None,
+        search_uc: Optional[SearchQuranUseCase] = None,
+        similar_uc: Optional[FindSimilarAyasUseCase] = None,
+        prefetch_uc: Optional[PrefetchPagesUseCase] = None,
+        window_pages: int = 7,
     ):
         self.load_page_uc = load_page_uc
         self.display_update_uc = display_update_uc
         self.get_data_list_use_case = get_data_list_uc
+        self.search_use_case = search_uc
+        self.similar_use_case = similar_uc
+        self.prefetch_use_case = prefetch_uc
+        self.window_pages = window_pages
         self.state = quran_state
 
         self.current_page_id: int = self.MIN_PAGES
         self.current_sura_id: int = 1
+        self.word_highlights: Dict[Tuple[int, int], List[int]] = {}
+        # (sura_id, aya_id) highlighted before the similarity index was ready
+        self._pending_similar: Optional[Tuple[int, int]] = None
         self.current_page : PageEntity
 
     # --- Event handling for Quran navigation ---
     def handle_event(self, event: Union[
         LoadFirstPageOfSuraEvent,
         LoadPageEvent,
+        LoadJuzEvent,
+        LoadHizbEvent,
         LoadNextPageEvent,
         LoadPreviousPageEvent,
+        SetReadingModeEvent,
+        LoadWindowPageEvent,
+        PageScrolledIntoViewEvent,
         SuraListRequestEvent,
         ReciterListRequestEvent,
         PageListRequestEvent,
         HighlightAyaEvent,
+        EditionListRequestEvent,
+        SelectEditionsEvent,
+        SearchEvent,
+        SimilarityIndexReadyEvent,
         FontSizeChangedEvent,
         FontColorChangedEvent,
         BackgroundColorChangedEvent,
@@ -69,10 +101,21 @@ class QuranViewerController:
                 self._handle_load_first_page_of_sura_event(event.sura_id)
             elif isinstance(event, LoadPageEvent):
                 self._handle_page_load(event.page_id)
+            elif isinstance(event, LoadJuzEvent):
+                self._handle_load_division(f"Juz {event.juz}", self.load_page_uc.get_first_page_for_juz(event.juz))
+            elif isinstance(event, LoadHizbEvent):
+                self._handle_load_division(f"Hizb {event.hizb} quarter {event.quarter}",
+                                           self.load_page_uc.get_first_page_for_hizb(event.hizb, event.quarter))
             elif isinstance(event, LoadNextPageEvent):
                 self._handle_next_page_event()
             elif isinstance(event, LoadPreviousPageEvent):
                 self._handle_previous_page_event()
+            elif isinstance(event, SetReadingModeEvent):
+                self._handle_set_reading_mode(event.continuous)
+            elif isinstance(event, LoadWindowPageEvent):
+                self._handle_window_page(event.page_id)
+            elif isinstance(event, PageScrolledIntoViewEvent):
+                self._handle_page_scrolled(event.page_id)
             elif isinstance(event, SuraListRequestEvent):
                 self._handle_sura_list_request()
             elif isinstance(event, ReciterListRequestEvent):
@@ -80,8 +123,16 @@ class QuranViewerController:
             elif isinstance(event, PageListRequestEvent):
                 self._handle_page_list_request()
             elif isinstance(event, HighlightAyaEvent):
-                self._handle_highlight_aya_request(event.aya_id)
-            if isinstance(event, FontSizeChangedEvent):
+                self._handle_highlight_aya_request(event.aya_id, event.sura_id)
+            elif isinstance(event, EditionListRequestEvent):
+                self._handle_edition_list_request()
+            elif isinstance(event, SelectEditionsEvent):
+                self._handle_select_editions(event.editions, event.layout)
+            elif isinstance(event, SearchEvent):
+                self._handle_search(event.query, event.limit, event.by_root)
+            elif isinstance(event, SimilarityIndexReadyEvent):
+                self._handle_similarity_index_ready()
+            elif isinstance(event, FontSizeChangedEvent):
                 self.set_font_size(event.font_size)
 
             elif isinstance(event, FontColorChangedEvent):
@@ -109,18 +160,57 @@ class QuranViewerController:
         else:
             self._log_error(f"Page {page_id} is out of range.")
 
+    def _handle_load_division(self, name: str, page: Optional[PageEntity]) -> None:
+        # The start page comes from a bisect in the division index, see get_first_page_for_division
+        if page is None:
+            self._log_error(f"{name} is out of range.")
+            return
+        self.current_page = page
+        if page.sura_id_list:
+            self.current_sura_id = int(page.first_sura_id())
+        self._load_page()
+
     def _handle_next_page_event(self) -> None:
+        # PageEntity instances are shared with the navigation index; never mutate them.
         if self.current_page.id < self.MAX_PAGES:
-            self.current_page.id += 1
-            self.current_page = self.load_page_uc.get_page_info(self.current_page.id)
-            self._load_page()
+            self.current_page = self.load_page_uc.get_page_info(self.current_page.id + 1)
+            self._load_page(direction=1)
 
     def _handle_previous_page_event(self) -> None:
         if self.current_page.id > self.MIN_PAGES:
-            self.current_page.id -= 1
-            self.current_page = self.load_page_uc.get_page_info(self.current_page.id)
+            self.current_page = self.load_page_uc.get_page_info(self.current_page.id - 1)
+            self._load_page(direction=-1)
+
+    def _handle_set_reading_mode(self, continuous: bool) -> None:
+        self.state.set_reading_mode(continuous, self.window_pages)
+        # Show the current page again so the view starts the new mode from it
+        if getattr(self, "current_page", None) is not None:
             self._load_page()
 
+    def _handle_window_page(self, page_id: int) -> None:
+        """Render a page the continuous-scroll view asked for; an empty fragment tells it the page does not exist."""
+        if not self.MIN_PAGES <= page_id <= self.MAX_PAGES:
+            self.state.set_window_page(page_id, "")
+            return
+        try:
+            page = self.load_page_uc.get_page_info(page_id)
+            fragment = self._page_fragment(page, tuple(self.state.selected_editions)) if page else ""
+            self.state.set_window_page(page_id, fragment)
+        except Exception as e:
+            self._log_error(f"Failed to render page {page_id} for the scroll window: {e}")
+            self.state.set_window_page(page_id, "")
+
+    def _handle_page_scrolled(self, page_id: int) -> None:
+        """The reader scrolled to another page: follow it without rendering, and prefetch around it."""
+        current = getattr(self, "current_page", None)
+        if (current is not None and current.id == page_id) or not self.MIN_PAGES <= page_id <= self.MAX_PAGES:
+            return
+        direction = 0 if current is None else (1 if page_id > current.id else -1)
+        self.current_page = self.load_page_uc.get_page_info(page_id)
+        if self.prefetch_use_case is not None:
+            self.prefetch_use_case.execute(page_id, direction, tuple(self.state.selected_editions))
+        self.state.set_page(self.current_page, scrolled=True)
+
     def _handle_sura_list_request(self) -> None:
         try:
             self.state.sura_list = self.get_data_list_use_case.get_sura_list()
@@ -129,8 +219,11 @@ class QuranViewerController:
 
     def _handle_page_list_request(self) -> None:
         try:
+            # Index first so observers reacting to page_list can already use it
+            self.state.navigation_index = self.get_data_list_use_case.get_navigation_index()
+            self.state.division_index = self.get_data_list_use_case.get_division_index()
             self.state.page_list = self.get_data_list_use_case.get_page_list()
-           
+
         except Exception as e:
             self._log_error(f"Error fetching page list: {e}")
 
@@ -140,30 +233,111 @@ class QuranViewerController:
         except Exception as e:
             self._log_error(f"Error fetching reciter list: {e}")
 
-    def _handle_highlight_aya_request(self, aya_id: int )-> None:
+    def _handle_edition_list_request(self) -> None:
+        try:
+            self.state.edition_list = self.get_data_list_use_case.get_edition_list()
+        except Exception as e:
+            self._log_error(f"Error fetching edition list: {e}")
+
+    def _handle_select_editions(self, editions, layout: str) -> None:
+        self.display_update_uc.set_edition_layout(layout)
+        self.state.edition_layout = layout
+        self.state.selected_editions = editions
+        # Re-render the current page with the new editions, if one is shown
+        if getattr(self, "current_page", None) is not None:
+            self._load_page()
+
+    def _handle_search(self, query: str, limit: int, by_root: bool = False) -> None:
+        if self.search_use_case is None:
+            self._log_error("Search is not configured.")
+            return
+        try:
+            results = self.search_use_case.execute(query, limit, by_root)
+            # Root matches are marked word by word on the pages they open
+            highlights = {(r.sura_id, r.aya_id): r.word_indexes for r in results if r.word_indexes}
+            if self.display_update_uc is not None and (highlights or self.word_highlights):
+                self.word_highlights = highlights
+                self.display_update_uc.set_word_highlights(highlights)
+                if getattr(self, "current_page", None) is not None:
+                    self._load_page()
+            self.state.set_search_results(query, results)
+        except Exception as e:
+            self._log_error(f"Error searching for {query!r}: {e}")
+
+    def _handle_highlight_aya_request(self, aya_id: int, sura_id: Optional[int] = None)-> None:
         try:
             #self.state.reciter_list = self.get_data_list_use_case.get_reciter_list()
             self.state.js_script= (f"highlightAya('{aya_id}');")
+            self._update_similar_ayas(aya_id, sura_id)
         except Exception as e:
             self._log_error(f"Error highlighting aya: {e}")
 
+    def _update_similar_ayas(self, aya_id: int, sura_id: Optional[int]) -> None:
+        """Publish the precomputed similar ayas of the highlighted aya (an index lookup)."""
+        if self.similar_use_case is None:
+            return
+        sura_id = sura_id or self._sura_of_aya_on_page(aya_id)
+        if sura_id is None or self.state.similar_to == (sura_id, aya_id):
+            return
+        if not self.similar_use_case.is_ready():
+            # Building the index takes a second; it is done in the background (SimilarityIndexReadyEvent)
+            self._pending_similar = (sura_id, aya_id)
+            return
+        self._pending_similar = None
+        self.state.set_similar_ayas((sura_id, aya_id), self.similar_use_case.execute(sura_id, aya_id))
+
+    def _handle_similarity_index_ready(self) -> None:
+        if self._pending_similar is not None:
+            sura_id, aya_id = self._pending_similar
+            self._update_similar_ayas(aya_id, sura_id)
+
+    def _sura_of_aya_on_page(self, aya_id: int) -> Optional[int]:
+        """The sura of the current page that has aya `aya_id` on this page (the current sura first)."""
+        page = getattr(self, "current_page", None)
+        if page is None or self.get_data_list_use_case is None:
+            return None
+        index = self.get_data_list_use_case.get_navigation_index()
+        first, last = index.page_aya_range(page.id)
+        sura_ids = sorted((int(s) for s in page.sura_id_list), key=lambda s: s != self.current_sura_id)
+        for sura_id in sura_ids:
+            if index.numbering.is_valid(sura_id, aya_id) and first <= index.to_global(sura_id, aya_id) <= last:
+                return sura_id
+        return None
+
+
+    def _page_fragment(self, page: PageEntity, editions: Tuple[str, ...]) -> str:
+        """The page's HTML: from the page cache, from a prefetch already rendering it, or rendered now."""
+        # Revisits with the same editions and style come from the page HTML cache
+        fragment = self.display_update_uc.get_cached_page_fragment(page.id, editions)
+        if fragment is None and self.prefetch_use_case is not None:
+            fragment = self.prefetch_use_case.take(page.id, editions)
+        if fragment is None:
+            # Fetch ayas and sura info from use case
+            ayas, sura_info = self.load_page_uc.execute(page, editions)
+            page_words = self.load_page_uc.get_page_words(page)
+
+            # Generate HTML from fetched data
+            fragment = self.display_update_uc.render_page_fragment(page.id, sura_info, ayas, page_words, editions)
+        return fragment
 
-    def _load_page(self) -> None:
+    def _load_page(self, direction: int = 0) -> None:
         """
         Loads and displays the specified Quran page.
         Fetches ayas and sura info, generates HTML, and updates the view/state.
+        Then queues its neighbours (favoring `direction`: +1 next, -1 previous) for prefetching.
         """
         try:
             # Update internal page state
             print(f"[INFO] Loading page ID: {self.current_page.id}")
 
-            # Fetch ayas and sura info from use case
-            ayas, sura_info = self.load_page_uc.execute(self.current_page)
-            print(f"[DEBUG] Loaded {len(ayas)} ayas for page {self.current_page.id}")
+            editions = tuple(self.state.selected_editions)
+            fragment = self._page_fragment(self.current_page, editions)
 
-            # Generate HTML from fetched data
-            self.state.html_text = self.display_update_uc.execute(self.current_page.id, sura_info, ayas)
-            print(f"[DEBUG] Generated HTML for page {self.current_page.id} (length: {len(self.state.html_text)} chars)")
+            # The shell document is only (re)loaded when the style changed; the page is swapped into it
+            self.state.shell_html = self.display_update_uc.get_shell_html()
+            self.state.set_page_fragment(self.current_page.id, fragment)
+            if self.prefetch_use_case is not None:
+                self.prefetch_use_case.execute(self.current_page.id, direction, editions)
 
             # Update application state
             self.state.set_page(self.current_page)
@@ -1,6 +1,6 @@
 # presentation/events/quran_events.py
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 from .base_event import BaseEvent
 from domain.entities.page_entity import PageEntity
 
@@ -13,6 +13,17 @@ class LoadFirstPageOfSuraEvent(QuranEvent):
     """Event to load the first page of a specific sura"""
     sura_id: int
 
+@dataclass(frozen=True)
+class LoadJuzEvent(QuranEvent):
+    """Event to load the page on which a juz (1..30) starts"""
+    juz: int
+
+@dataclass(frozen=True)
+class LoadHizbEvent(QuranEvent):
+    """Event to load the page on which a hizb (1..60), or one of its quarters (1..4), starts"""
+    hizb: int
+    quarter: int = 1
+
 @dataclass(frozen=True)
 class PageNavigationEvent(QuranEvent):
     """Base class for page navigation events"""
@@ -33,6 +44,23 @@ class LoadPreviousPageEvent(PageNavigationEvent):
     """Event to load the previous page"""
     pass
 
+@dataclass(frozen=True)
+class SetReadingModeEvent(QuranEvent):
+    """Event to switch between page-by-page reading and continuous scrolling"""
+    continuous: bool
+
+
+@dataclass(frozen=True)
+class LoadWindowPageEvent(QuranEvent):
+    """Event to render a page for the continuous-scroll window (asked for by the view as the reader scrolls)"""
+    page_id: int
+
+
+@dataclass(frozen=True)
+class PageScrolledIntoViewEvent(QuranEvent):
+    """Event sent when scrolling brings another page to the middle of the view (continuous mode)"""
+    page_id: int
+
 @dataclass(frozen=True)
 class SuraListRequestEvent(QuranEvent):
     """Event to request the list of suras"""
@@ -55,5 +83,32 @@ class PageListRequestEvent(QuranEvent):
 
 @dataclass(frozen=True)
 class HighlightAyaEvent(QuranEvent):
-    """Event to highlight a aya by number"""
-    aya_id: int
\ No newline at end of file
+    """Event to highlight a aya by number; sura_id picks the sura when the page shows several"""
+    aya_id: int
+    sura_id: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class SimilarityIndexReadyEvent(QuranEvent):
+    """Event sent once the similar-aya index is loaded or built (in the background at startup)"""
+    pass
+
+
+@dataclass(frozen=True)
+class SearchEvent(QuranEvent):
+    """Event to search the Quran text; results land in QuranState.search_results"""
+    query: str
+    limit: int = 50
+    by_root: bool = False
+
+
+@dataclass(frozen=True)
+class EditionListRequestEvent(QuranEvent):
+    """Event to request the list of locally available text editions"""
+    pass
+
+@dataclass(frozen=True)
+class SelectEditionsEvent(QuranEvent):
+    """Event to show the given editions next to the Arabic text ("interleaved" or "side_by_side")"""
+    editions: Tuple[str, ...] = ()
+    layout: str = "interleaved"
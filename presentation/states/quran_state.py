@@ -1,9 +1,14 @@
 #presentation/states/quran_state.py
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from presentation.states.state_manager import StateManager  # Central manager
 from domain.entities.sura_entity import SuraEntity
 from domain.entities.reciter_entity import ReciterEntity
 from domain.entities.page_entity import PageEntity
+from domain.entities.navigation_index import NavigationIndex
+from domain.entities.division_index import DivisionIndex
+from domain.entities.edition_entity import EditionEntity
+from domain.entities.search_result_entity import SearchResultEntity
+from domain.entities.similar_aya_entity import SimilarAyaEntity
 
 
 class QuranState:
@@ -18,6 +23,16 @@ class QuranState:
         self._page_list: List[PageEntity] = []
         self._reciter_list: List[ReciterEntity] = []
         self._current_page: Optional[PageEntity] = None
+        self._page_from_scroll: bool = False
+        self._navigation_index: Optional[NavigationIndex] = None
+        self._division_index: Optional[DivisionIndex] = None
+        self._edition_list: List[EditionEntity] = []
+        self._selected_editions: Tuple[str, ...] = ()
+        self._edition_layout: str = "interleaved"
+        self._search_query: str = ""
+        self._search_results: List[SearchResultEntity] = []
+        self._similar_to: Optional[Tuple[int, int]] = None
+        self._similar_ayas: List[SimilarAyaEntity] = []
 
         # --- Audio player state ---
         self._is_playing: bool = False
@@ -27,20 +42,31 @@ class QuranState:
         self._current_page_name: Optional[str] = None
         self._volume: int = 50
         self._html_text: Optional[str] = None
+        self._shell_html: Optional[str] = None
+        self._page_fragment: Optional[Tuple[int, str]] = None
+        self._continuous_scroll: bool = False
+        self._window_pages: int = 7
+        self._window_page: Optional[Tuple[int, str]] = None
         self._js_script : Optional[str] = None
 
     # -----------------------
     # Page Handling
     # -----------------------
 
-    def set_page(self, page: PageEntity):
+    def set_page(self, page: PageEntity, scrolled: bool = False):
         self._current_page = page
+        self._page_from_scroll = scrolled
         self._notify("current_page")
 
     @property
     def current_page(self) -> Optional[PageEntity]:
         return self._current_page
 
+    @property
+    def page_from_scroll(self) -> bool:
+        """True when current_page changed because the reader scrolled to it (continuous mode), not by a page load."""
+        return self._page_from_scroll
+
     # -----------------------
     # Quran-related properties
     # -----------------------
@@ -87,6 +113,80 @@ class QuranState:
         self._notify("page_list")
 
 
+    @property
+    def navigation_index(self) -> Optional[NavigationIndex]:
+        return self._navigation_index
+
+    @navigation_index.setter
+    def navigation_index(self, value: Optional[NavigationIndex]):
+        self._navigation_index = value
+        self._notify("navigation_index")
+
+    @property
+    def division_index(self) -> Optional[DivisionIndex]:
+        return self._division_index
+
+    @division_index.setter
+    def division_index(self, value: Optional[DivisionIndex]):
+        self._division_index = value
+        self._notify("division_index")
+
+
+    @property
+    def edition_list(self) -> List[EditionEntity]:
+        return self._edition_list
+
+    @edition_list.setter
+    def edition_list(self, value: Optional[List[EditionEntity]]):
+        self._edition_list = value or []
+        self._notify("edition_list")
+
+    @property
+    def selected_editions(self) -> Tuple[str, ...]:
+        """Edition identifiers rendered next to the Arabic text, in display order."""
+        return self._selected_editions
+
+    @selected_editions.setter
+    def selected_editions(self, value):
+        self._selected_editions = tuple(value or ())
+        self._notify("selected_editions")
+
+    @property
+    def edition_layout(self) -> str:
+        return self._edition_layout
+
+    @edition_layout.setter
+    def edition_layout(self, value: str):
+        self._edition_layout = value
+        self._notify("edition_layout")
+
+    @property
+    def search_query(self) -> str:
+        return self._search_query
+
+    @property
+    def search_results(self) -> List[SearchResultEntity]:
+        return self._search_results
+
+    def set_search_results(self, query: str, results: Optional[List[SearchResultEntity]]):
+        self._search_query = query
+        self._search_results = results or []
+        self._notify("search_results")
+
+    @property
+    def similar_to(self) -> Optional[Tuple[int, int]]:
+        """(sura_id, aya_id) whose similar ayas are in similar_ayas."""
+        return self._similar_to
+
+    @property
+    def similar_ayas(self) -> List[SimilarAyaEntity]:
+        return self._similar_ayas
+
+    def set_similar_ayas(self, aya: Optional[Tuple[int, int]], similar: Optional[List[SimilarAyaEntity]]):
+        self._similar_to = aya
+        self._similar_ayas = similar or []
+        self._notify("similar_ayas")
+
     @property
     def reciter_list(self) -> List[ReciterEntity]:
         return self._reciter_list
@@ -158,6 +258,50 @@ class QuranState:
         self._notify("html_text")
 
     
+    @property
+    def shell_html(self) -> Optional[str]:
+        return self._shell_html
+
+    @shell_html.setter
+    def shell_html(self, value: Optional[str]):
+        # Observers reload the document, so only notify when it really changed
+        if value is not self._shell_html:
+            self._shell_html = value
+            self._notify("shell_html")
+
+    @property
+    def page_fragment(self) -> Optional[Tuple[int, str]]:
+        """(page id, HTML) of the page to show in the shell document."""
+        return self._page_fragment
+
+    def set_page_fragment(self, page_id: int, fragment: str):
+        self._page_fragment = (page_id, fragment)
+        self._notify("page_fragment")
+
+    @property
+    def continuous_scroll(self) -> bool:
+        return self._continuous_scroll
+
+    @property
+    def window_pages(self) -> int:
+        """Most pages kept in the document while scrolling continuously."""
+        return self._window_pages
+
+    def set_reading_mode(self, continuous: bool, window_pages: Optional[int] = None):
+        self._continuous_scroll = continuous
+        if window_pages:
+            self._window_pages = window_pages
+        self._notify("reading_mode")
+
+    @property
+    def window_page(self) -> Optional[Tuple[int, str]]:
+        """(page id, HTML) of a page for the continuous-scroll window; empty HTML for a page that does not exist."""
+        return self._window_page
+
+    def set_window_page(self, page_id: int, fragment: str):
+        self._window_page = (page_id, fragment)
+        self._notify("window_page")
+
     @property
     def js_script(self) -> Optional[str]:
         return self._js_script
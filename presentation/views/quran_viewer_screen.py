@@ -1,5 +1,9 @@
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton
+from typing import Optional
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton, QToolButton, QMenu,
+                             QLineEdit, QListWidget, QListWidgetItem, QCheckBox)
 
 from presentation.views.text_renderer_widget import TextRendererWidget
 from presentation.views.audio_player_widget import AudioPlayerWidget
@@ -7,12 +11,18 @@ from presentation.views.settings_widget import SettingsWidget
 from presentation.events.quran_events import (
     LoadFirstPageOfSuraEvent,
     LoadPageEvent,
+    LoadJuzEvent,
+    LoadHizbEvent,
     LoadNextPageEvent,
     LoadPreviousPageEvent,
+    SetReadingModeEvent,
     SuraListRequestEvent,
     ReciterListRequestEvent,
     PageListRequestEvent,
-    HighlightAyaEvent
+    HighlightAyaEvent,
+    EditionListRequestEvent,
+    SelectEditionsEvent,
+    SearchEvent
 )
 from presentation.controllers.quran_viewer_controller import QuranViewerController
 
@@ -47,6 +57,53 @@ class QuranViewerScreen(QWidget):
         self.page_selector.currentTextChanged.connect(self.on_page_changed)
         self.reciter_selector.currentTextChanged.connect(self.on_reciter_changed)
 
+        # Juz / hizb jumps: "activated" fires on user choice only, not when the page changes
+        self.juz_selector = QComboBox()
+        for juz in range(1, 31):
+            self.juz_selector.addItem(f"جزء {juz}", juz)
+        self.juz_selector.activated.connect(self._emit_load_juz_event)
+        self.hizb_selector = QComboBox()
+        for hizb in range(1, 61):
+            self.hizb_selector.addItem(f"حزب {hizb}", hizb)
+        self.hizb_selector.activated.connect(self._emit_load_hizb_event)
+
+        # Page by page, or one continuous scroll through the pages
+        self.continuous_toggle = QCheckBox("Continuous")
+        self.continuous_toggle.setToolTip("Scroll through the pages instead of turning them")
+        self.continuous_toggle.toggled.connect(self._emit_reading_mode_event)
+
+        # Extra editions (translations, ...) shown with the Arabic text
+        self.edition_menu = QMenu(self)
+        self.edition_selector = QToolButton()
+        self.edition_selector.setText("Editions")
+        self.edition_selector.setPopupMode(QToolButton.InstantPopup)
+        self.edition_selector.setMenu(self.edition_menu)
+        self.edition_layout_selector = QComboBox()
+        self.edition_layout_selector.addItem("Interleaved", "interleaved")
+        self.edition_layout_selector.addItem("Side by side", "side_by_side")
+        self.edition_layout_selector.currentIndexChanged.connect(self._emit_select_editions_event)
+
+        # Search box; results are listed below it and open their page when activated
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("بحث")
+        self.search_box.setClearButtonEnabled(True)
+        self.search_box.returnPressed.connect(self._emit_search_event)
+        self.search_by_root = QCheckBox("Root")
+        self.search_by_root.setToolTip("Match every word derived from the root, e.g. ك ت ب")
+        self.search_by_root.toggled.connect(self._emit_search_event)
+        self.search_results_list = QListWidget()
+        self.search_results_list.setLayoutDirection(Qt.RightToLeft)
+        self.search_results_list.setMaximumHeight(160)
+        self.search_results_list.hide()
+        self.search_results_list.itemActivated.connect(self._on_search_result_activated)
+
+        # Near-identical ayas (mutashabihat) of the highlighted aya
+        self.similar_ayas_list = QListWidget()
+        self.similar_ayas_list.setLayoutDirection(Qt.RightToLeft)
+        self.similar_ayas_list.setMaximumHeight(120)
+        self.similar_ayas_list.hide()
+        self.similar_ayas_list.itemActivated.connect(self._on_search_result_activated)
+
         self.text_renderer = TextRendererWidget(self.state, self.event_dispatcher)
         
 
@@ -69,9 +126,15 @@ class QuranViewerScreen(QWidget):
         selection.addWidget(QLabel("Page:"))
         selection.addWidget(self.page_selector)
 
+        selection.addWidget(self.juz_selector)
+        selection.addWidget(self.hizb_selector)
+
         selection.addWidget(QLabel("Reciter:"))
         selection.addWidget(self.reciter_selector)
 
+        selection.addWidget(self.edition_selector)
+        selection.addWidget(self.edition_layout_selector)
+
         next_btn = QPushButton("Next")
         next_btn.clicked.connect(self._emit_next_page_event)
         selection.addWidget(next_btn)
@@ -80,7 +143,17 @@ class QuranViewerScreen(QWidget):
         previous_btn.clicked.connect(self._emit_previous_page_event)
         selection.addWidget(previous_btn)
 
+        selection.addWidget(self.continuous_toggle)
+
+        search = QHBoxLayout()
+        search.addWidget(QLabel("Search:"))
+        search.addWidget(self.search_box)
+        search.addWidget(self.search_by_root)
+
         layout.addLayout(selection, stretch=0)               # No extra space
+        layout.addLayout(search, stretch=0)
+        layout.addWidget(self.search_results_list, stretch=0)
+        layout.addWidget(self.similar_ayas_list, stretch=0)
         layout.addWidget(self.settings_panel, stretch=0)     # Minimal space
         layout.addWidget(self.text_renderer, stretch=1)      # ✅ Take most space
         layout.addWidget(self.audio_controls, stretch=0)     # Minimal space
@@ -89,18 +162,22 @@ class QuranViewerScreen(QWidget):
 
     def _emit_load_sura_event(self):
         sura_name = self.sura_selector.currentText()
-        sura= self.state.get_sura_by_name(sura_name)
-        page_name = self.page_selector.currentText()
-        page = self.state.get_page_by_name(page_name)
-        if sura.id is not None:
+        index = self.state.navigation_index
+        sura = index.sura_by_name(sura_name) if index else self.state.get_sura_by_name(sura_name)
+        if sura and sura.id is not None:
             self.event_dispatcher.emit_event(LoadFirstPageOfSuraEvent(sura.id))
 
 
     def _emit_load_page_event(self):
-        page_name = self.page_selector.currentText()
-        page = self.state.get_page_by_name(page_name)
-        if page.id is not None:
-            self.event_dispatcher.emit_event(LoadPageEvent(page_id= page.id))
+        page_id = self.page_selector.currentData()
+        if page_id is not None:
+            self.event_dispatcher.emit_event(LoadPageEvent(page_id= page_id))
+
+    def _emit_load_juz_event(self, *_):
+        self.event_dispatcher.emit_event(LoadJuzEvent(juz=self.juz_selector.currentData()))
+
+    def _emit_load_hizb_event(self, *_):
+        self.event_dispatcher.emit_event(LoadHizbEvent(hizb=self.hizb_selector.currentData()))
 
     def _emit_next_page_event(self):
         self.event_dispatcher.emit_event(LoadNextPageEvent(self.state.current_page))
@@ -108,8 +185,31 @@ class QuranViewerScreen(QWidget):
     def _emit_previous_page_event(self):
         self.event_dispatcher.emit_event(LoadPreviousPageEvent(self.state.current_page))
 
-    def _emit_highlight_aya_event(self, aya_id: int):
-        self.event_dispatcher.emit_event(HighlightAyaEvent(aya_id = aya_id))
+    def _emit_reading_mode_event(self, continuous: bool):
+        self.event_dispatcher.emit_event(SetReadingModeEvent(continuous=continuous))
+
+    def _emit_select_editions_event(self, *_):
+        editions = tuple(action.data() for action in self.edition_menu.actions() if action.isChecked())
+        layout = self.edition_layout_selector.currentData()
+        self.event_dispatcher.emit_event(SelectEditionsEvent(editions=editions, layout=layout))
+
+    def _emit_search_event(self, *_):
+        query = self.search_box.text().strip()
+        if query:
+            self.event_dispatcher.emit_event(SearchEvent(query=query, by_root=self.search_by_root.isChecked()))
+        else:
+            self.search_results_list.clear()
+            self.search_results_list.hide()
+
+    def _on_search_result_activated(self, item: QListWidgetItem):
+        result = item.data(Qt.UserRole)
+        if result is None or result.page_id is None:
+            return
+        self.event_dispatcher.emit_event(LoadPageEvent(page_id=result.page_id))
+        self._emit_highlight_aya_event(result.aya_id, result.sura_id)
+
+    def _emit_highlight_aya_event(self, aya_id: int, sura_id: Optional[int] = None):
+        self.event_dispatcher.emit_event(HighlightAyaEvent(aya_id = aya_id, sura_id = sura_id))
 
 
     def _load_initial_data(self):
@@ -117,6 +217,7 @@ class QuranViewerScreen(QWidget):
         self._load_suras()
         self._load_pages()
         self._load_reciters()
+        self.event_dispatcher.emit_event(EditionListRequestEvent())
         self.event_dispatcher.emit_event(LoadPageEvent(page_id= 1))
 
     def _load_suras(self):
@@ -141,10 +242,17 @@ class QuranViewerScreen(QWidget):
             self._update_sura_selector()
         elif changed_property == 'current_page':
             current_page = self.state.current_page
-            first_aya_on_page = current_page.start_id
-            self._emit_highlight_aya_event(first_aya_on_page)
             display_name = f"صفحة {current_page.id}"
-            self.page_selector.setCurrentText(display_name)
+            if self.state.page_from_scroll:
+                # Already on screen: follow it in the selectors without loading it or jumping to its first aya
+                self.page_selector.blockSignals(True)
+                self.page_selector.setCurrentText(display_name)
+                self.page_selector.blockSignals(False)
+            else:
+                first_aya_on_page = current_page.start_id
+                self._emit_highlight_aya_event(first_aya_on_page)
+                self.page_selector.setCurrentText(display_name)
+            self._update_division_selectors(current_page)
         elif changed_property == 'reciter_list':
             self.reciter_list = self.state.reciter_list
             self._update_reciter_selector()
@@ -153,6 +261,15 @@ class QuranViewerScreen(QWidget):
             self.pagelist = self.state.page_list
             self._update_page_selector()
 
+        elif changed_property == 'edition_list':
+            self._update_edition_selector()
+
+        elif changed_property == 'search_results':
+            self._update_search_results()
+
+        elif changed_property == 'similar_ayas':
+            self._update_similar_ayas()
+
         elif changed_property == 'current_aya_number':
             current_aya = self.state.current_aya_number 
             current_page = self.state.current_page
@@ -196,15 +313,63 @@ class QuranViewerScreen(QWidget):
 
         # Optionally select the current page or default to the first
         if self.state.page_list:
-            # Find current index by matching current_page_id (if available)
-            current_page_id = self.state.current_page_id
-            index = next(
-                (i for i, page in enumerate(self.state.page_list) if page.id == current_page_id), 0
-            )
-            self.page_selector.setCurrentIndex(index)
+            self._select_page_position(self.state.current_page_id)
 
         self.page_selector.blockSignals(False)  # 🔊 Re-enable signals
 
+    def _select_page_position(self, page_id: int):
+        """Select a page in the selector by its position in the navigation index."""
+        index = self.state.navigation_index
+        position = index.page_position(page_id) if index else None
+        self.page_selector.setCurrentIndex(position if position is not None else 0)
+
+    def _update_division_selectors(self, page):
+        """Show the juz and hizb of the page's first aya (two bisects in the division index)."""
+        divisions, index = self.state.division_index, self.state.navigation_index
+        aya_range = index.page_aya_range(page.id) if divisions and index else None
+        if not aya_range:
+            return
+        for selector, number in ((self.juz_selector, divisions.juz_of(aya_range[0])),
+                                 (self.hizb_selector, divisions.hizb_of(aya_range[0]))):
+            if number:
+                selector.setCurrentIndex(number - 1)
+
+    def _update_edition_selector(self):
+        self.edition_menu.clear()
+        selected = set(self.state.selected_editions)
+        for edition in self.state.edition_list:
+            label = edition.english_name or edition.name or edition.identifier
+            action = self.edition_menu.addAction(f"{label} ({edition.language})")
+            action.setCheckable(True)
+            action.setChecked(edition.identifier in selected)
+            action.setData(edition.identifier)
+            action.toggled.connect(self._emit_select_editions_event)
+        self.edition_selector.setEnabled(bool(self.state.edition_list))
+
+    def _update_search_results(self):
+        self.search_results_list.clear()
+        index = self.state.navigation_index
+        for result in self.state.search_results:
+            sura = index.sura(result.sura_id) if index else None
+            label = f"{sura.name if sura else result.sura_id} {result.aya_id}: {result.snippet}"
+            item = QListWidgetItem(label)
+            item.setData(Qt.UserRole, result)
+            self.search_results_list.addItem(item)
+        if not self.state.search_results and self.state.search_query:
+            self.search_results_list.addItem("لا توجد نتائج")
+        self.search_results_list.setVisible(bool(self.state.search_query))
+
+    def _update_similar_ayas(self):
+        self.similar_ayas_list.clear()
+        index = self.state.navigation_index
+        for similar in self.state.similar_ayas:
+            sura = index.sura(similar.sura_id) if index else None
+            label = f"{similar.similarity}% {sura.name if sura else similar.sura_id} {similar.aya_id}: {similar.text}"
+            item = QListWidgetItem(label)
+            item.setData(Qt.UserRole, similar)
+            self.similar_ayas_list.addItem(item)
+        self.similar_ayas_list.setVisible(bool(self.state.similar_ayas))
+
     def _update_reciter_selector(self):
         self.reciter_selector.blockSignals(True)  # 🔇 Block signals
 
@@ -232,13 +397,15 @@ class QuranViewerScreen(QWidget):
     def on_sura_changed(self, sura_name):
         print(f"Sura changed to: {sura_name}")
         self.state.current_sura_name = sura_name
-        sura = get_sura_by_name(self.state.sura_list, sura_name)
-        if sura:
-            page = find_page_by_sura_id(self.state.page_list, sura.id)
+        index = self.state.navigation_index
+        sura = index.sura_by_name(sura_name) if index else get_sura_by_name(self.state.sura_list, sura_name)
+        if sura and index:
+            page = find_page_by_sura_id(index, sura.id)
             if page:
                 self.state.current_page_id = page.id
-                self._update_page_selector()  # Optionally reset page selector
-                self.page_selector.setCurrentText(f"صفحة {page.id}")
+                self.page_selector.blockSignals(True)
+                self._select_page_position(page.id)
+                self.page_selector.blockSignals(False)
         
         self._emit_load_sura_event()
 
@@ -255,7 +422,8 @@ class QuranViewerScreen(QWidget):
 
         self.state.current_page_id = page_id
         self._emit_load_page_event()
-        sura = find_first_sura_on_page(self.state.page_list, self.state.sura_list, page_id)
+        index = self.state.navigation_index
+        sura = find_first_sura_on_page(index, page_id) if index else None
         if sura:
             self.state.current_sura_name = sura.name
             # Update selector without emitting signal again
@@ -1,3 +1,7 @@
+import time
+from collections import deque
+from typing import Dict, Optional
+
 from PyQt5.QtWebEngineWidgets import QWebEngineView
 from PyQt5.QtWebChannel import QWebChannel
 from PyQt5.QtCore import pyqtSignal, QObject, pyqtSlot, QDateTime
@@ -5,6 +9,8 @@ from presentation.web_bridge import WebBridge
 from presentation.events.quran_events import (
     LoadNextPageEvent,
     LoadPreviousPageEvent,
+    LoadWindowPageEvent,
+    PageScrolledIntoViewEvent,
 )
 from presentation.states.quran_state import QuranState
 from presentation.states.state_manager import StateManager 
@@ -18,9 +24,14 @@ class TextRendererWidget(QWebEngineView):
         self.quran_state = quran_state
         self.event_dispatcher = event_dispatcher
         
+        self._shell_html = None          # shell document currently loaded (None after a full page load)
+        self._shell_ready = False
+        self._pending_fragment = None    # (page id, HTML) waiting for the shell's channel
+        self._swap_started = {}
+        self.swap_times = deque(maxlen=100)  # (swap ms in the page, round trip ms)
+        self.full_loads = 0
         self._setup_web_channel()
-        self.loadFinished.connect(self._on_load_finished)
-        
+
         self._last_emit_time = QDateTime.currentMSecsSinceEpoch()
         self._scroll_debounce_time = 500  # ms to wait between emits
         StateManager.add_observer("quran", self) 
@@ -32,50 +43,79 @@ class TextRendererWidget(QWebEngineView):
         self.channel.registerObject('bridge', self.web_bridge)
         self.page().setWebChannel(self.channel)
 
-    def _on_load_finished(self, ok: bool):
-        """Handle page load completion."""
-        if not ok:
+    # --- shell document and page swaps ---
+    def _load_document(self, html: str, shell: bool):
+        """Full document load; page turns after a shell load only swap fragments."""
+        self._shell_html = html if shell else None
+        self._shell_ready = False
+        self.full_loads += 1
+        self.setHtml(html)
+
+    def _show_fragment(self, page_id: int, fragment: str):
+        if not self._shell_ready:
+            self._pending_fragment = (page_id, fragment)
             return
-            
-        # Initialize web channel and inject wheel event handler
-        js = """
-        new QWebChannel(qt.webChannelTransport, function(channel) {
-            window.bridge = channel.objects.bridge;
-        });
-
-        function handleWheelEvent(e) {
-            const scrollTop = Math.max(
-                document.documentElement.scrollTop, 
-                document.body.scrollTop
-            );
-            const scrollHeight = Math.max(
-                document.documentElement.scrollHeight,
-                document.body.scrollHeight
-            );
-            const clientHeight = Math.max(
-                document.documentElement.clientHeight,
-                document.body.clientHeight
-            );
-            const maxScrollTop = scrollHeight - clientHeight;
-            
-            // At top and scrolling up
-            if (scrollTop <= 0 && e.deltaY < 0) {
-                window.bridge.requestPreviousPage();
-                e.preventDefault();
-                return false;
-            }
-            // At bottom and scrolling down
-            else if (scrollTop >= maxScrollTop && e.deltaY > 0) {
-                window.bridge.requestNextPage();
-                e.preventDefault();
-                return false;
-            }
-        }
+        self._pending_fragment = None
+        self._swap_started[page_id] = time.perf_counter()
+        self.web_bridge.pageFragmentReady.emit(page_id, fragment)
+
+    def execute_js(self, script: str):
+        """Run a script in the loaded document, e.g. highlightAya(...) or setFontSize(...)."""
+        self.page().runJavaScript(script)
+
+    @pyqtSlot()
+    def onShellReady(self):
+        """The shell's QWebChannel is up: send the page that waited for it."""
+        self._shell_ready = self._shell_html is not None
+        if not self._shell_ready:
+            return
+        # The mode first: it decides how the shell shows the page that follows
+        self._send_reading_mode()
+        if self._pending_fragment:
+            self._show_fragment(*self._pending_fragment)
+
+    # --- continuous scrolling: the shell keeps a window of pages and asks for more ---
+    def _send_reading_mode(self):
+        if self._shell_ready:
+            self.web_bridge.readingModeChanged.emit(self.quran_state.continuous_scroll, self.quran_state.window_pages)
+
+    def _send_window_page(self, page_id: int, fragment: str):
+        # Pages asked for by a shell that has since been replaced are dropped; the new one asks again
+        if self._shell_ready and self.quran_state.continuous_scroll:
+            self._swap_started[page_id] = time.perf_counter()
+            self.web_bridge.windowPageReady.emit(page_id, fragment)
+
+    @pyqtSlot(int)
+    def onWindowPageRequested(self, page_id: int):
+        self.event_dispatcher.emit_event(LoadWindowPageEvent(page_id))
+
+    @pyqtSlot(int)
+    def onPageVisible(self, page_id: int):
+        self.event_dispatcher.emit_event(PageScrolledIntoViewEvent(page_id))
 
-        document.addEventListener('wheel', handleWheelEvent, { passive: false });
+    @pyqtSlot(int, float)
+    def onPageShown(self, page_id: int, swap_ms: float):
+        started = self._swap_started.pop(page_id, None)
+        round_trip_ms = (time.perf_counter() - started) * 1000 if started is not None else None
+        self.swap_times.append((swap_ms, round_trip_ms))
+
+    def get_swap_stats(self) -> Dict[str, Optional[float]]:
         """
-        
-        self.page().runJavaScript(js)
+        Page swap latency: swap_ms is measured in the page (innerHTML and layout),
+        round_trip_ms from sending the fragment until the page reports it shown.
+        Pages added to the continuous-scroll window are counted as swaps too.
+        """
+        swap = [ms for ms, _ in self.swap_times]
+        round_trip = [ms for _, ms in self.swap_times if ms is not None]
+        return {
+            "swaps": len(self.swap_times),
+            "full_loads": self.full_loads,
+            "last_swap_ms": swap[-1] if swap else None,
+            "mean_swap_ms": sum(swap) / len(swap) if swap else None,
+            "max_swap_ms": max(swap) if swap else None,
+            "last_round_trip_ms": round_trip[-1] if round_trip else None,
+            "mean_round_trip_ms": sum(round_trip) / len(round_trip) if round_trip else None,
+        }
 
     @pyqtSlot()
     def requestPreviousPage(self):
@@ -95,19 +135,24 @@ class TextRendererWidget(QWebEngineView):
 
     def cleanup(self):
         """Clean up resources."""
-        self.loadFinished.disconnect()
+        self.channel.deregisterObject(self.web_bridge)
 
 
 
     def on_state_changed(self, source: str, changed_property: str):
-        print(f"[STATE] {source} changed: {changed_property}")
-
         if source != "quran":
             return
 
-        if changed_property == 'html_text':
-            html = self.quran_state.html_text
-            self.setHtml(html)
+        if changed_property == 'shell_html':
+            self._load_document(self.quran_state.shell_html, shell=True)
+        elif changed_property == 'page_fragment':
+            self._show_fragment(*self.quran_state.page_fragment)
+        elif changed_property == 'window_page':
+            self._send_window_page(*self.quran_state.window_page)
+        elif changed_property == 'reading_mode':
+            self._send_reading_mode()
+        elif changed_property == 'html_text':
+            self._load_document(self.quran_state.html_text, shell=False)
         elif changed_property == 'js_script':
             script = self.quran_state.js_script
             self.execute_js(script)
@@ -4,6 +4,16 @@ class WebBridge(QObject):
     # Define signals
     previous_page_requested = pyqtSignal()
     next_page_requested = pyqtSignal()
+    shell_ready = pyqtSignal()
+    page_shown = pyqtSignal(int, float)
+    window_page_requested = pyqtSignal(int)
+    page_visible = pyqtSignal(int)
+
+    # Seen by JavaScript: (page id, page HTML) for the shell to swap in
+    pageFragmentReady = pyqtSignal(int, str)
+    # Seen by JavaScript: (continuous, most pages kept) and the pages it asked for
+    readingModeChanged = pyqtSignal(bool, int)
+    windowPageReady = pyqtSignal(int, str)
 
     def __init__(self, parent):
         super().__init__()
@@ -11,6 +21,10 @@ class WebBridge(QObject):
         # Connect signals to parent methods
         self.previous_page_requested.connect(parent.requestPreviousPage)
         self.next_page_requested.connect(parent.requestNextPage)
+        self.shell_ready.connect(parent.onShellReady)
+        self.page_shown.connect(parent.onPageShown)
+        self.window_page_requested.connect(parent.onWindowPageRequested)
+        self.page_visible.connect(parent.onPageVisible)
 
     @pyqtSlot()
     def requestPreviousPage(self):
@@ -20,4 +34,24 @@ class WebBridge(QObject):
     @pyqtSlot()
     def requestNextPage(self):
         """Called from JavaScript when wheel scroll down at bottom."""
-        self.next_page_requested.emit()
\ No newline at end of file
+        self.next_page_requested.emit()
+
+    @pyqtSlot()
+    def shellReady(self):
+        """Called from JavaScript once the shell document is connected to the channel."""
+        self.shell_ready.emit()
+
+    @pyqtSlot(int, float)
+    def pageShown(self, page_id, swap_ms):
+        """Called from JavaScript after a page fragment was swapped in and laid out."""
+        self.page_shown.emit(page_id, swap_ms)
+
+    @pyqtSlot(int)
+    def requestWindowPage(self, page_id):
+        """Called from JavaScript when continuous scrolling nears a page that is not in the document."""
+        self.window_page_requested.emit(page_id)
+
+    @pyqtSlot(int)
+    def pageVisible(self, page_id):
+        """Called from JavaScript when another page reaches the middle of the view (continuous mode)."""
+        self.page_visible.emit(page_id)
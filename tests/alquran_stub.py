@@ -0,0 +1,186 @@
+#tests/alquran_stub.py
+"""Local stand-in for api.alquran.cloud that replays recorded v1 responses."""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from bisect import bisect_right
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, Optional
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "alquran_cloud")
+JUZ_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "juz.json")
+AUDIO_CDN = "https://cdn.islamic.network/quran/audio/128"
+
+
+def load_recorded_responses(fixtures_dir: str = FIXTURES_DIR) -> Dict[str, bytes]:
+    """Map request path (with query) -> response body, from fixtures/alquran_cloud/index.json."""
+    with open(os.path.join(fixtures_dir, "index.json"), encoding="utf-8") as f:
+        index = json.load(f)
+    responses = {}
+    for path, filename in index.items():
+        with open(os.path.join(fixtures_dir, filename), "rb") as f:
+            responses[path] = f.read()
+    return responses
+
+
+def _envelope(data) -> bytes:
+    return json.dumps({"code": 200, "status": "OK", "data": data}, ensure_ascii=False).encode("utf-8")
+
+
+def synthesize_responses(db_file: str, editions: Iterable[str], sura_ids: Optional[Iterable[int]] = None,
+                         page_ids: Iterable[int] = (), juz_file: str = JUZ_FILE) -> Dict[str, bytes]:
+    """
+    Build `/surah/{id}/{edition}` (and `/page/{n}/{edition}` for `page_ids`)
+    responses in the API's format from a quran.db, for tests that need more
+    of the corpus than the recorded fixtures hold.
+    """
+    conn = sqlite3.connect(db_file)
+    try:
+        suras = conn.execute("SELECT id, ayas, start, name, tname, ename, type FROM Suras ORDER BY id").fetchall()
+        texts = conn.execute("SELECT id, sura_id, aya_id, text FROM Ayas ORDER BY id").fetchall()
+        page_starts = conn.execute(
+            "SELECT Pages.page, Suras.start + Pages.start_id FROM Pages "
+            "JOIN Suras ON Suras.id = CAST(Pages.sura_ids AS INTEGER) ORDER BY Pages.page").fetchall()
+    finally:
+        conn.close()
+    starts = {row[0]: row[2] for row in suras}
+    with open(juz_file, encoding="utf-8") as f:
+        juz_starts = [starts[j["sura"]] + j["aya"] for j in json.load(f)]
+    page_numbers = [start for _, start in page_starts]
+    sura_meta = {
+        sura_id: {"number": sura_id, "name": name, "englishName": tname, "englishNameTranslation": ename,
+                  "revelationType": kind, "numberOfAyahs": ayas}
+        for sura_id, ayas, start, name, tname, ename, kind in suras
+    }
+
+    wanted = set(sura_ids) if sura_ids is not None else None
+    responses = {}
+    for edition in editions:
+        audio = not edition.startswith("quran-")
+        edition_meta = {"identifier": edition, "language": "ar", "name": edition, "englishName": edition,
+                        "format": "audio" if audio else "text", "type": "versebyverse" if audio else "quran"}
+        ayahs_by_sura: Dict[int, list] = {}
+        ayahs_by_page: Dict[int, list] = {}
+        for number, sura_id, aya_id, text in texts:
+            ayah = {"number": number}
+            if audio:
+                ayah["audio"] = f"{AUDIO_CDN}/{edition}/{number}.mp3"
+            ayah.update({
+                "text": text,
+                "numberInSurah": aya_id,
+                "juz": bisect_right(juz_starts, number),
+                "page": page_starts[bisect_right(page_numbers, number) - 1][0],
+                "sajda": False,
+            })
+            ayahs_by_sura.setdefault(sura_id, []).append(ayah)
+            ayahs_by_page.setdefault(ayah["page"], []).append(dict(ayah, surah=sura_meta[sura_id]))
+        for sura_id, ayahs in ayahs_by_sura.items():
+            if wanted is None or sura_id in wanted:
+                responses[f"/v1/surah/{sura_id}/{edition}"] = _envelope(
+                    dict(sura_meta[sura_id], ayahs=ayahs, edition=edition_meta))
+        for page in page_ids:
+            ayahs = ayahs_by_page[page]
+            responses[f"/v1/page/{page}/{edition}"] = _envelope({
+                "number": page, "ayahs": ayahs,
+                "surahs": {str(a["surah"]["number"]): a["surah"] for a in ayahs},
+                "edition": edition_meta,
+            })
+    return responses
+
+
+class AlquranStubServer:
+    """
+    Threaded HTTP server serving `responses` (path -> body) on 127.0.0.1.
+
+    `hits` counts requests per path, `fail_next` makes the next N requests
+    answer 503, and `delay` slows every response so concurrency can be observed.
+    Responses carry an ETag and If-None-Match is answered with 304.
+    Paths under /v1/surah/{id}/{edition} also honour `offset`/`limit` like the API.
+    """
+
+    def __init__(self, responses: Dict[str, bytes], delay: float = 0.0):
+        self.responses = dict(responses)
+        self.delay = delay
+        self.fail_next = 0
+        self.hits: Counter = Counter()
+        self.active = 0
+        self.max_active = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/v1"
+
+    def _body_for(self, path: str) -> Optional[bytes]:
+        if path in self.responses:
+            return self.responses[path]
+        route, _, query = path.partition("?")
+        params = dict(p.split("=", 1) for p in query.split("&") if "=" in p)
+        if route in self.responses and ("offset" in params or "limit" in params):
+            payload = json.loads(self.responses[route])
+            offset = int(params.get("offset", 0))
+            limit = int(params.get("limit", 0)) or None
+            ayahs = payload["data"]["ayahs"]
+            payload["data"]["ayahs"] = ayahs[offset:offset + limit if limit else None]
+            return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        return None
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.hits[self.path] += 1
+                    stub.active += 1
+                    stub.max_active = max(stub.max_active, stub.active)
+                    failing = stub.fail_next > 0
+                    if failing:
+                        stub.fail_next -= 1
+                try:
+                    if stub.delay:
+                        time.sleep(stub.delay)
+                    body = None if failing else stub._body_for(self.path)
+                    status = 503 if failing else (200 if body is not None else 404)
+                    etag = '"%s"' % hashlib.sha256(body).hexdigest()[:16] if body is not None else None
+                    if etag and self.headers.get("If-None-Match") == etag:
+                        status, body = 304, b""
+                    body = body if body is not None else b'{"code": %d, "status": "error"}' % status
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    if etag:
+                        self.send_header("ETag", etag)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with stub._lock:
+                        stub.active -= 1
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,64 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from data.datasources.quran_local_datasource import QuranLocalDataSource
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DB = os.path.join(REPO_ROOT, "data", "quran.db")
+
+
+def write_quran_config(workdir, name="config.json", **overrides):
+    """
+    Write `name` in `workdir`: a config for a private copy of quran.db there
+    (copied on first use), with `overrides` merged in. Returns its path.
+    """
+    db_file = workdir / "quran.db"
+    if not db_file.exists():
+        shutil.copyfile(SOURCE_DB, db_file)
+    config_path = workdir / name
+    config_path.write_text(json.dumps({"database_name": str(db_file), **overrides}), encoding="utf-8")
+    return str(config_path)
+
+
+@pytest.fixture(scope="session")
+def quran_config(tmp_path_factory):
+    """Config pointing at a private copy of quran.db so tests never touch the shipped file."""
+    return write_quran_config(tmp_path_factory.mktemp("quran"))
+
+
+@pytest.fixture
+def local_datasource(quran_config):
+    datasource = QuranLocalDataSource(quran_config)
+    yield datasource
+    datasource.close()
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """QuranRepositoryImpl (needs PyQt5) over a copy of quran.db made for this test, read through SQLite."""
+    from data.repositories.quran_repository_impl import QuranRepositoryImpl
+
+    repository = QuranRepositoryImpl(write_quran_config(tmp_path, text_backend="sqlite"))
+    yield repository
+    repository.close()
+
+
+@pytest.fixture
+def writable_local(tmp_path):
+    """
+    Factory for datasources over a copy of quran.db made for this test, for
+    tests that write to it: writable_local(**config_overrides). Calls share the copy.
+    """
+    opened = []
+
+    def open_local(**overrides):
+        config_path = write_quran_config(tmp_path, f"config-{len(opened)}.json", **overrides)
+        opened.append(QuranLocalDataSource(config_path))
+        return opened[-1]
+
+    yield open_local
+    for datasource in opened:
+        datasource.close()
@@ -0,0 +1,67 @@
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from data.repositories.display_renderer import DisplayRenderer
+from domain.use_cases.load_quran_page_use_case import LoadQuranPageUseCase
+from domain.use_cases.prefetch_pages_use_case import PrefetchPagesUseCase
+from domain.use_cases.update_display_settings_use_case import UpdateDisplaySettingsUseCase
+from presentation.controllers.quran_viewer_controller import QuranViewerController
+from presentation.events.quran_events import (LoadPageEvent, LoadWindowPageEvent, PageScrolledIntoViewEvent,
+                                              SetReadingModeEvent)
+from presentation.states.quran_state import QuranState
+from presentation.states.state_manager import StateManager
+
+
+class Recorder:
+    def __init__(self):
+        self.changes = []
+
+    def on_state_changed(self, source, changed_property):
+        self.changes.append(changed_property)
+
+
+def test_shell_keeps_a_window_of_pages():
+    shell = DisplayRenderer().generate_shell()
+    assert not hasattr(DisplayRenderer, "generate_html_new_1")
+    for hook in ("bridge.readingModeChanged.connect(setReadingMode)", "bridge.windowPageReady.connect(insertPage)",
+                 "bridge.requestWindowPage(pageId)", "bridge.pageVisible(visiblePage)", "overflow-anchor: none"):
+        assert hook in shell
+
+
+def test_window_pages_and_scrolling_follow_the_reader(repository):
+    state = QuranState()
+    load_page_uc = LoadQuranPageUseCase(repository)
+    display_update_uc = UpdateDisplaySettingsUseCase(repository)
+    prefetcher = PrefetchPagesUseCase(load_page_uc, display_update_uc, depth=2)
+    controller = QuranViewerController(load_page_uc, state, display_update_uc=display_update_uc,
+                                       prefetch_uc=prefetcher, window_pages=5)
+    recorder = Recorder()
+    StateManager.add_observer("quran", recorder)
+    try:
+        controller.handle_event(LoadPageEvent(10))
+        controller.handle_event(SetReadingModeEvent(True))
+        assert (state.continuous_scroll, state.window_pages) == (True, 5)
+        # The mode reaches the view before the page it starts from
+        last_fragment = max(i for i, change in enumerate(recorder.changes) if change == "page_fragment")
+        assert recorder.changes.index("reading_mode") < last_fragment
+
+        prefetcher.wait()
+        controller.handle_event(LoadWindowPageEvent(11))
+        assert state.window_page == (11, display_update_uc.get_cached_page_fragment(11))
+        controller.handle_event(LoadWindowPageEvent(605))
+        assert state.window_page == (605, "")
+
+        # Scrolling to a page follows it without sending the page again, and prefetches past it
+        recorder.changes.clear()
+        controller.handle_event(PageScrolledIntoViewEvent(11))
+        assert state.current_page.id == 11 and state.page_from_scroll
+        assert recorder.changes == ["current_page"]
+        prefetcher.wait()
+        assert display_update_uc.is_page_fragment_cached(13)
+
+        controller.handle_event(LoadPageEvent(20))
+        assert state.current_page.id == 20 and not state.page_from_scroll
+    finally:
+        StateManager.remove_observer("quran", recorder)
+        prefetcher.shutdown()
@@ -0,0 +1,36 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from data.datasources.quran_local_datasource import QuranLocalDataSource
+
+
+@pytest.fixture(scope="module")
+def corpus(quran_config):
+    datasource = QuranLocalDataSource(quran_config)
+    yield datasource.get_corpus_stats()
+    datasource.close()
+
+
+def test_tables_agree_with_the_word_table(corpus):
+    assert corpus.total_words == 77433
+    assert sum(count for _, count in corpus.word_frequencies()) == corpus.total_words
+    assert corpus.word_frequencies(top=1)[0][0] == "من"
+    sura_counts = corpus.segment_counts("sura")
+    assert len(sura_counts) == 114 and sura_counts[0][:2] == (1, 29)
+    assert sum(words for _, words, _, _ in corpus.segment_counts("juz")) == corpus.total_words
+    assert len(corpus.segment_counts("page")) == 604
+
+
+def test_segment_tables_and_concordance(corpus):
+    # Sura 1 holds the only occurrences of "الرحمن" on page 1
+    by_page = corpus.word_by_segment("الرحمن", "page")
+    assert len(by_page) == 604 and by_page[0] == 2
+    assert sum(corpus.word_by_segment("الله", "juz")) == dict(corpus.word_frequencies())["الله"]
+    letters = dict(corpus.letter_frequencies(segment="sura", segment_id=1))
+    assert letters["ا"] > 0 and "ٱ" not in letters
+
+    lines = corpus.concordance("ريب", width=2)
+    assert lines[0][:2] == (9, 4)
+    assert lines[0][2:] == ("الكتب لا", "ريب", "فيه هدي")
+    assert corpus.concordance("not a word") == []
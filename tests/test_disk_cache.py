@@ -0,0 +1,110 @@
+import os
+
+import pytest
+
+from data.datasources.disk_cache import DiskCache
+from data.datasources.http_client import AsyncHttpClient
+from data.datasources.quran_remote_datasource import QuranRemoteDataSource
+from tests.alquran_stub import AlquranStubServer, load_recorded_responses
+
+SURA_1 = "/v1/surah/1/ar.alafasy"
+
+
+@pytest.fixture
+def stub():
+    with AlquranStubServer(load_recorded_responses()) as server:
+        yield server
+
+
+def make_remote(base_url, cache_dir, ttl=3600, retries=3):
+    return QuranRemoteDataSource(base_url=base_url, client=AsyncHttpClient(retries=retries, backoff=0.01),
+                                 cache=DiskCache(str(cache_dir), ttl=ttl))
+
+
+def test_each_resource_is_downloaded_once(stub, tmp_path):
+    remote = make_remote(stub.base_url, tmp_path)
+    try:
+        remote.get_aya_list(1)
+        remote.get_quran_text(1)
+        remote.get_sura_info(1)
+        remote.get_sura_playlist(1)
+        assert stub.hits[SURA_1] == 1
+        stats = remote.get_cache_stats()
+        assert (stats["misses"], stats["hits"], stats["entries"]) == (1, 3, 1)
+    finally:
+        remote.close()
+
+    # A later session is served from disk.
+    remote = make_remote(stub.base_url, tmp_path)
+    try:
+        assert len(remote.get_quran_text(1)) == 7
+        assert stub.hits[SURA_1] == 1
+    finally:
+        remote.close()
+
+
+def test_expired_entries_are_revalidated_with_etag(stub, tmp_path):
+    remote = make_remote(stub.base_url, tmp_path, ttl=0)
+    try:
+        first = remote.get_quran_text(1)
+        assert remote.get_quran_text(1) == first
+        assert stub.hits[SURA_1] == 2
+        stats = remote.get_cache_stats()
+        assert (stats["stores"], stats["revalidated"]) == (1, 1)
+    finally:
+        remote.close()
+
+
+def test_warm_then_serve_offline(stub, tmp_path):
+    remote = make_remote(stub.base_url, tmp_path)
+    try:
+        assert remote.warm(editions=["ar.alafasy"], sura_ids=[1, 112, 113, 114]) == 5
+    finally:
+        remote.close()
+    base_url = stub.base_url
+    stub.__exit__(None, None, None)
+
+    remote = make_remote(base_url, tmp_path, ttl=0, retries=0)
+    try:
+        assert len(remote.get_sura_list()) == 114
+        assert [aya for aya, _ in remote.get_quran_text(113)] == [1, 2, 3, 4, 5]
+        assert remote.get_cache_stats()["stale_served"] == 2
+        assert remote.get_quran_text(2) == []
+    finally:
+        remote.close()
+
+
+def test_lru_eviction_and_content_addressing(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=250)
+    cache.store("a", b"a" * 100)
+    cache.store("b", b"b" * 100)
+    cache.read(cache.lookup("a"))
+    cache.store("c", b"c" * 100)
+    assert cache.lookup("b") is None
+    assert cache.lookup("a") and cache.lookup("c")
+
+    cache.store("a-again", b"a" * 100)
+    stats = cache.get_stats()
+    assert (stats["entries"], stats["bytes"], stats["evictions"]) == (3, 200, 1)
+    assert len(os.listdir(tmp_path / "blobs")) == 2
+
+    reopened = DiskCache(str(tmp_path), max_bytes=250)
+    assert reopened.read(reopened.lookup("c")) == b"c" * 100
+
+
+def test_storing_the_same_body_again_keeps_it(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.store("a", b"hello")
+    cache.store("a", b"hello")  # e.g. a refetch after the TTL that returned the same body
+    assert cache.read(cache.lookup("a")) == b"hello"
+    assert cache.get_stats()["entries"] == 1
+    assert DiskCache(str(tmp_path)).read(cache.lookup("a")) == b"hello"
+
+
+def test_unreadable_entries_are_dropped(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.store("a", b"body")
+    (tmp_path / "entries" / "broken.json").write_text("{not json")
+    reopened = DiskCache(str(tmp_path))
+    assert reopened.get_stats()["entries"] == 1
+    assert not [name for name in os.listdir(tmp_path / "entries") if name.startswith((".tmp", "broken"))]
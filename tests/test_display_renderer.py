@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from data.repositories.display_renderer import ARABIC_NUMERALS, DisplayRenderer, arabic_numeral
+
+
+def test_numerals_are_precomputed():
+    assert len(ARABIC_NUMERALS) == 287
+    assert (arabic_numeral(7), arabic_numeral(286), arabic_numeral(6236)) == ("٧", "٢٨٦", "٦٢٣٦")
+
+
+def test_markers_share_one_symbol():
+    renderer = DisplayRenderer()
+    renderer.set_sajda_ayas({(1, 2): "recommended"})
+    ayas = [(1, n, f"aya {n}") for n in range(1, 8)]
+    html = renderer.generate_html(1, [{"id": 1, "name": "الفاتحة"}], ayas)
+    assert html.count('<symbol id="aya-marker"') == 1
+    assert html.count('<use href="#aya-marker"/>') == 7
+    assert "<path" not in html.split("</symbol>", 1)[1]
+    assert '<text x="50%" y="50%">٧</text>' in html
+    assert html.count('class="sajda-mark recommended"') == 1
+    # A full document is the shell with the page fragment already in its container
+    fragment = renderer.generate_page_fragment(1, [{"id": 1, "name": "الفاتحة"}], ayas)
+    assert "<html>" not in fragment and f'<div id="page-container">{fragment}</div>' in html
+
+
+def test_page_html_cache_and_shell_follow_their_versions(repository):
+    page = repository.get_page_info(3)
+    assert repository.get_cached_page_fragment(3) is None
+    fragment = repository.generate_page_fragment(3, [repository.get_sura_info(2)], repository.get_page_text(page))
+    assert repository.get_cached_page_fragment(3) is fragment
+    assert repository.get_cached_page_fragment(3, ("en.sahih",)) is None
+    shell = repository.get_shell_html()
+    assert repository.get_shell_html() is shell and fragment not in shell
+
+    # Marked words change the fragments only: the loaded shell stays
+    repository.set_word_highlights({(2, 1): [1]})
+    assert repository.get_cached_page_fragment(3) is None
+    assert repository.get_shell_html() is shell
+
+    # Fonts and colors change the shell only: cached fragments stay
+    fragment = repository.generate_page_fragment(3, [repository.get_sura_info(2)], repository.get_page_text(page))
+    repository.set_font_size(30)
+    assert repository.get_shell_html() is not shell
+    assert repository.get_cached_page_fragment(3) is fragment
+    stats = repository.get_page_html_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 3, 2)
+    assert stats["bytes"] > len(fragment)  # str size in memory, not the text length
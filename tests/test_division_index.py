@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+from data.datasources.quran_local_datasource import CONFIG_DIR, METADATA_FILE
+from data.datasources.quran_metadata import read_metadata_json, read_metadata_xml
+from domain.entities.division_index import DivisionIndex
+
+
+def test_bisect_lookups():
+    index = DivisionIndex({"juz": [1, 10, 20], "quarter": [1, 3, 5, 7, 9, 12, 15, 18]}, {12: "obligatory"})
+    assert [index.juz_of(n) for n in (1, 9, 10, 25)] == [1, 1, 2, 3]
+    assert index.juz_of(0) is None
+    assert (index.quarter_of(8), index.hizb_of(8), index.hizb_of(9)) == (4, 1, 2)
+    assert (index.juz_start(2), index.juz_start(4)) == (10, None)
+    assert (index.hizb_start(2), index.hizb_start(2, quarter=3), index.hizb_start(3)) == (9, 15, None)
+    assert index.starts("hizb") == [1, 9] and index.count("hizb") == 2
+    assert index.sajda_type(12) == "obligatory" and index.sajda_type(11) is None
+    with pytest.raises(ValueError):
+        index.starts("manzil")
+
+
+def test_shipped_metadata(local_datasource):
+    # The JSON files and meta_data.xml carry the same juz, quarter and sajda lists
+    xml = read_metadata_xml(METADATA_FILE)
+    for kind, name in (("juz", "juz.json"), ("quarter", "hizb.json"), ("sajda", "sajda.json")):
+        assert read_metadata_json(os.path.join(CONFIG_DIR, name)) == xml[kind]
+
+    index = local_datasource.get_division_index()
+    numbering = local_datasource.get_aya_numbering()
+    assert {kind: index.count(kind) for kind in ("juz", "hizb", "quarter", "manzil")} == \
+        {"juz": 30, "hizb": 60, "quarter": 240, "manzil": 7}
+    assert index.juz_of(numbering.to_global(2, 141)) == 1
+    assert index.juz_of(numbering.to_global(2, 142)) == 2
+    assert numbering.from_global(index.hizb_start(2)) == (2, 75)
+    assert index.hizb_of(numbering.to_global(114, 6)) == 60
+
+    assert len(local_datasource.get_sajda_ayas()) == 15
+    assert local_datasource.get_sajda_ayas()[(96, 19)] == "obligatory"
+    assert local_datasource.get_first_page_for_division("juz", 1).id == 1
+    assert local_datasource.get_first_page_for_division("juz", 30).id == 582
+    assert local_datasource.get_first_page_for_division("juz", 31) is None
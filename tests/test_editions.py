@@ -0,0 +1,28 @@
+from data.migrations.query_plan import QueryRecorder, find_full_scans
+
+
+def test_page_with_editions_is_one_batched_query(writable_local):
+    local = writable_local()
+    page = local.get_page_info(50)
+    first, last = local.get_navigation_index().page_aya_range(50)
+    local.store_edition_text("en.a", [(n, f"a{n}") for n in range(first, last + 1)])
+    local.store_edition_text("en.b", [(n, f"b{n}") for n in range(first, last - 1)])
+    local.store_edition_text("en.c", [(last + 1, "next page")])
+
+    conn = local.db.connection()
+    with QueryRecorder(conn) as recorder:
+        rows = local.fetch_page_editions(page, ["en.a", "en.b", "en.c"])
+    edition_queries = [sql for sql in recorder.statements if "EditionAyas" in sql]
+    assert len(edition_queries) == 1
+    assert not find_full_scans(conn, edition_queries)
+
+    assert [row[:3] for row in rows] == local.fetch_page_text(page)
+    assert rows[0][3] == (f"a{first}", f"b{first}", None)
+    assert rows[-1][3] == (f"a{last}", None, None)
+
+
+def test_edition_list_and_empty_selection(writable_local):
+    local = writable_local()
+    assert local.get_edition_list() == []
+    page = local.get_page_info(1)
+    assert [row[3] for row in local.fetch_page_editions(page, [])] == [()] * page.ayas_count
@@ -0,0 +1,63 @@
+import sqlite3
+import threading
+
+import pytest
+
+
+def test_page_turns_reuse_one_connection(local_datasource):
+    # Same calls LoadQuranPageUseCase.execute makes per page turn
+    for page_id in range(1, 21):
+        page = local_datasource.get_page_info(page_id)
+        ayas = local_datasource.fetch_page_text(page)
+        sura_info = [local_datasource.get_sura_info(sid) for sid in page.sura_id_list]
+        assert ayas and all(sura_info)
+
+    stats = local_datasource.get_db_stats()
+    assert stats["connections_opened"] == 1
+    assert stats["queries_executed"] >= 40
+
+
+def test_connections_are_thread_confined_and_read_only(local_datasource):
+    local_datasource.get_aya_list(1)
+    worker_conn = []
+    thread = threading.Thread(target=lambda: worker_conn.append(local_datasource.db.connection()))
+    thread.start()
+    thread.join()
+
+    assert worker_conn[0] is not local_datasource.db.connection()
+    assert local_datasource.get_db_stats()["connections_opened"] == 2
+
+    with pytest.raises(sqlite3.OperationalError, match="readonly"):
+        local_datasource.db.execute("DELETE FROM Ayas")
+
+
+def test_close_releases_all_connections(local_datasource):
+    local_datasource.get_sura_info(1)
+    local_datasource.close()
+    assert local_datasource.get_db_stats()["connections_open"] == 0
+
+
+def test_sura_playlist_is_computed_then_cached(local_datasource):
+    local_datasource.get_sura_playlist(1, "muhammad_husary")  # warm up lookup tables
+    before = local_datasource.get_db_stats()["queries_executed"]
+
+    playlist = local_datasource.get_sura_playlist(2, "muhammad_husary")
+    assert len(playlist) == 286
+    assert playlist[0][:2] == (2, 1)
+    assert playlist[0][2].replace("\\", "/").endswith("data/audio/muhammad_husary/002001.mp3")
+    # Computed from the reciter's template: no per-aya (or any) query
+    assert local_datasource.get_db_stats()["queries_executed"] == before
+
+    assert local_datasource.get_sura_playlist(2, "muhammad_husary") == playlist
+    assert local_datasource.get_db_stats()["queries_executed"] == before
+    stats = local_datasource.get_playlist_cache_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+
+
+def test_playlist_ranges_and_unknown_reciter(local_datasource):
+    page_playlist = local_datasource.get_page_playlist(604, "muhammad_minshawy")
+    assert [(s, a) for s, a, _ in page_playlist][:2] == [(112, 1), (112, 2)]
+    assert len(page_playlist) == 15
+    span = local_datasource.get_audio_playlist_by_range(1, 6, 2, 2, "muhammad_husary")
+    assert [(s, a) for s, a, _ in span] == [(1, 6), (1, 7), (2, 1), (2, 2)]
+    assert local_datasource.get_sura_playlist(1, "x'; DROP TABLE Ayas; --") == []
@@ -0,0 +1,19 @@
+from data.datasources.lru_cache import LRUCache
+
+
+def test_evicts_by_count_and_byte_budget():
+    cache = LRUCache(max_entries=3, max_bytes=10, sizeof=len)
+    cache.put("a", "1234")
+    cache.put("b", "1234")
+    assert cache.get("a") == "1234"
+    cache.put("c", "1234")  # 12 bytes: "b" is the least recently used
+    assert ("a" in cache, "b" in cache, "c" in cache) == (True, False, True)
+    cache.put("a", "1")  # replacing an entry replaces its size
+    assert cache.bytes == 5
+    cache.put("big", "x" * 11)  # larger than the whole budget: not kept
+    assert "big" not in cache and len(cache) == 2
+
+    stats = cache.get_stats()
+    assert (stats["bytes"], stats["max_bytes"], stats["evictions"], stats["hit_ratio"]) == (5, 10, 1, 1.0)
+    cache.clear()
+    assert cache.bytes == 0
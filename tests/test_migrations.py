@@ -0,0 +1,80 @@
+import shutil
+import sqlite3
+
+from data.migrations.migration_runner import Migration, MigrationRunner
+from data.migrations.query_plan import QueryRecorder, find_full_scans
+from data.migrations.versions import MIGRATIONS
+from tests.conftest import SOURCE_DB
+
+
+def test_migrations_stamp_version_and_run_once(tmp_path):
+    db_file = str(tmp_path / "quran.db")
+    shutil.copyfile(SOURCE_DB, db_file)
+    runner = MigrationRunner(db_file)
+
+    assert runner.migrate() == MIGRATIONS[-1].version
+    # Second start-up is a no-op
+    calls = []
+    extra = Migration(runner.latest_version + 1, "probe", lambda conn: calls.append(1))
+    assert MigrationRunner(db_file, MIGRATIONS + [extra]).migrate() == extra.version
+    assert MigrationRunner(db_file, MIGRATIONS + [extra]).migrate() == extra.version
+    assert calls == [1]
+
+
+def test_failed_migration_rolls_back(tmp_path):
+    db_file = str(tmp_path / "quran.db")
+    shutil.copyfile(SOURCE_DB, db_file)
+
+    def broken(conn):
+        conn.execute("CREATE TABLE Half (x)")
+        raise sqlite3.OperationalError("boom")
+
+    try:
+        MigrationRunner(db_file, [Migration(1, "broken", broken)]).migrate()
+    except sqlite3.OperationalError:
+        pass
+    with sqlite3.connect(db_file) as conn:
+        assert MigrationRunner.get_version(conn) == 0
+        assert conn.execute("SELECT name FROM sqlite_master WHERE name='Half'").fetchone() is None
+
+
+def test_hot_queries_never_full_scan(local_datasource):
+    page = local_datasource.get_page_info(50)
+    local_datasource.get_sura_playlist(1, "muhammad_husary")  # one-off lookup tables
+    conn = local_datasource.db.connection()
+    with QueryRecorder(conn) as recorder:
+        local_datasource.get_aya_list(2)
+        local_datasource.get_quran_text(2)
+        local_datasource.get_quran_text(2, 255)
+        local_datasource.get_quran_text_range(2, 10, 5)
+        local_datasource.get_page_info(50)
+        local_datasource.fetch_page_text(page)
+        local_datasource.get_sura_info(2)
+        local_datasource.get_sura_playlist(2, "muhammad_husary")
+        local_datasource.get_page_playlist(50, "muhammad_husary")
+
+    assert len(recorder.statements) >= 6
+    assert find_full_scans(conn, recorder.statements) == []
+
+
+def test_audio_catalog_migration_preserves_every_url(tmp_path):
+    db_file = str(tmp_path / "quran.db")
+    shutil.copyfile(SOURCE_DB, db_file)
+    with sqlite3.connect(db_file) as conn:
+        conn.execute("UPDATE Audio_muhammad_husary SET audio_url = 'https://cdn.example/x.mp3' "
+                     "WHERE sura_id = 2 AND aya_id = 7")
+        original = conn.execute("SELECT sura_id, aya_id, audio_url FROM Audio_muhammad_husary "
+                                "ORDER BY sura_id, aya_id").fetchall()
+    MigrationRunner(db_file).migrate()
+
+    with sqlite3.connect(db_file) as conn:
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert not {"Audios", "Audio_muhammad_husary", "Audio_muhammad_minshawy"} & tables
+        template = conn.execute("SELECT url_template FROM ReciterAudio "
+                                "WHERE reciter_key = 'muhammad_husary'").fetchone()[0]
+        overrides = dict(((s, a), u) for s, a, u in conn.execute(
+            "SELECT sura_id, aya_id, audio_url FROM AudioOverrides WHERE reciter_key = 'muhammad_husary'"))
+
+    assert overrides == {(2, 7): "https://cdn.example/x.mp3"}
+    rebuilt = [(s, a, overrides.get((s, a)) or template.format(sura=s, aya=a)) for s, a, _ in original]
+    assert rebuilt == original
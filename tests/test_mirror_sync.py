@@ -0,0 +1,103 @@
+import json
+import os
+import shutil
+import sqlite3
+
+import pytest
+
+from data.datasources.http_client import AsyncHttpClient
+from data.datasources.quran_local_datasource import QuranLocalDataSource
+from data.datasources.quran_remote_datasource import QuranRemoteDataSource
+from data.migrations.migration_runner import MigrationRunner
+from data.sync.mirror_sync import MirrorSync, infer_audio_template
+from tests.alquran_stub import AUDIO_CDN, AlquranStubServer, synthesize_responses
+from tests.conftest import SOURCE_DB
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    path = str(tmp_path / "quran.db")
+    shutil.copyfile(SOURCE_DB, path)
+    MigrationRunner(path).migrate()
+    return path
+
+
+def run_sync(stub, db_file, checkpoint_dir, edition, kind="text"):
+    remote = QuranRemoteDataSource(base_url=stub.base_url, client=AsyncHttpClient(retries=0))
+    try:
+        return MirrorSync(db_file, remote, str(checkpoint_dir), workers=8).sync(edition, kind)
+    finally:
+        remote.close()
+
+
+def test_full_text_edition_import(db_file, tmp_path):
+    with AlquranStubServer(synthesize_responses(SOURCE_DB, ["quran-simple"])) as stub:
+        result = run_sync(stub, db_file, tmp_path / "sync", "quran-simple")
+        assert sum(stub.hits.values()) == 114
+
+    assert result.complete and (result.fetched_suras, result.rows_written) == (114, 6236)
+    assert result.seconds < 10
+    assert not os.listdir(tmp_path / "sync")
+    conn = sqlite3.connect(db_file)
+    try:
+        mismatches = conn.execute("""
+            SELECT COUNT(*) FROM Ayas a LEFT JOIN EditionAyas e
+            ON e.edition = 'quran-simple' AND e.aya_number = a.id
+            WHERE e.text IS NOT a.text
+        """).fetchone()[0]
+        assert mismatches == 0
+        assert conn.execute("SELECT format FROM Editions WHERE identifier = 'quran-simple'").fetchone() == ("text",)
+    finally:
+        conn.close()
+
+
+def test_interrupted_sync_resumes_with_missing_suras(db_file, tmp_path):
+    responses = synthesize_responses(SOURCE_DB, ["quran-simple"])
+    missing = {path: responses.pop(path) for path in ("/v1/surah/2/quran-simple", "/v1/surah/50/quran-simple")}
+
+    with AlquranStubServer(responses) as stub:
+        first = run_sync(stub, db_file, tmp_path, "quran-simple")
+        assert first.failed_suras == [2, 50] and first.fetched_suras == 112
+        assert os.path.exists(tmp_path / "quran-simple.text.json")
+
+        stub.responses.update(missing)
+        stub.hits.clear()
+        second = run_sync(stub, db_file, tmp_path, "quran-simple")
+        assert set(stub.hits) == set(missing)
+
+    assert second.complete and (second.fetched_suras, second.resumed_suras) == (2, 112)
+    conn = sqlite3.connect(db_file)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM EditionAyas").fetchone()[0] == 6236
+    finally:
+        conn.close()
+
+
+def test_audio_edition_becomes_a_reciter(db_file, tmp_path):
+    responses = synthesize_responses(SOURCE_DB, ["ar.test"])
+    payload = json.loads(responses["/v1/surah/1/ar.test"])
+    payload["data"]["ayahs"][0]["audio"] = "https://mirror.example/basmala.mp3"
+    responses["/v1/surah/1/ar.test"] = json.dumps(payload).encode("utf-8")
+
+    with AlquranStubServer(responses) as stub:
+        assert run_sync(stub, db_file, tmp_path, "ar.test", kind="audio").complete
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"database_name": db_file}), encoding="utf-8")
+    datasource = QuranLocalDataSource(str(config_path))
+    try:
+        assert "ar.test" in [reciter.key for reciter in datasource.get_reciter_list()]
+        playlist = datasource.get_audio_playlist_by_range(1, 1, 1, 2, "ar.test")
+        assert playlist == [(1, 1, "https://mirror.example/basmala.mp3"),
+                            (1, 2, f"{AUDIO_CDN}/ar.test/2.mp3")]
+        overrides = datasource.db.fetchall("SELECT COUNT(*) FROM AudioOverrides WHERE reciter_key = 'ar.test'")
+        assert overrides == [(1,)]
+    finally:
+        datasource.close()
+
+
+def test_infer_audio_template():
+    rows = [(1, 1, 1, "https://cdn/x/1.mp3"), (1, 2, 2, "https://cdn/x/2.mp3"),
+            (2, 5, 12, "https://other/2/002005.mp3")]
+    assert infer_audio_template(rows) == "https://cdn/x/{aya_number}.mp3"
+    assert infer_audio_template([(2, 5, 12, "a{b}/002005.mp3")]) == "a{{b}}/{sura:03d}{aya:03d}.mp3"
@@ -0,0 +1,39 @@
+import os
+
+from data.search.morphology_importer import normalize_root, parse_morphology
+
+SAMPLE = os.path.join(os.path.dirname(__file__), "fixtures", "morphology",
+                      "quranic-corpus-morphology-sample.txt")
+
+
+def test_parse_merges_segments_of_a_word():
+    with open(SAMPLE, encoding="utf-8") as f:
+        words = list(parse_morphology(f))
+    first = words[0]
+    assert (first.sura_id, first.aya_id, first.word_index, first.form) == (1, 1, 1, "bisomi")
+    assert (first.root, first.lemma) == ("سمو", "ٱسْم")
+    # Words without a root (particles, pronouns) are left out
+    assert [w.word_index for w in words if (w.sura_id, w.aya_id) == (2, 2)] == [2, 4, 6, 7]
+    assert normalize_root("ك ت ب") == normalize_root("كتب") == normalize_root("ktb") == "كتب"
+
+
+def test_root_search_finds_derived_words_with_positions(writable_local):
+    local = writable_local()
+    assert local.search_root("ktb") == []
+    result = local.import_morphology(SAMPLE)
+    # 2:79 word 30 and sura 115 do not exist
+    assert (result.words, result.skipped) == (12, 2)
+
+    occurrences = local.get_root_index().find_root("ك ت ب")
+    assert [(n, i) for n, i, _, _ in occurrences] == [(9, 2), (86, 3), (86, 4), (86, 19)]
+    assert {form for _, _, form, _ in occurrences} == {"الكتب", "يكتبون", "كتبت"}
+
+    results = local.search_root("كتب")
+    assert [(r.sura_id, r.aya_id, r.page_id) for r in results] == [(2, 2, 2), (2, 79, 12)]
+    assert results[1].word_indexes == [3, 4, 19]
+    words = local.get_quran_text(2, 79)[0][1].split()
+    assert results[1].snippet.startswith(f"{words[0]} {words[1]} [{words[2]}] [{words[3]}] ")
+
+    # Importing again replaces the index instead of adding to it
+    local.import_morphology(SAMPLE)
+    assert len(local.get_root_index().find_root("ktb")) == 4
@@ -0,0 +1,53 @@
+from data.migrations.query_plan import QueryRecorder
+from domain.use_cases.navigation_helper import find_first_sura_on_page, find_page_by_sura_id, find_page_for_aya
+
+
+def test_index_matches_pages_table(local_datasource):
+    index = local_datasource.get_navigation_index()
+    pages = local_datasource.get_page_list()
+
+    for sura_id in range(1, 115):
+        expected = next(p for p in pages if sura_id in p.sura_id_list)
+        assert find_page_by_sura_id(index, sura_id).id == expected.id
+
+    # Every aya resolves to the last page starting at or before it
+    starts = [index.page_aya_range(page.id)[0] for page in pages]
+    assert starts == sorted(starts)
+    for page, first in zip(pages, starts):
+        sura_id, aya_id, _ = local_datasource.fetch_page_text(page)[0]
+        assert index.to_global(sura_id, aya_id) == first
+        assert find_page_for_aya(index, sura_id, aya_id).id == page.id
+    assert index.page_for_global_aya(index.total_ayas).id == 604
+
+def test_index_edge_lookups(local_datasource):
+    index = local_datasource.get_navigation_index()
+    assert find_page_for_aya(index, 2, 286).id == 49
+    assert find_page_for_aya(index, 114, 6).id == 604
+    assert find_page_for_aya(index, 1, 8) is None
+    assert find_first_sura_on_page(index, 604).id == 112
+    assert index.sura_by_name("البقرة").id == 2
+    assert index.page(605) is None
+
+
+def test_navigation_lookups_issue_no_queries(local_datasource):
+    local_datasource.get_navigation_index()
+    with QueryRecorder(local_datasource.db.connection()) as recorder:
+        for sura_id in range(1, 115):
+            local_datasource.get_first_page_for_sura(sura_id)
+        for page_id in range(1, 605):
+            local_datasource.get_page_info(page_id)
+    assert recorder.statements == []
+
+
+def test_global_aya_numbers_round_trip(local_datasource):
+    numbering = local_datasource.get_aya_numbering()
+    assert numbering.sura_range(2) == (8, 293)
+    seen = [number for _, _, number in numbering.iter_ayas(1, 6236)]
+    assert seen == list(range(1, 6237))
+    for sura_id, aya_id, number in numbering.iter_ayas(280, 300):
+        assert numbering.from_global(number) == (sura_id, aya_id)
+        assert numbering.to_global(sura_id, aya_id) == number
+
+    page = local_datasource.get_page_info(604)
+    assert (page.start_aya, page.end_aya) == (6222, 6236)
+    assert page.contains_aya(numbering.to_global(114, 6))
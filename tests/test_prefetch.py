@@ -0,0 +1,80 @@
+import threading
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from domain.use_cases.load_quran_page_use_case import LoadQuranPageUseCase
+from domain.use_cases.prefetch_pages_use_case import PrefetchPagesUseCase
+from domain.use_cases.update_display_settings_use_case import UpdateDisplaySettingsUseCase
+
+
+def test_neighbours_are_rendered_ahead_of_the_reader(repository):
+    display_update_uc = UpdateDisplaySettingsUseCase(repository)
+    prefetcher = PrefetchPagesUseCase(LoadQuranPageUseCase(repository), display_update_uc, depth=2)
+    try:
+        assert prefetcher.plan(10, direction=1) == [11, 12, 9]
+        assert prefetcher.plan(10, direction=-1) == [9, 8, 11]
+        assert prefetcher.plan(1) == [2, 3]
+        assert prefetcher.plan(604, direction=1) == [603]
+
+        assert prefetcher.execute(10, direction=1) == [11, 12, 9]
+        prefetcher.wait()
+        assert [display_update_uc.is_page_fragment_cached(page) for page in (8, 9, 11, 12)] == \
+            [False, True, True, True]
+        assert repository.get_page_html_cache_stats()["hits"] == 0  # checks are not lookups
+
+        # Reading on: 11 and 12 are ready, so only 13 and 10 are new
+        assert display_update_uc.get_cached_page_fragment(11) is not None
+        assert prefetcher.execute(11, direction=1) == [13, 10]
+        prefetcher.wait()
+        assert prefetcher.get_stats()["rendered"] == 5
+
+        # Other marked words: nothing cached any more, so the window is queued again
+        display_update_uc.set_word_highlights({(2, 1): [1]})
+        assert prefetcher.execute(11, direction=1) == [12, 13, 10]
+    finally:
+        prefetcher.shutdown()
+
+
+def test_far_jump_cancels_queued_pages():
+    started, release = threading.Event(), threading.Event()
+    rendered = []
+
+    class SlowPages:
+        def get_page_info(self, page_id):
+            return page_id
+
+        def execute(self, page, editions=()):
+            started.set()
+            release.wait(5)
+            return [], []
+
+        def get_page_words(self, page):
+            return {}
+
+    class Display:
+        def is_page_fragment_cached(self, page_id, editions=()):
+            return False
+
+        def render_page_fragment(self, page_id, sura_info, ayas, page_words, editions=()):
+            rendered.append(page_id)
+            return f"page {page_id}"
+
+    prefetcher = PrefetchPagesUseCase(SlowPages(), Display(), depth=4, workers=1)
+    try:
+        assert prefetcher.execute(100, direction=1) == [101, 102, 103, 104, 99, 98]
+        assert started.wait(5)
+        # 101 is running on the only worker; the rest wait and are dropped by the jump
+        prefetcher.execute(300)
+        assert prefetcher.get_stats()["cancelled"] == 5
+        # A queued page is cancelled and left to the caller; a running one is waited for
+        assert prefetcher.take(301) is None
+        threading.Timer(0.05, release.set).start()
+        assert prefetcher.take(101) == "page 101"
+        prefetcher.wait()
+        assert rendered[0] == 101 and not set(rendered) & {102, 103, 104, 99, 98, 301}
+        assert sorted(rendered[1:]) == [296, 297, 298, 299, 302, 303, 304]
+    finally:
+        release.set()
+        prefetcher.shutdown()
@@ -0,0 +1,58 @@
+import pytest
+
+from data.datasources.quran_corpus import QuranCorpus
+
+
+def test_corpus_matches_sqlite_for_every_page(local_datasource):
+    corpus = QuranCorpus.from_connection_manager(local_datasource.db)
+    assert len(corpus) == 6236
+    for page in local_datasource.get_page_list():
+        assert corpus.fetch_page_text(page) == local_datasource.fetch_page_text(page)
+
+
+def test_corpus_text_queries_match_sqlite(local_datasource):
+    corpus = QuranCorpus.from_connection_manager(local_datasource.db)
+    for sura_id in (1, 2, 9, 114):
+        assert corpus.get_aya_list(sura_id) == local_datasource.get_aya_list(sura_id)
+        assert corpus.get_quran_text(sura_id) == local_datasource.get_quran_text(sura_id)
+        assert corpus.get_quran_text(sura_id, 3) == local_datasource.get_quran_text(sura_id, 3)
+        assert corpus.get_quran_text_range(sura_id, 5, 10) == local_datasource.get_quran_text_range(sura_id, 5, 10)
+    assert corpus.get_quran_text(1, 8) == []
+    assert corpus.get_aya_list(115) == []
+
+
+def test_binary_corpus_round_trip(local_datasource, tmp_path):
+    from data.datasources.binary_corpus import build_binary_corpus, open_binary_corpus
+
+    path = str(tmp_path / "corpus.bin")
+    build_binary_corpus(local_datasource.db, path)
+    mapped = open_binary_corpus(path)
+    try:
+        assert len(mapped) == 6236
+        assert mapped.get_quran_text(2, 255) == local_datasource.get_quran_text(2, 255)
+        for page in local_datasource.get_page_list()[::37]:
+            assert mapped.fetch_page_text(page) == local_datasource.fetch_page_text(page)
+    finally:
+        mapped.close()
+
+
+def test_broken_binary_corpus_is_rejected_and_rebuilt(local_datasource, writable_local, tmp_path):
+    from data.datasources.binary_corpus import build_binary_corpus, open_binary_corpus, write_binary_corpus
+
+    path = tmp_path / "corpus.bin"
+    build_binary_corpus(local_datasource.db, str(path))
+    data = path.read_bytes()
+    broken = {"empty": b"", "header": data[:10], "tables": data[:2000], "blob": data[:-1],
+              "magic": b"XXXX" + data[4:], "suras": data[:16] + b"\xff" * 8 + data[24:]}
+    for name, content in broken.items():
+        bad = tmp_path / f"{name}.bin"
+        bad.write_bytes(content)
+        with pytest.raises(ValueError):
+            open_binary_corpus(str(bad))
+
+    # The datasource rebuilds a broken file, and one built from another aya count
+    write_binary_corpus(str(tmp_path / "short.bin"), ["a", "b"], [(0, 2)])
+    for name in ("blob", "short"):
+        local = writable_local(text_backend="mmap", binary_corpus_path=str(tmp_path / f"{name}.bin"))
+        assert len(local.get_text_source()) == 6236
+        assert (tmp_path / f"{name}.bin").read_bytes() == data
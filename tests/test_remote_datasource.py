@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from data.datasources.http_client import AsyncHttpClient, HttpError
+from data.datasources.quran_remote_datasource import QuranRemoteDataSource
+from tests.alquran_stub import AlquranStubServer, load_recorded_responses
+
+
+@pytest.fixture
+def stub():
+    with AlquranStubServer(load_recorded_responses()) as server:
+        yield server
+
+
+def make_remote(stub, **client_options):
+    client_options.setdefault("backoff", 0.01)
+    return QuranRemoteDataSource(base_url=stub.base_url, client=AsyncHttpClient(**client_options))
+
+
+def test_sync_contract_against_recorded_responses(stub):
+    remote = make_remote(stub)
+    try:
+        suras = remote.get_sura_list()
+        assert len(suras) == 114 and suras[0].ename == "Al-Faatiha"
+        assert remote.get_aya_list(1) == list(range(1, 8))
+        assert [aya for aya, _ in remote.get_quran_text(114)] == list(range(1, 7))
+        assert remote.get_quran_text(2, 255)[0][0] == 255
+        assert remote.get_sura_playlist(112)[0] == (112, 1, "https://cdn.islamic.network/quran/audio/128/ar.alafasy/6222.mp3")
+        assert remote.get_reciters()[0] == "ar.alafasy"
+        assert remote.get_sura_info(2)["ayas"] == 286 and remote.get_sura_info(2)["start"] == 7
+        assert remote.get_quran_text(999) == []
+    finally:
+        remote.close()
+
+
+def test_text_range_downloads_only_the_range(stub):
+    remote = make_remote(stub)
+    try:
+        ayas = remote.get_quran_text_range(2, 255, 3)
+        assert [aya for aya, _ in ayas] == [255, 256, 257]
+        assert stub.hits == {"/v1/surah/2/ar.alafasy?offset=254&limit=3": 1}
+    finally:
+        remote.close()
+
+
+def test_concurrent_requests_for_one_sura_share_a_fetch(stub):
+    stub.delay = 0.05
+    remote = make_remote(stub)
+
+    async def fetch_many():
+        return await asyncio.gather(*(remote.fetch_sura(1) for _ in range(10)))
+
+    try:
+        results = asyncio.run(fetch_many())
+        assert all(result == results[0] for result in results)
+        assert stub.hits["/v1/surah/1/ar.alafasy"] == 1
+        assert remote.client.get_stats()["coalesced"] == 9
+    finally:
+        remote.close()
+
+
+def test_fetch_suras_is_parallel_bounded_and_pooled(stub):
+    stub.delay = 0.05
+    remote = make_remote(stub, max_per_host=2)
+    try:
+        suras = remote._run(remote.fetch_suras([114, 1, 113, 112]))
+        assert [sura["number"] for sura in suras] == [114, 1, 113, 112]
+        assert stub.max_active == 2
+
+        remote._run(remote.fetch_suras([1, 112]))
+        stats = remote.client.get_stats()
+        assert stats["requests_sent"] == 6
+        assert stats["connections_opened"] == 2 == stub.connections
+    finally:
+        remote.close()
+
+
+def test_transient_failures_are_retried(stub):
+    stub.fail_next = 2
+    remote = make_remote(stub)
+    try:
+        assert len(remote.get_quran_text(1)) == 7
+        assert remote.client.get_stats()["retries"] == 2
+    finally:
+        remote.close()
+
+
+def test_client_errors_are_not_retried(stub):
+    client = AsyncHttpClient(backoff=0.01)
+    try:
+        with pytest.raises(HttpError) as error:
+            asyncio.run(client.get(f"{stub.base_url}/surah/999/ar.alafasy"))
+        assert error.value.status == 404
+        assert client.get_stats()["retries"] == 0
+    finally:
+        client.close()
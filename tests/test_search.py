@@ -0,0 +1,77 @@
+import sqlite3
+
+from data.search.arabic_normalizer import ALEF, normalize_arabic, normalize_words
+from data.search.fts_search import FTS_TABLE, build_fts_index, to_fts_expression
+from data.search.search_query import Phrase, SearchQuery
+from data.search.snippet import make_snippet
+from tests.conftest import SOURCE_DB
+
+
+def test_normalization_folds_marks_and_spelling_variants():
+    assert normalize_arabic("بِسْمِ ٱللَّهِ ٱلرَّحْمَـٰنِ") == "بسم الله الرحمن"
+    assert normalize_arabic("ٱلْعَـٰلَمِينَ", ALEF) == "العالمين"
+    assert normalize_arabic("ٱلصَّلَوٰةَ", ALEF) == normalize_arabic("الصلاة") == "الصلاه"
+    assert normalize_arabic("أَإِنَّا يُؤْمِنُونَ عَلَىٰ") == normalize_arabic("اانا يومنون علي")
+    # Words made only of marks stay as empty words so they line up with the original text
+    assert normalize_words("ذَٰلِكَ ۛ فِيهِ") == ["ذلك", "", "فيه"]
+
+
+def test_query_syntax():
+    query = SearchQuery.parse('ٱلْحَمْدُ "رب العالمين" كتب* -"الرحمن الرحيم"')
+    assert query.required == [Phrase(("الحمد",)), Phrase(("رب", "العالمين")), Phrase(("كتب",), prefix=True)]
+    assert query.excluded == [Phrase(("الرحمن", "الرحيم"))]
+    assert to_fts_expression(query) == '("الحمد" AND "رب العالمين" AND "كتب" *) NOT "الرحمن الرحيم"'
+    assert not SearchQuery.parse("  ۛ -الله ")
+
+
+def test_search_results_and_snippets(local_datasource):
+    results = local_datasource.search("رب العالمين", limit=200)
+    words = local_datasource.get_quran_text(1, 2)[0][1].split()
+    assert tuple(results[0]) == (1, 2, 1, f"{words[0]} {words[1]} [{words[2]}] [{words[3]}]")
+    # Vocalized and plain queries, and both spellings of the superscript alef, find the same ayas
+    assert [r.aya_number for r in local_datasource.search("ٱلْعَـٰلَمِينَ")] == \
+        [r.aya_number for r in local_datasource.search("العلمين")] == \
+        [r.aya_number for r in local_datasource.search("العالمين")]
+    assert [r.score for r in results] == sorted(r.score for r in results)
+
+    page_of = local_datasource.get_navigation_index().page_for_global_aya
+    for result in local_datasource.search("الصلاة", limit=10):
+        assert page_of(result.aya_number).id == result.page_id
+        assert "[" in result.snippet
+
+    with_rahim = {r.aya_number for r in local_datasource.search("الرحمن", limit=500)}
+    without = {r.aya_number for r in local_datasource.search("الرحمن -الرحيم", limit=500)}
+    assert 3 in with_rahim and 3 not in without and without < with_rahim
+    assert local_datasource.search("") == [] and local_datasource.search("qwerty") == []
+
+
+def test_snippet_window():
+    text = " ".join(f"w{i}" for i in range(30))
+    assert make_snippet(text, SearchQuery.parse("w20"), window=6) == "… w18 w19 [w20] w21 w22 w23 …"
+    assert make_snippet(text, SearchQuery.parse("w0 w1"), window=3) == "[w0] [w1] w2 …"
+
+
+def test_index_rebuild_is_idempotent(tmp_path):
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE Ayas (id INTEGER PRIMARY KEY, text TEXT)")
+    source = sqlite3.connect(SOURCE_DB)
+    conn.executemany("INSERT INTO Ayas VALUES (?, ?)", source.execute("SELECT id, text FROM Ayas WHERE id <= 7"))
+    source.close()
+    assert build_fts_index(conn) and build_fts_index(conn)
+    assert conn.execute(f"SELECT COUNT(*) FROM {FTS_TABLE}").fetchone() == (7,)
+    assert conn.execute(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH 'الرحيم' ORDER BY rowid").fetchall() == \
+        [(1,), (3,)]
+
+
+
+def test_index_skipped_by_migration_is_built_on_first_search(writable_local):
+    local = writable_local()
+    # As migrated by an sqlite3 without FTS5: version 6 is stamped but there is no index
+    conn = sqlite3.connect(local.db_file)
+    conn.execute(f"DROP TABLE {FTS_TABLE}")
+    conn.commit()
+    conn.close()
+
+    assert local.get_search_backend().name == "fts5"
+    assert local.search("رب العالمين")[0].aya_number == 2
+    assert local.db.fetchone(f"SELECT COUNT(*) FROM {FTS_TABLE}") == (6236,)
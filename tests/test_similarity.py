@@ -0,0 +1,71 @@
+import pytest
+
+from data.datasources.quran_local_datasource import QuranLocalDataSource
+from data.search.arabic_normalizer import normalize_words
+from data.search.similarity_index import SimilarityIndex, jaccard, shingles
+from tests.conftest import write_quran_config
+
+
+@pytest.fixture(scope="module")
+def local(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp("similar")
+    datasource = QuranLocalDataSource(write_quran_config(tmp_path, similarity_index_path=str(tmp_path / "similar.bin")))
+    yield datasource
+    datasource.close()
+
+
+def test_repeated_and_near_identical_ayas(local):
+    # "فبأي آلاء ربكما تكذبان" recurs throughout Ar-Rahman
+    similar = local.get_similar_ayas(55, 13)
+    assert len(similar) == 10
+    assert all(s.sura_id == 55 and s.similarity == 100 for s in similar)
+    assert (similar[0].aya_id, similar[0].page_id) == (16, local.get_navigation_index().page_for_aya(55, 16).id)
+
+    # 2:5 and 31:5 differ in one letter only
+    similar = local.get_similar_ayas(2, 5)
+    assert (similar[0].sura_id, similar[0].aya_id) == (31, 5) and similar[0].similarity >= 80
+    assert local.get_similar_ayas(1, 99) == []
+
+
+def test_index_matches_exact_jaccard_and_round_trips(local, tmp_path):
+    index = local.get_similarity_index()
+    texts = dict(local.db.fetchall("SELECT id, text FROM Ayas"))
+    assert index.similar(9)
+    for aya_number, percent in index.similar(9):
+        exact = jaccard(shingles(normalize_words(texts[9])), shingles(normalize_words(texts[aya_number])))
+        assert percent == round(exact * 100) and exact >= 0.3
+
+    path = str(tmp_path / "copy.bin")
+    index.save(path)
+    loaded = SimilarityIndex.load(path)
+    assert [loaded.similar(n) for n in (1, 9, 4916)] == [index.similar(n) for n in (1, 9, 4916)]
+    with open(path, "r+b") as f:
+        f.truncate(100)
+    with pytest.raises(ValueError):
+        SimilarityIndex.load(path)
+
+
+def test_highlights_wait_for_the_index_instead_of_building_it():
+    pytest.importorskip("PyQt5")
+    from presentation.controllers.quran_viewer_controller import QuranViewerController
+    from presentation.events.quran_events import HighlightAyaEvent, SimilarityIndexReadyEvent
+    from presentation.states.quran_state import QuranState
+
+    class SimilarAyas:
+        ready = False
+
+        def is_ready(self):
+            return self.ready
+
+        def execute(self, sura_id, aya_id):
+            assert self.ready, "looked up before the index was ready"
+            return [(sura_id, aya_id)]
+
+    similar_uc, state = SimilarAyas(), QuranState()
+    controller = QuranViewerController(None, state, similar_uc=similar_uc)
+    controller.handle_event(HighlightAyaEvent(aya_id=13, sura_id=55))
+    assert state.similar_to is None
+
+    similar_uc.ready = True
+    controller.handle_event(SimilarityIndexReadyEvent())
+    assert (state.similar_to, state.similar_ayas) == ((55, 13), [(55, 13)])
@@ -0,0 +1,107 @@
+import pytest
+
+from data.datasources.http_client import AsyncHttpClient
+from data.datasources.quran_local_datasource import QuranLocalDataSource
+from data.datasources.quran_remote_datasource import QuranRemoteDataSource
+from data.datasources.tiered_quran_source import TieredQuranSource
+from tests.alquran_stub import AUDIO_CDN, AlquranStubServer, synthesize_responses
+from tests.conftest import SOURCE_DB, write_quran_config
+
+
+@pytest.fixture
+def stub():
+    responses = synthesize_responses(SOURCE_DB, ["en.test", "ar.test"], sura_ids=[1, 2, 112], page_ids=[1, 604])
+    with AlquranStubServer(responses) as server:
+        yield server
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    return write_quran_config(tmp_path)
+
+
+@pytest.fixture
+def open_tiers(stub, config_path):
+    """Factory for a fresh TieredQuranSource (empty memory tier) over the same database."""
+    opened = []
+
+    def open_tiers():
+        local = QuranLocalDataSource(config_path)
+        remote = QuranRemoteDataSource("ar.test", base_url=stub.base_url, client=AsyncHttpClient(retries=0))
+        opened.append((local, remote))
+        return TieredQuranSource(local, remote)
+
+    yield open_tiers
+    for local, remote in opened:
+        remote.close()
+        local.close()
+
+
+def test_local_edition_never_reaches_remote(stub, open_tiers):
+    tiers = open_tiers()
+    first = tiers.get_quran_text(2, 255)
+    assert tiers.get_quran_text(2, 255) == first and first[0][0] == 255
+    assert len(tiers.get_quran_text(1)) == 7
+    stats = tiers.get_tier_stats()
+    assert stats["memory"] == {"hits": 1, "misses": 2}
+    assert stats["local"] == {"hits": 2, "misses": 0}
+    assert stats["remote"] == {"hits": 0, "misses": 0}
+    assert not stub.hits
+
+
+def test_other_edition_is_fetched_once_and_written_back(stub, open_tiers):
+    tiers = open_tiers()
+    text = tiers.get_quran_text(1, edition="en.test")
+    assert [aya for aya, _ in text] == list(range(1, 8))
+    assert tiers.get_tier_stats()["remote"]["hits"] == 1
+
+    # The whole sura was stored, so later sessions and sub-ranges stop at the local tier.
+    tiers = open_tiers()
+    assert tiers.get_quran_text(1, edition="en.test") == text
+    assert tiers.get_quran_text_range(1, 3, 2, edition="en.test") == text[2:4]
+    assert tiers.get_tier_stats()["local"] == {"hits": 2, "misses": 0}
+    assert sum(stub.hits.values()) == 1
+
+    assert tiers.get_quran_text(3, edition="en.test") == []
+    assert tiers.get_tier_stats()["remote"] == {"hits": 0, "misses": 1}
+
+
+def test_page_text_of_other_edition(stub, open_tiers):
+    tiers = open_tiers()
+    local_page = tiers.local.get_page_info(604)
+    page = tiers.fetch_page_text(local_page, "en.test")
+    assert [(sura, aya) for sura, aya, _ in page] == [(sura, aya) for sura, aya, _ in tiers.fetch_page_text(local_page)]
+    assert open_tiers().fetch_page_text(local_page, "en.test") == page
+    assert list(stub.hits) == ["/v1/page/604/en.test"]
+
+
+def test_page_editions_fill_missing_editions_once(stub, open_tiers):
+    tiers = open_tiers()
+    page = tiers.local.get_page_info(604)
+    rows = tiers.fetch_page_editions(page, ["en.test", "quran-uthmani"])
+    assert all(texts[0] is not None for *_, texts in rows)
+    assert open_tiers().fetch_page_editions(page, ["en.test"]) == rows
+    assert list(stub.hits) == ["/v1/page/604/en.test"]
+
+
+def test_other_reciter_playlist_is_written_back(stub, open_tiers):
+    tiers = open_tiers()
+    playlist = tiers.get_sura_playlist(112, "ar.test")
+    assert playlist[0] == (112, 1, f"{AUDIO_CDN}/ar.test/6222.mp3") and len(playlist) == 4
+
+    tiers = open_tiers()
+    assert tiers.get_sura_playlist(112, "ar.test") == playlist
+    assert tiers.get_tier_stats()["local"]["hits"] == 1
+    assert sum(stub.hits.values()) == 1
+    # Local reciters are still answered locally.
+    assert tiers.get_sura_playlist(112, "muhammad_husary")[0][2].endswith("112001.mp3")
+
+
+def test_remote_navigation_matches_local_contract(stub, open_tiers):
+    tiers = open_tiers()
+    remote_page = tiers.remote.get_first_page_for_sura(112)
+    local_page = tiers.local.get_first_page_for_sura(112)
+    assert (remote_page.id, remote_page.start_aya, remote_page.ayas_count, remote_page.sura_id_list) == \
+        (local_page.id, local_page.start_aya, local_page.ayas_count, [int(s) for s in local_page.sura_id_list])
+    info = tiers.remote.get_sura_info(2)
+    assert {key: info[key] for key in ("id", "ayas", "start")} == {"id": 2, "ayas": 286, "start": 7}
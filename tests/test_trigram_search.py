@@ -0,0 +1,48 @@
+import pytest
+
+from data.search.search_query import SearchQuery
+from data.search.trigram_index import TrigramIndex, intersect_sorted, word_trigrams
+
+QUERIES = ["الله", "رب العالمين", '"رب العالمين"', "كتب*", "الصلاة -الزكاة", "ٱلصَّلَوٰةَ", "ق", "ي*"]
+
+
+@pytest.fixture
+def open_local(writable_local, tmp_path):
+    """Factory for datasources over one database copy, with the given search backend."""
+    index_path = str(tmp_path / "index" / "quran_search.tri")
+    return lambda backend: writable_local(search_backend=backend, search_index_path=index_path)
+
+
+def test_postings_helpers():
+    assert word_trigrams("كتب") == [" كت", "كتب", "تب "]
+    assert word_trigrams("كتب", prefix=True) == [" كت", "كتب"]
+    assert word_trigrams("و", prefix=True) == []
+    assert intersect_sorted([2, 5, 9, 40], list(range(0, 41, 5))) == [5, 40]
+    assert intersect_sorted([], [1, 2]) == []
+
+
+def test_trigram_backend_matches_fts(open_local):
+    fts, trigram = open_local("fts5"), open_local("trigram")
+    assert fts.get_search_backend().name == "fts5" and trigram.get_search_backend().name == "trigram"
+    for query in QUERIES:
+        expected = fts.search(query, limit=10000)
+        found = trigram.search(query, limit=10000)
+        assert expected, query
+        assert {r.aya_number for r in found} == {r.aya_number for r in expected}, query
+        snippets = {r.aya_number: r.snippet for r in expected}
+        assert all(snippets[r.aya_number] == r.snippet for r in found), query
+        assert found[0].aya_number in {r.aya_number for r in expected[:10]}, query
+
+
+def test_index_file_roundtrip_and_rebuild(open_local, tmp_path):
+    local = open_local("trigram")
+    local.search("الله")
+    path = tmp_path / "index" / "quran_search.tri"
+    index = TrigramIndex.load(str(path))
+    assert index.get_stats() == local.get_search_backend().get_index().get_stats()
+    assert index.search(SearchQuery.parse("الرحمن الرحيم"), 3)[0][0] == 3
+
+    path.write_bytes(path.read_bytes()[:1000])
+    again = open_local("trigram")
+    assert [r.aya_number for r in again.search("الرحمن الرحيم", 3)][0] == 3
+    assert TrigramIndex.load(str(path)).get_stats()["ayas"] == 6236
@@ -0,0 +1,24 @@
+from data.search.arabic_normalizer import normalize_arabic
+from data.search.word_table import tokenize_aya
+
+
+def test_tokenize_skips_marks_and_keeps_offsets():
+    text = "ذَٰلِكَ ٱلْكِتَـٰبُ لَا رَيْبَ ۛ فِيهِ"
+    words = tokenize_aya(text)
+    assert [(i, position) for i, position, *_ in words] == [(1, 0), (2, 1), (3, 2), (4, 3), (5, 5)]
+    assert all(text[start:end] == text.split()[position] for _, position, start, end, _ in words)
+    assert words[1][4] == normalize_arabic("ٱلْكِتَـٰبُ") == "الكتب"
+
+
+def test_word_table_covers_every_aya(local_datasource):
+    assert local_datasource.db.fetchone("SELECT COUNT(*) FROM Words")[0] == 77433
+    assert local_datasource.db.fetchone("SELECT COUNT(DISTINCT aya_number) FROM Words")[0] == 6236
+
+    page = local_datasource.get_page_info(2)
+    words = local_datasource.fetch_page_words(page)
+    texts = {(sura_id, aya_id): text for sura_id, aya_id, text in local_datasource.fetch_page_text(page)}
+    assert words.keys() == texts.keys()
+    for key, offsets in words.items():
+        assert [texts[key][start:end] for _, start, end in offsets] == \
+            [word for word in texts[key].split() if normalize_arabic(word)]
+    assert [i for i, _, _ in words[(2, 2)]] == list(range(1, 8))